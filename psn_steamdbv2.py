@@ -1,16 +1,29 @@
 # Updated psn_steamdbv2.py with release date scraping
+import asyncio
 import json
+import gzip
+import io
 import time
 import logging
 import re
 import requests
+from requests.adapters import HTTPAdapter
 import sys
 import random
 import os
-from typing import Dict, List, Optional, Tuple, Any
+import math
+import sqlite3
+import threading
+import queue
+import bisect
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Any
 from datetime import datetime
 from urllib.parse import urljoin, quote, urlparse
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from bs4 import BeautifulSoup
 import urllib3
 import cloudscraper
@@ -69,6 +82,25 @@ except ImportError as e:
     logger.warning("Install with: pip install webdriver-manager")
     HAS_WEBDRIVER_MANAGER = False
 
+# Optional: only needed for zstd-compressed JSONL output
+HAS_ZSTD = False
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+# Optional: only needed for AsyncPSNScraper (h2 enables HTTP/2)
+HAS_HTTPX = False
+HAS_H2 = False
+try:
+    import httpx
+    HAS_HTTPX = True
+    import h2  # noqa: F401
+    HAS_H2 = True
+except ImportError:
+    pass
+
 
 # ===========================================
 # RELEASE DATE EXTRACTION FUNCTION
@@ -161,6 +193,450 @@ def extract_release_date_from_psn_page(html_content):
         return None
 
 
+# ===========================================
+# EMBEDDED JSON (__NEXT_DATA__) EXTRACTION
+# ===========================================
+
+def extract_next_data(page) -> Optional[Dict]:
+    """
+    Extract the Next.js JSON payload embedded in a PSN page without building a DOM.
+    
+    Scans the raw page for the __NEXT_DATA__ script (or, failing that, the script
+    holding "search:results") and decodes only that slice with json.loads.
+    
+    Args:
+        page: Page body as bytes (preferred - skips charset decoding) or str
+    
+    Returns:
+        Parsed JSON dictionary or None if no embedded data was found
+    """
+    if isinstance(page, str):
+        marker, results_marker, props, script_open, script_close, tag_end = (
+            'id="__NEXT_DATA__"', '"search:results"', '{"props"', '<script', '</script>', '>'
+        )
+    else:
+        marker, results_marker, props, script_open, script_close, tag_end = (
+            b'id="__NEXT_DATA__"', b'"search:results"', b'{"props"', b'<script', b'</script>', b'>'
+        )
+    
+    start = -1
+    pos = page.find(marker)
+    if pos != -1:
+        start = page.find(tag_end, pos) + 1
+    else:
+        pos = page.find(results_marker)
+        if pos != -1:
+            script_start = page.rfind(script_open, 0, pos)
+            if script_start != -1:
+                start = page.find(props, script_start, pos)
+    
+    if start <= 0:
+        return None
+    
+    end = page.find(script_close, start)
+    if end == -1:
+        end = len(page)
+    
+    try:
+        return json.loads(page[start:end])
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        logger.warning(f"Embedded JSON parse error: {e}")
+        return None
+
+
+# ===========================================
+# HTTP RESPONSE CACHE
+# ===========================================
+
+class CachedResponse:
+    """Minimal stand-in for requests.Response when served from ResponseCache"""
+
+    def __init__(self, url: str, status_code: int, content: bytes, encoding: Optional[str] = None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.encoding = encoding or 'utf-8'
+        self.from_cache = True
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors='replace')
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+
+class ResponseCache:
+    """
+    Disk-backed (SQLite) cache for PSN store responses.
+
+    Entries are keyed by (region, url) and expire according to the TTL of
+    their kind: 'search' pages, 'product' pages or 'image' downloads.
+    """
+
+    DEFAULT_TTLS = {
+        'search': 60 * 60,            # 1 hour - search listings change with sales
+        'product': 24 * 60 * 60,      # 1 day
+        'image': 7 * 24 * 60 * 60,    # 1 week
+    }
+
+    def __init__(self, path: str = 'psn_response_cache.sqlite3', ttls: Dict[str, int] = None):
+        """
+        Args:
+            path: SQLite database file
+            ttls: Optional per-kind TTL overrides in seconds
+        """
+        self.path = path
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                region TEXT NOT NULL,
+                url TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                status_code INTEGER NOT NULL,
+                encoding TEXT,
+                content BLOB NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (region, url)
+            )"""
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def classify_url(url: str) -> str:
+        """Return the TTL class ('search', 'product' or 'image') for a URL"""
+        parsed = urlparse(url)
+        if parsed.netloc.startswith('image.') or re.search(r'\.(png|jpe?g|webp|gif)$', parsed.path, re.I):
+            return 'image'
+        if '/search/' in parsed.path:
+            return 'search'
+        return 'product'
+
+    def get(self, url: str, region: str) -> Optional[CachedResponse]:
+        """Return a fresh cached response or None (counted as hit/miss)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT kind, status_code, encoding, content, fetched_at FROM responses WHERE region = ? AND url = ?",
+                (region, url)
+            ).fetchone()
+            if row:
+                kind, status_code, encoding, content, fetched_at = row
+                if time.time() - fetched_at <= self.ttls.get(kind, 0):
+                    self.hits += 1
+                    return CachedResponse(url, status_code, content, encoding)
+            self.misses += 1
+            return None
+
+    def put(self, url: str, region: str, response, kind: str = None):
+        """Store a successful response"""
+        kind = kind or self.classify_url(url)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (region, url, kind, response.status_code, response.encoding,
+                 response.content, time.time())
+            )
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete entries older than their TTL, returns number of rows removed"""
+        removed = 0
+        now = time.time()
+        with self._lock:
+            for kind, ttl in self.ttls.items():
+                cur = self._conn.execute(
+                    "DELETE FROM responses WHERE kind = ? AND fetched_at < ?", (kind, now - ttl)
+                )
+                removed += cur.rowcount
+            self._conn.commit()
+        return removed
+
+    def clear(self):
+        """Drop all cached responses and reset counters"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and per-kind entry counts"""
+        with self._lock:
+            rows = self._conn.execute("SELECT kind, COUNT(*) FROM responses GROUP BY kind").fetchall()
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': (self.hits / total) if total else 0.0,
+            'entries': dict(rows),
+        }
+
+
+_shared_response_caches: Dict[str, ResponseCache] = {}
+
+
+def get_response_cache(path: str = 'psn_response_cache.sqlite3') -> ResponseCache:
+    """
+    Return a process-wide ResponseCache for path (shared across scraper instances).
+    
+    Expired entries are purged when the cache is first opened, so the file does
+    not keep growing with pages and images that can no longer be served.
+    """
+    if path not in _shared_response_caches:
+        cache = ResponseCache(path)
+        removed = cache.purge_expired()
+        if removed:
+            logger.info(f"Purged {removed} expired entries from {path}")
+        _shared_response_caches[path] = cache
+    return _shared_response_caches[path]
+
+
+# ===========================================
+# RATE LIMITING & BOUNDED WORKER STAGE
+# ===========================================
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, up to `capacity` banked"""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self) -> float:
+        """Consume a token if one is available (returns 0), else return the seconds to wait"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Like acquire(), but waits without blocking the event loop"""
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+
+class HostRateLimiter:
+    """Per-host token buckets; hosts without a configured rate are not limited"""
+
+    # Requests per second. 1/s matches the old fixed `time.sleep(1)` between PSN product pages.
+    DEFAULT_RATES = {
+        'store.playstation.com': 1.0,
+    }
+
+    def __init__(self, rates: Dict[str, float] = None, burst: float = 1.0):
+        self._buckets = {
+            host: TokenBucket(rate, burst)
+            for host, rate in (self.DEFAULT_RATES if rates is None else rates).items()
+        }
+
+    def acquire(self, url: str):
+        """Wait for a slot on the host of url"""
+        bucket = self._buckets.get(urlparse(url).netloc)
+        if bucket:
+            bucket.acquire()
+
+    async def acquire_async(self, url: str):
+        """Wait for a slot on the host of url without blocking the event loop"""
+        bucket = self._buckets.get(urlparse(url).netloc)
+        if bucket:
+            await bucket.acquire_async()
+
+
+_shared_rate_limiter: Optional[HostRateLimiter] = None
+
+
+def get_host_rate_limiter() -> HostRateLimiter:
+    """Return the process-wide HostRateLimiter (shared by all scrapers)"""
+    global _shared_rate_limiter
+    if _shared_rate_limiter is None:
+        _shared_rate_limiter = HostRateLimiter()
+    return _shared_rate_limiter
+
+
+class HostConcurrencyLimiter:
+    """
+    Caps how many workers may talk to the same host at once.
+
+    Use as `with limiter.slot(url): ...`; hosts without an explicit cap use
+    default_cap.
+    """
+
+    def __init__(self, caps: Dict[str, int] = None, default_cap: int = 2):
+        self.caps = caps or {}
+        self.default_cap = default_cap
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.caps.get(host, self.default_cap))
+            return self._semaphores[host]
+
+    @contextmanager
+    def slot(self, url: str):
+        """Hold one of the host's concurrency slots for the duration of the block"""
+        semaphore = self._semaphore(urlparse(url).netloc)
+        semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+
+def run_bounded_stage(items: List[Any], worker: Callable[[Any], Any], max_workers: int = 4) -> List[Any]:
+    """
+    Run worker(item) for every item on a bounded thread pool.
+    
+    Args:
+        items: Work items
+        worker: Callable applied to each item
+        max_workers: Concurrency cap
+    
+    Returns:
+        Worker results in the same order as items (None where the worker raised)
+    """
+    def _safe(item):
+        try:
+            return worker(item)
+        except Exception as e:
+            logger.error(f"Worker failed: {e}")
+            return None
+    
+    if not items:
+        return []
+    if max_workers <= 1 or len(items) == 1:
+        return [_safe(item) for item in items]
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(_safe, items))
+
+
+# ===========================================
+# APOLLO STATE INDEX
+# ===========================================
+
+_SKU_PATTERN = re.compile(r'"sku[Ii]d?":\s*"([^"]+)"')
+_UNSET = object()
+
+
+class ApolloStateIndex:
+    """
+    One-pass index over a PSN page's Apollo state.
+
+    Built once per page so SKU lookups in _parse_product_from_json are O(1)
+    instead of rescanning (and re-serialising) the whole state per product.
+    """
+
+    def __init__(self, apollo_state: Dict):
+        self.state = apollo_state
+        self.skus_by_product: Dict[str, List[str]] = {}   # Product:<id>.skus refs
+        self.sku_by_prefix: Dict[str, str] = {}           # dash-delimited SKU id prefix -> first SKU id
+        self.sku_ids: List[str] = []                      # all Sku:<id> keys in state order
+        self.by_typename: Dict[str, List[Dict]] = {}
+        self._pattern_sku = _UNSET
+
+        for key, value in apollo_state.items():
+            if not isinstance(value, dict):
+                continue
+
+            typename = value.get('__typename')
+            if typename:
+                self.by_typename.setdefault(typename, []).append(value)
+
+            if key.startswith('Sku:'):
+                sku_id = key[4:]
+                self.sku_ids.append(sku_id)
+                parts = sku_id.split('-')
+                for i in range(1, len(parts) + 1):
+                    self.sku_by_prefix.setdefault('-'.join(parts[:i]), sku_id)
+
+            elif key.startswith('Product:') and isinstance(value.get('skus'), list):
+                refs = [
+                    ref['__ref'][4:] for ref in value['skus']
+                    if isinstance(ref, dict) and str(ref.get('__ref', '')).startswith('Sku:')
+                ]
+                if refs:
+                    self.skus_by_product[key[8:]] = refs
+
+    def products(self) -> List[Dict]:
+        """All entries with __typename 'Product'"""
+        return self.by_typename.get('Product', [])
+
+    def total_count(self) -> Optional[int]:
+        """Total number of search hits (pageInfo.totalCount) if the page reports it"""
+        def _find(obj, depth):
+            if not isinstance(obj, dict):
+                return None
+            if isinstance(obj.get('totalCount'), int):
+                return obj['totalCount']
+            if depth == 0:
+                return None
+            for value in obj.values():
+                found = _find(value, depth - 1)
+                if found is not None:
+                    return found
+            return None
+        
+        keys = ['ROOT_QUERY'] + [
+            k for k in self.state
+            if k != 'ROOT_QUERY' and not k.startswith(('Product:', 'Sku:', 'Media:'))
+        ]
+        for key in keys:
+            found = _find(self.state.get(key), 3)
+            if found is not None:
+                return found
+        return None
+
+    def sku_for_product(self, product_id: str) -> Optional[str]:
+        """
+        Resolve the SKU ID for a product using the same precedence as
+        PSNScraper._extract_sku_id: SKU key containing the product ID,
+        then the product's own skus refs, then the first skuId in the state.
+        """
+        sku_id = self.sku_by_prefix.get(product_id)
+        if sku_id is None:
+            # Containment that is not dash-aligned; rare, so a scan of SKU keys only
+            sku_id = next((s for s in self.sku_ids if product_id in s), None)
+        if sku_id:
+            return sku_id
+
+        refs = self.skus_by_product.get(product_id)
+        if refs:
+            return refs[0]
+
+        if self._pattern_sku is _UNSET:
+            # Same value for every product on the page, so compute it once
+            match = _SKU_PATTERN.search(json.dumps(self.state))
+            self._pattern_sku = match.group(1) if match else None
+        return self._pattern_sku
+
+
 @dataclass
 class PSNGame:
     """Data class for PSN game information"""
@@ -207,172 +683,921 @@ class PSNGame:
         }
 
 
-class PSNScraper:
-    """PSN Store Scraper with Cloudflare bypass"""
-    
-    def __init__(self, region: str = 'fi-fi', platform_filter: str = None):
+# ===========================================
+# PSN PRODUCT CATALOG
+# ===========================================
+
+def _product_id_from_url(url: str) -> Optional[str]:
+    """Return the product id from a PSN /product/<id> URL"""
+    match = re.search(r'/product/([^/?#]+)', url or '')
+    return match.group(1) if match else None
+
+
+class ProductCatalog:
+    """
+    Local SQLite catalog of every PSN product the scraper has parsed.
+
+    Products are upserted keyed by (product_id, region). Search result lists
+    are recorded per (region, query, platform filter) so a repeated search can
+    be answered from the catalog without touching the store while fresh.
+    """
+
+    DEFAULT_MAX_AGE = {
+        'search': 6 * 60 * 60,        # 6 hours
+        'product': 24 * 60 * 60,      # 1 day - prices follow sales
+        'details': 7 * 24 * 60 * 60,  # 1 week - product page details
+    }
+
+    _PRODUCT_COLUMNS = ('product_id', 'region', 'name', 'url', 'sku_id', 'game_type',
+                        'classification', 'platforms', 'price', 'original_price',
+                        'discount_percent', 'image_url', 'release_date', 'updated_at')
+
+    def __init__(self, path: str = 'psn_catalog.sqlite3', max_age: Dict[str, int] = None):
         """
-        Initialize PSN scraper with Cloudflare bypass
-        
         Args:
-            region: PSN region (e.g., 'fi-fi', 'en-us', 'en-gb')
-            platform_filter: Filter by platform ('ps4', 'ps5', 'both', or None for all)
+            path: SQLite database file
+            max_age: Optional per-kind freshness overrides in seconds
         """
-        self.region = region
-        self.platform_filter = platform_filter.lower() if platform_filter else None
-        self.base_url = f'https://store.playstation.com/{region}'
-        
-        # Use cloudscraper to bypass Cloudflare
-        self.scraper = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'mobile': False
-            },
-            delay=10,
-            interpreter='nodejs'
+        self.path = path
+        self.max_age = dict(self.DEFAULT_MAX_AGE)
+        if max_age:
+            self.max_age.update(max_age)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            """CREATE TABLE IF NOT EXISTS products (
+                product_id TEXT NOT NULL,
+                region TEXT NOT NULL,
+                name TEXT NOT NULL,
+                url TEXT,
+                sku_id TEXT,
+                game_type TEXT,
+                classification TEXT,
+                platforms TEXT,
+                price TEXT,
+                original_price TEXT,
+                discount_percent TEXT,
+                image_url TEXT,
+                release_date TEXT,
+                updated_at REAL NOT NULL,
+                details TEXT,
+                details_at REAL,
+                PRIMARY KEY (product_id, region)
+            );
+            CREATE TABLE IF NOT EXISTS searches (
+                region TEXT NOT NULL,
+                query TEXT NOT NULL,
+                platform_filter TEXT NOT NULL,
+                pages TEXT NOT NULL,
+                complete INTEGER NOT NULL,
+                searched_at REAL NOT NULL,
+                PRIMARY KEY (region, query, platform_filter)
+            );"""
         )
-        
-        # Update headers
-        self.scraper.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-            'Accept-Language': 'fi-FI,fi;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br, zstd',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'same-origin',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0',
-        })
-        
-        logger.info(f"Initialized PSNScraper for region: {region}, platform filter: {self.platform_filter}")
+        self._conn.commit()
 
-    def update_with_cf_clearance(self, cf_clearance_value):
+    @staticmethod
+    def _search_key(query: str, platform_filter: Optional[str]) -> Tuple[str, str]:
+        return ' '.join(query.lower().split()), platform_filter or ''
+
+    def upsert(self, games: List['PSNGame'], region: str):
         """
-        Update the scraper session with cf_clearance cookie
-        
-        Args:
-            cf_clearance_value: The cf_clearance cookie value
-        
-        Returns:
-            bool: True if successful
+        Insert or update products. Fields missing from the new data (release
+        date, SKU) keep their previously known value.
         """
-        try:
-            # Update headers with cookie
-            cookie_header = f"cf_clearance={cf_clearance_value}"
-            
-            # Add to existing cookies if any
-            if 'Cookie' in self.scraper.headers:
-                existing_cookies = self.scraper.headers['Cookie']
-                if 'cf_clearance' not in existing_cookies:
-                    self.scraper.headers['Cookie'] = f"{existing_cookies}; {cookie_header}"
-            else:
-                self.scraper.headers['Cookie'] = cookie_header
-            
-            logger.info("Added cf_clearance cookie to requests session")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error adding cf_clearance cookie: {e}")
-            return False
+        now = time.time()
+        rows = []
+        for game in games:
+            if not game.title_id:
+                continue
+            release_date = game.release_date if game.release_date != 'N/A' else None
+            rows.append((game.title_id, region, game.name, game.url, game.sku_id, game.game_type,
+                         game.store_display_classification, json.dumps(game.platform_tags or []),
+                         game.price, game.original_price, game.discount_percent, game.image_url,
+                         release_date, now))
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                f"""INSERT INTO products ({', '.join(self._PRODUCT_COLUMNS)})
+                VALUES ({', '.join('?' * len(self._PRODUCT_COLUMNS))})
+                ON CONFLICT (product_id, region) DO UPDATE SET
+                    name = excluded.name, url = excluded.url,
+                    sku_id = COALESCE(excluded.sku_id, products.sku_id),
+                    game_type = excluded.game_type, classification = excluded.classification,
+                    platforms = excluded.platforms, price = excluded.price,
+                    original_price = excluded.original_price, discount_percent = excluded.discount_percent,
+                    image_url = COALESCE(excluded.image_url, products.image_url),
+                    release_date = COALESCE(excluded.release_date, products.release_date),
+                    updated_at = excluded.updated_at""",
+                rows
+            )
+            self._conn.commit()
 
-    def get_game_release_date(self, url: str, game_name: str = None) -> Optional[str]:
+    def _row_to_game(self, row) -> 'PSNGame':
+        data = dict(zip(self._PRODUCT_COLUMNS, row))
+        return PSNGame(
+            title_id=data['product_id'],
+            name=data['name'],
+            url=data['url'],
+            price=data['price'],
+            original_price=data['original_price'],
+            discount_percent=data['discount_percent'],
+            platform_tags=json.loads(data['platforms'] or '[]'),
+            image_url=data['image_url'],
+            release_date=data['release_date'],
+            game_type=data['game_type'],
+            store_display_classification=data['classification'],
+            sku_id=data['sku_id']
+        )
+
+    def get_products(self, product_ids: List[str], region: str, max_age: int = None) -> Dict[str, 'PSNGame']:
+        """Return {product_id: PSNGame} for known products updated within max_age (None = any age)"""
+        if not product_ids:
+            return {}
+        cutoff = time.time() - max_age if max_age is not None else 0
+        found = {}
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            for i in range(0, len(product_ids), 500):
+                chunk = product_ids[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT {', '.join(self._PRODUCT_COLUMNS)} FROM products "
+                    f"WHERE region = ? AND updated_at >= ? AND product_id IN ({', '.join('?' * len(chunk))})",
+                    (region, cutoff, *chunk)
+                ).fetchall()
+                for row in rows:
+                    found[row[0]] = self._row_to_game(row)
+        return found
+
+    def set_release_date(self, product_id: str, region: str, release_date: str):
+        """Record a release date fetched from a product page"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE products SET release_date = ? WHERE product_id = ? AND region = ?",
+                (release_date, product_id, region)
+            )
+            self._conn.commit()
+
+    def get_details(self, product_id: str, region: str) -> Optional[Dict]:
+        """Return fresh product page details or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT details, details_at FROM products WHERE product_id = ? AND region = ?",
+                (product_id, region)
+            ).fetchone()
+        if row and row[0] and time.time() - row[1] <= self.max_age['details']:
+            return json.loads(row[0])
+        return None
+
+    def set_details(self, product_id: str, region: str, details: Dict):
+        """Store product page details (and its release date) for a known product"""
+        with self._lock:
+            self._conn.execute(
+                """UPDATE products SET details = ?, details_at = ?,
+                release_date = COALESCE(?, release_date) WHERE product_id = ? AND region = ?""",
+                (json.dumps(details, ensure_ascii=False), time.time(), details.get('release_date'),
+                 product_id, region)
+            )
+            self._conn.commit()
+
+    def record_search(self, region: str, query: str, platform_filter: Optional[str],
+                      pages: List[List[str]], complete: bool, keep_searched_at: bool = False):
         """
-        Get release date for a specific game by URL.
+        Remember which products a search returned, page by page.
         
         Args:
-            url: The PSN game page URL
-            game_name: Optional game name for logging
-        
-        Returns:
-            Release date string or None if not found
+            pages: Product ids per result page (after platform filtering)
+            complete: True if pagination reached the last page
+            keep_searched_at: Keep the stored search time (the leading pages were
+                replayed from the catalog, not fetched again)
         """
-        try:
-            logger.info(f"Fetching release date for: {game_name or 'Unknown game'}")
-            
-            # Make the request
-            response = self.scraper.get(url, timeout=30)
-            
-            if response.status_code != 200:
-                logger.warning(f"Failed to fetch game page {url}: {response.status_code}")
-                return None
-            
-            # Extract release date
-            release_date = extract_release_date_from_psn_page(response.text)
-            
-            if release_date and game_name:
-                logger.info(f"Found release date for '{game_name}': {release_date}")
-            elif not release_date and game_name:
-                logger.debug(f"No release date found for '{game_name}'")
-            
-            return release_date
-            
-        except Exception as e:
-            logger.error(f"Error getting release date for {url}: {e}")
-            return None
+        query_key, filter_key = self._search_key(query, platform_filter)
+        with self._lock:
+            self._conn.execute(
+                f"""INSERT INTO searches VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (region, query, platform_filter) DO UPDATE SET
+                pages = excluded.pages, complete = excluded.complete
+                {'' if keep_searched_at else ', searched_at = excluded.searched_at'}""",
+                (region, query_key, filter_key, json.dumps(pages), int(complete), time.time())
+            )
+            self._conn.commit()
 
-    def search_games_with_release_dates(self, query: str, max_results: int = 20) -> List[PSNGame]:
+    def search_pages(self, region: str, query: str, platform_filter: Optional[str]) -> Optional[Tuple[List[List['PSNGame']], bool]]:
         """
-        Search for games and fetch their release dates.
-        
-        Args:
-            query: Search query
-            max_results: Maximum number of results to return
+        Answer a search from the catalog.
         
         Returns:
-            List of PSNGame objects with release_date attribute
+            (pages of PSNGame objects, complete) if the search was recorded within
+            max_age and all of its products are still fresh, otherwise None
         """
-        # First search for games
-        games = self.search_games_with_pagination(query, max_results)
-        
-        if not games:
-            return games
+        query_key, filter_key = self._search_key(query, platform_filter)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT pages, complete, searched_at FROM searches WHERE region = ? AND query = ? AND platform_filter = ?",
+                (region, query_key, filter_key)
+            ).fetchone()
+        if not row or time.time() - row[2] > self.max_age['search']:
+            self.misses += 1
+            return None
         
-        logger.info(f"Fetching release dates for {len(games)} games...")
+        page_ids = json.loads(row[0])
+        products = self.get_products([pid for page in page_ids for pid in page], region, self.max_age['product'])
+        if any(pid not in products for page in page_ids for pid in page):
+            self.misses += 1
+            return None
         
-        # Fetch release dates for each game
-        for i, game in enumerate(games):
-            try:
-                # Check if we already have a release date from the search
-                if not game.release_date or game.release_date == 'N/A':
-                    # Fetch release date from game page
-                    release_date = self.get_game_release_date(game.url, game.name)
-                    if release_date:
-                        game.release_date = release_date
-                    
-                    # Add small delay to avoid rate limiting
-                    if i < len(games) - 1:
-                        time.sleep(1)  # 1 second delay between requests
-                        
-            except Exception as e:
-                logger.error(f"Error getting release date for {game.name}: {e}")
+        self.hits += 1
+        return [[products[pid] for pid in page] for page in page_ids], bool(row[1])
+
+    def has_search(self, region: str, query: str, platform_filter: Optional[str]) -> bool:
+        """True if a fresh recorded search exists (without loading products)"""
+        query_key, filter_key = self._search_key(query, platform_filter)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT searched_at FROM searches WHERE region = ? AND query = ? AND platform_filter = ?",
+                (region, query_key, filter_key)
+            ).fetchone()
+        return bool(row) and time.time() - row[0] <= self.max_age['search']
+
+    def clear(self):
+        """Drop all catalog data and reset counters"""
+        with self._lock:
+            self._conn.execute("DELETE FROM products")
+            self._conn.execute("DELETE FROM searches")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Search hit/miss counters and row counts"""
+        with self._lock:
+            products = self._conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+            searches = self._conn.execute("SELECT COUNT(*) FROM searches").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': (self.hits / total) if total else 0.0,
+            'products': products,
+            'searches': searches,
+        }
+
+
+_shared_product_catalogs: Dict[str, ProductCatalog] = {}
+
+
+def get_product_catalog(path: str = 'psn_catalog.sqlite3') -> ProductCatalog:
+    """Return a process-wide ProductCatalog for path (shared across scraper instances)"""
+    if path not in _shared_product_catalogs:
+        _shared_product_catalogs[path] = ProductCatalog(path)
+    return _shared_product_catalogs[path]
+
+
+# ===========================================
+# NAME NORMALIZATION & GAME TYPE CLASSIFICATION
+# ===========================================
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton answering "does the text contain any keyword?"
+    in a single pass over the text, regardless of how many keywords there are.
+    """
+
+    def __init__(self, keywords: List[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[bool] = [False]
+        
+        for keyword in keywords:
+            state = 0
+            for ch in keyword:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(False)
+                state = nxt
+            self._out[state] = True
+        
+        # Breadth-first failure links (depth-1 states fail back to the root)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] or self._out[self._fail[nxt]]
+
+    def search(self, text: str) -> bool:
+        """True if any keyword occurs in text"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                return True
+        return False
+
+
+_CURRENCY_KEYWORD_LIST = [
+    # Generic currency
+    'coins', 'credits', 'tokens', 'gems', 'gold', 'silver', 'cash',
+    'bucks', 'points', 'stars', 'diamonds', 'crystals', 'rubies',
+    'currency', 'wallet', 'funds',
+    # Common franchise currencies
+    'v-bucks', 'apex coins', 'shark card', 'shark cash', 'moon credits',
+    'rainbow coins', 'cells', 'astral diamonds', 'platinum', 'gil',
+    'zenny', 'munny', 'florins', 'kreds', 'rep', 'orbs', 'essence',
+    'shards', 'dust', 'crowns', 'seeds', 'leaves', 'berries',
+    # Pack / bundle patterns that indicate content packs not full games
+    'starter pack', 'starter bundle', 'founders pack', 'season pass',
+    'character pack', 'skin pack', 'costume pack', 'cosmetic',
+    'booster pack', 'item pack', 'loot pack', 'resource pack',
+    'virtual currency', 'in-game currency', 'digital currency',
+]
+
+_PACK_PATTERN_LIST = [
+    r'\b\d+[kK]?\s*(coins?|credits?|tokens?|gems?|gold|bucks?|points?|diamonds?)\b',
+    r'\b(small|medium|large|huge|massive|mega|ultra|supreme|epic|legendary|starter)\s+(pack|bundle|bag|chest|box|pouch)\b',
+    r'\bpack\s+of\s+\d+\b',
+    r'\b\d+[,\s]\d{3}\s+(coins?|credits?|tokens?)\b',
+]
+
+_CURRENCY_KEYWORDS = KeywordMatcher(_CURRENCY_KEYWORD_LIST)
+_PACK_PATTERN = re.compile('|'.join(f'(?:{pat})' for pat in _PACK_PATTERN_LIST))
+
+_NAME_SUFFIXES = ['definitive edition', 'remastered', 'deluxe edition',
+                  'game of the year', 'goty', 'edition', 'enhanced edition',
+                  'complete edition', 'ultimate edition']
+_NAME_SUFFIX_RE = re.compile(r' (?:' + '|'.join(re.escape(sfx) for sfx in _NAME_SUFFIXES) + r')$')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=16384)
+def normalize_name(name: str) -> str:
+    """
+    Normalize game name for matching (memoized)
+    
+    Args:
+        name: Original game name
+        
+    Returns:
+        Normalized name
+    """
+    # Remove special characters, extra spaces, convert to lowercase
+    normalized = _PUNCTUATION_RE.sub('', name.lower())
+    normalized = _WHITESPACE_RE.sub(' ', normalized).strip()
+    
+    # Remove common suffixes. The combined regex is a fast reject; when it hits,
+    # strip in list order exactly like the original one-regex-per-suffix loop.
+    if _NAME_SUFFIX_RE.search(normalized):
+        for suffix in _NAME_SUFFIXES:
+            if normalized.endswith(' ' + suffix):
+                normalized = normalized[:-(len(suffix) + 1)]
+    
+    return normalized
+
+
+@lru_cache(maxsize=16384)
+def classify_game_type(store_display_classification: str, localized_store_display_classification: str, name: str) -> str:
+    """
+    Determine the type of game based on classification data (memoized).
+    
+    Keyed on (classification, localized classification, name); PSN searches
+    return the same products over and over, so most calls are cache hits.
+    """
+    game_type = "Unknown"
+    
+    # Check store_display_classification first
+    if store_display_classification:
+        store_display_classification = store_display_classification.upper()
+        if store_display_classification == "FULL_GAME":
+            game_type = "Full Game"
+        elif store_display_classification == "ADD_ON":
+            game_type = "Add-on"
+        elif store_display_classification == "PREMIUM_ADD_ON":
+            game_type = "Premium Add-on"
+        elif store_display_classification == "DEMO":
+            game_type = "Demo"
+        elif store_display_classification == "TRIAL":
+            game_type = "Trial"
+        elif store_display_classification == "BUNDLE":
+            game_type = "Bundle"
+        elif store_display_classification == "THEME":
+            game_type = "Theme"
+        elif store_display_classification == "AVATAR":
+            game_type = "Avatar"
+        elif store_display_classification == "SUBSCRIPTION":
+            game_type = "Subscription"
+        elif store_display_classification == "EDITION":
+            game_type = "Edition"
+        elif store_display_classification == "UNKNOWN":
+            pass
+    
+    # Check localized classification for additional info
+    if localized_store_display_classification:
+        localized_lower = localized_store_display_classification.lower()
+        
+        # Finnish classifications
+        if "kokonainen" in localized_lower and "peli" in localized_lower:
+            game_type = "Full Game"
+        elif "lisäosa" in localized_lower or "liite" in localized_lower:
+            game_type = "Add-on"
+        elif "demo" in localized_lower:
+            game_type = "Demo"
+        elif "kokeilu" in localized_lower or "koe" in localized_lower:
+            game_type = "Trial"
+        elif "paketti" in localized_lower or "kokoelma" in localized_lower:
+            game_type = "Bundle"
+        elif "teema" in localized_lower:
+            game_type = "Theme"
+        elif "avatar" in localized_lower:
+            game_type = "Avatar"
+        elif "tilaus" in localized_lower:
+            game_type = "Subscription"
+        elif "versio" in localized_lower or "painos" in localized_lower:
+            game_type = "Edition"
+        
+        # English classifications
+        elif "full game" in localized_lower:
+            game_type = "Full Game"
+        elif "add-on" in localized_lower or "dlc" in localized_lower:
+            game_type = "Add-on"
+        elif "bundle" in localized_lower:
+            game_type = "Bundle"
+        elif "theme" in localized_lower:
+            game_type = "Theme"
+        elif "avatar" in localized_lower:
+            game_type = "Avatar"
+        elif "subscription" in localized_lower:
+            game_type = "Subscription"
+        elif "demo" in localized_lower:
+            game_type = "Demo"
+        elif "trial" in localized_lower:
+            game_type = "Trial"
+        elif "edition" in localized_lower:
+            game_type = "Edition"
+    
+    # Additional checks based on game name patterns
+    name_lower = name.lower()
+    name_upper = name.upper()
+
+    # ── Virtual currency / in-game packs (highest priority catch) ──────────
+    # These must be checked BEFORE generic add-on/DLC patterns because PSN
+    # search often surfaces them first even when the user wants the full game.
+    if game_type not in ("Add-on", "Premium Add-on"):
+        if _CURRENCY_KEYWORDS.search(name_lower) or _PACK_PATTERN.search(name_lower):
+            game_type = "Virtual Currency"
+
+    # Check for obvious indicators
+    if game_type not in ("Virtual Currency",):
+        if 'DLC' in name_upper or 'ADD-ON' in name_upper or 'EXPANSION' in name_upper:
+            game_type = "Add-on"
+        elif 'THEME' in name_upper or 'teema' in name_lower:
+            game_type = "Theme"
+        elif 'AVATAR' in name_upper or 'avatar' in name_lower:
+            game_type = "Avatar"
+        elif 'BUNDLE' in name_upper or 'paketti' in name_lower or 'kokoelma' in name_lower:
+            game_type = "Bundle"
+        elif 'EDITION' in name_upper and game_type != "Add-on":
+            game_type = "Edition"
+    
+    # Final safety check
+    if game_type == "Unknown":
+        game_terms = ['game', 'peli', 'assassin', 'creed', 'odyssey', 'valhalla']
+        if any(term in name_lower for term in game_terms):
+            game_type = "Full Game"
+    
+    return game_type
+
+
+# ===========================================
+# MATCHING ENGINE
+# ===========================================
+
+_NUMBER_RE = re.compile(r'\d+')
+
+
+class GameMatcher:
+    """
+    Candidate index for matching Steam names against a fixed list of PSN games.
+
+    PSN names are normalised once. For large lists a token/trigram inverted index
+    shortlists the PSN games most similar to a Steam name (Jaccard similarity of
+    their n-gram sets, plus every game with the exact same normalised name), and
+    only that shortlist gets the full SequenceMatcher-based score, which is
+    computed exactly as in PSNScraper.find_matching_game. Lists of up to
+    exhaustive_below games are always scored in full.
+    """
+
+    def __init__(self, scraper: 'PSNScraper', psn_games: List['PSNGame'], shortlist_size: int = 8,
+                 exhaustive_below: int = 32):
+        """
+        Args:
+            scraper: PSNScraper providing normalize_game_name / _calculate_similarity_score
+            psn_games: PSN games to match against
+            shortlist_size: Candidates fully scored per lookup
+            exhaustive_below: Score every game (and build no index) for lists up to this size
+        """
+        self.scraper = scraper
+        self.shortlist_size = shortlist_size
+        
+        # Same candidate pool as before: full games if any, otherwise everything
+        full_games = [game for game in psn_games if game.game_type == "Full Game"]
+        self.games = full_games if full_games else list(psn_games)
+        self.exhaustive = len(self.games) <= exhaustive_below
+        
+        self.entries = []
+        self.gram_counts: List[int] = []
+        self.index: Dict[str, List[int]] = {}
+        self.by_name: Dict[str, List[int]] = {}
+        for i, game in enumerate(self.games):
+            name = game.name.lower()
+            normalized = scraper.normalize_game_name(name)
+            self.entries.append((name, normalized, _NUMBER_RE.findall(normalized)))
+            if self.exhaustive:
                 continue
+            grams = self._grams(normalized)
+            self.gram_counts.append(len(grams))
+            self.by_name.setdefault(normalized, []).append(i)
+            for gram in grams:
+                self.index.setdefault(gram, []).append(i)
+
+    @staticmethod
+    def _grams(normalized: str) -> set:
+        """Word tokens plus character trigrams of a normalised name"""
+        padded = f" {normalized} "
+        grams = {'w:' + token for token in normalized.split()}
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+        return grams
+
+    def _shortlist(self, normalized: str) -> List[int]:
+        """
+        Indices of the games most similar to normalized, in list order.
+        
+        Ranked by Jaccard similarity rather than raw overlap, so longer names that
+        merely contain the query ("<title> Vault Edition") do not crowd out the
+        exact title; exact normalised-name hits are always kept.
+        """
+        if self.exhaustive:
+            return list(range(len(self.games)))
+        
+        grams = self._grams(normalized)
+        overlap: Dict[int, int] = {}
+        for gram in grams:
+            for i in self.index.get(gram, ()):
+                overlap[i] = overlap.get(i, 0) + 1
+        if not overlap:
+            return list(range(len(self.games)))
+        
+        def _jaccard(i):
+            return overlap[i] / (len(grams) + self.gram_counts[i] - overlap[i])
+        
+        best = set(sorted(overlap, key=lambda i: (-_jaccard(i), i))[:self.shortlist_size])
+        best.update(self.by_name.get(normalized, ()))
+        return sorted(best)
+
+    def score(self, steam_name: str, steam_name_normalized: str, i: int) -> float:
+        """Full match score of Steam name against PSN game i"""
+        psn_name, psn_name_normalized, psn_numbers = self.entries[i]
+        
+        score = self.scraper._calculate_similarity_score(
+            steam_name_normalized,
+            psn_name_normalized,
+            steam_name,
+            psn_name
+        )
+        
+        # Bonus points for exact platform matches (like "6" in name)
+        if steam_name_normalized == psn_name_normalized:
+            score += 0.3
+        
+        # Bonus points for full games
+        if self.games[i].game_type == "Full Game":
+            score += 0.2
+        
+        # Check for numerical sequences (like "5", "6" in game names)
+        steam_numbers = _NUMBER_RE.findall(steam_name_normalized)
+        if steam_numbers and psn_numbers and steam_numbers == psn_numbers:
+            score += 0.15
+        
+        # Penalty for different types
+        if 'dlc' in psn_name_normalized and 'dlc' not in steam_name_normalized:
+            score -= 0.2
+        
+        return score
+
+    def best_match(self, steam_name: str, exhaustive: bool = False) -> Tuple[Optional['PSNGame'], float]:
+        """
+        Best scoring PSN game for a Steam name (ties go to the earlier game).
+        
+        Args:
+            steam_name: Steam game name
+            exhaustive: Score every game instead of the shortlist
+        
+        Returns:
+            (PSNGame or None, score)
+        """
+        steam_name = steam_name.lower()
+        steam_name_normalized = self.scraper.normalize_game_name(steam_name)
+        candidates = range(len(self.games)) if exhaustive else self._shortlist(steam_name_normalized)
+        
+        best_match = None
+        best_score = 0.0
+        for i in candidates:
+            score = self.score(steam_name, steam_name_normalized, i)
+            if score > best_score:
+                best_score = score
+                best_match = self.games[i]
+        return best_match, best_score
+
+
+class PSNScraper:
+    """PSN Store Scraper with Cloudflare bypass"""
+    
+    SESSION_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+        'Accept-Language': 'fi-FI,fi;q=0.9,en-US;q=0.8,en;q=0.7',
+        'Accept-Encoding': 'gzip, deflate, br, zstd',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'same-origin',
+        'Sec-Fetch-User': '?1',
+        'Cache-Control': 'max-age=0',
+    }
+    
+    def __init__(self, region: str = 'fi-fi', platform_filter: str = None,
+                 cache: Optional[ResponseCache] = None, use_cache: bool = True,
+                 rate_limiter: Optional[HostRateLimiter] = None, max_workers: int = 4,
+                 catalog: Optional[ProductCatalog] = None, use_catalog: bool = True):
+        """
+        Initialize PSN scraper with Cloudflare bypass
+        
+        Args:
+            region: PSN region (e.g., 'fi-fi', 'en-us', 'en-gb')
+            platform_filter: Filter by platform ('ps4', 'ps5', 'both', or None for all)
+            cache: ResponseCache to use (defaults to the shared on-disk cache)
+            use_cache: Set False to always hit the network
+            rate_limiter: Per-host limiter (defaults to the shared limiter)
+            max_workers: Concurrency cap for product page enrichment
+            catalog: ProductCatalog to record products in (defaults to the shared catalog)
+            use_catalog: Set False to neither read nor write the product catalog
+        """
+        self.region = region
+        self.platform_filter = platform_filter.lower() if platform_filter else None
+        self.base_url = f'https://store.playstation.com/{region}'
+        self.cache = (cache or get_response_cache()) if use_cache else None
+        self.catalog = (catalog or get_product_catalog()) if use_catalog else None
+        self.rate_limiter = rate_limiter or get_host_rate_limiter()
+        self.max_workers = max_workers
+        self._scraper = None
+        self._scraper_lock = threading.Lock()
+        
+        logger.info(f"Initialized PSNScraper for region: {region}, platform filter: {self.platform_filter}")
+
+    @property
+    def scraper(self):
+        """cloudscraper session, created on first use (AsyncPSNScraper only needs it for sync calls)"""
+        if self._scraper is None:
+            with self._scraper_lock:
+                if self._scraper is None:
+                    # Use cloudscraper to bypass Cloudflare
+                    scraper = cloudscraper.create_scraper(
+                        browser={
+                            'browser': 'chrome',
+                            'platform': 'windows',
+                            'mobile': False
+                        },
+                        delay=10,
+                        interpreter='nodejs'
+                    )
+                    scraper.headers.update(self.SESSION_HEADERS)
+                    self._scraper = scraper
+        return self._scraper
+
+    def _fetch(self, url: str, kind: str = None, timeout: int = 30):
+        """
+        GET a PSN URL through the response cache.
+        
+        Args:
+            url: URL to fetch
+            kind: TTL class ('search', 'product', 'image'); guessed from the URL if omitted
+            timeout: Request timeout in seconds
+        
+        Returns:
+            requests.Response or CachedResponse
+        """
+        if self.cache:
+            cached = self.cache.get(url, self.region)
+            if cached is not None:
+                logger.debug(f"Cache hit: {url}")
+                return cached
+        
+        self.rate_limiter.acquire(url)
+        response = self.scraper.get(url, timeout=timeout)
+        
+        if self.cache and response.status_code == 200:
+            self.cache.put(url, self.region, response, kind=kind)
+        
+        return response
+
+    def fetch_image(self, image_url: str) -> Optional[bytes]:
+        """
+        Download a PSN image (cover art etc.) using the image cache TTL.
+        
+        Returns:
+            Raw image bytes or None on failure
+        """
+        try:
+            response = self._fetch(image_url, kind='image')
+            if response.status_code != 200:
+                return None
+            return response.content
+        except Exception as e:
+            logger.error(f"Error fetching image {image_url}: {e}")
+            return None
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return response cache hit/miss statistics (empty if caching is disabled)"""
+        return self.cache.stats() if self.cache else {}
+
+    def catalog_stats(self) -> Dict[str, Any]:
+        """Return product catalog statistics (empty if the catalog is disabled)"""
+        return self.catalog.stats() if self.catalog else {}
+
+    def is_search_cached(self, query: str, platform_filter: str = None) -> bool:
+        """True if the product catalog can answer this search without the network"""
+        platform_filter = platform_filter.lower() if platform_filter else self.platform_filter
+        return bool(self.catalog) and self.catalog.has_search(self.region, query, platform_filter)
+
+    def update_with_cf_clearance(self, cf_clearance_value):
+        """
+        Update the scraper session with cf_clearance cookie
+        
+        Args:
+            cf_clearance_value: The cf_clearance cookie value
+        
+        Returns:
+            bool: True if successful
+        """
+        try:
+            # Update headers with cookie
+            cookie_header = f"cf_clearance={cf_clearance_value}"
+            
+            # Add to existing cookies if any
+            if 'Cookie' in self.scraper.headers:
+                existing_cookies = self.scraper.headers['Cookie']
+                if 'cf_clearance' not in existing_cookies:
+                    self.scraper.headers['Cookie'] = f"{existing_cookies}; {cookie_header}"
+            else:
+                self.scraper.headers['Cookie'] = cookie_header
+            
+            logger.info("Added cf_clearance cookie to requests session")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error adding cf_clearance cookie: {e}")
+            return False
+
+    def get_game_release_date(self, url: str, game_name: str = None) -> Optional[str]:
+        """
+        Get release date for a specific game by URL.
+        
+        Args:
+            url: The PSN game page URL
+            game_name: Optional game name for logging
+        
+        Returns:
+            Release date string or None if not found
+        """
+        try:
+            logger.info(f"Fetching release date for: {game_name or 'Unknown game'}")
+            
+            # Make the request
+            response = self._fetch(url, kind='product')
+            
+            if response.status_code != 200:
+                logger.warning(f"Failed to fetch game page {url}: {response.status_code}")
+                return None
+            
+            # Extract release date
+            release_date = extract_release_date_from_psn_page(response.text)
+            
+            if release_date and game_name:
+                logger.info(f"Found release date for '{game_name}': {release_date}")
+            elif not release_date and game_name:
+                logger.debug(f"No release date found for '{game_name}'")
+            
+            return release_date
+            
+        except Exception as e:
+            logger.error(f"Error getting release date for {url}: {e}")
+            return None
+
+    def search_games_with_release_dates(self, query: str, max_results: int = 20) -> List[PSNGame]:
+        """
+        Search for games and fetch their release dates.
+        
+        Args:
+            query: Search query
+            max_results: Maximum number of results to return
+        
+        Returns:
+            List of PSNGame objects with release_date attribute
+        """
+        # First search for games
+        games = self.search_games_with_pagination(query, max_results)
+        
+        if not games:
+            return games
+        
+        self.enrich_release_dates(games)
         
         # Count games with release dates
         games_with_dates = sum(1 for game in games if game.release_date and game.release_date != 'N/A')
         logger.info(f"Found release dates for {games_with_dates} out of {len(games)} games")
 
         # Re-apply sort so Full Game always leads even after release-date fetching
-        games = self._sort_by_type_priority(games)
+        games = self.sort_results(games)
 
         return games
     
-    def _extract_sku_id(self, apollo_state: Dict, product_id: str) -> Optional[str]:
+    def enrich_release_dates(self, games: List[PSNGame], max_workers: int = None) -> List[PSNGame]:
+        """
+        Fill in missing release dates from product pages using a bounded worker pool.
+        
+        Requests to store.playstation.com go through the host rate limiter, so the
+        request rate stays at the old one-per-second level while network waits overlap.
+        
+        Args:
+            games: PSNGame objects (updated in place)
+            max_workers: Concurrency cap (defaults to self.max_workers)
+        
+        Returns:
+            The same list of games
+        """
+        pending = [game for game in games if not game.release_date or game.release_date == 'N/A']
+        
+        # Release dates already fetched for these products don't need another page load
+        if pending and self.catalog:
+            known = self.catalog.get_products([game.title_id for game in pending], self.region)
+            for game in pending:
+                if game.title_id in known and known[game.title_id].release_date:
+                    game.release_date = known[game.title_id].release_date
+            pending = [game for game in pending if not game.release_date or game.release_date == 'N/A']
+        
+        if not pending:
+            return games
+        
+        logger.info(f"Fetching release dates for {len(pending)} games (workers: {max_workers or self.max_workers})...")
+        
+        release_dates = run_bounded_stage(
+            pending,
+            lambda game: self.get_game_release_date(game.url, game.name),
+            max_workers=max_workers or self.max_workers
+        )
+        
+        for game, release_date in zip(pending, release_dates):
+            if release_date:
+                game.release_date = release_date
+                if self.catalog:
+                    self.catalog.set_release_date(game.title_id, self.region, release_date)
+        
+        return games
+
+    def _extract_sku_id(self, apollo_state: Dict, product_id: str,
+                        apollo_index: Optional[ApolloStateIndex] = None) -> Optional[str]:
         """
         Extract SKU ID from Apollo state data
         
         Args:
             apollo_state: The Apollo state dictionary from the page JSON
             product_id: The product ID to find SKU for
+            apollo_index: Prebuilt index for the page (O(1) lookup); without it
+                the whole state is scanned for this product
             
         Returns:
             SKU ID string or None
         """
         try:
+            if apollo_index is not None:
+                return apollo_index.sku_for_product(product_id)
+            
             # Method 1: Look for SKU entries in the cache
             for key, value in apollo_state.items():
                 if key.startswith('Sku:') and isinstance(value, dict):
@@ -422,7 +1647,12 @@ class PSNScraper:
         Returns:
             True if game matches platform filter or no filter is set
         """
-        if not self.platform_filter or self.platform_filter == 'both':
+        return self._game_matches_platform(game, self.platform_filter)
+    
+    @staticmethod
+    def _game_matches_platform(game: PSNGame, platform_filter: Optional[str]) -> bool:
+        """Platform filter check against an explicit filter ('ps4', 'ps5', 'both' or None)"""
+        if not platform_filter or platform_filter == 'both':
             return True
         
         if not game.platform_tags:
@@ -432,147 +1662,16 @@ class PSNScraper:
         platform_tags_lower = [tag.lower() for tag in game.platform_tags]
         
         # Check for platform matches
-        if self.platform_filter == 'ps4':
+        if platform_filter == 'ps4':
             return any('ps4' in tag or 'playstation 4' in tag for tag in platform_tags_lower)
-        elif self.platform_filter == 'ps5':
+        elif platform_filter == 'ps5':
             return any('ps5' in tag or 'playstation 5' in tag for tag in platform_tags_lower)
         
         return False
     
     def _determine_game_type(self, store_display_classification: str, localized_store_display_classification: str, name: str) -> str:
         """Determine the type of game based on classification data"""
-        game_type = "Unknown"
-        
-        # Check store_display_classification first
-        if store_display_classification:
-            store_display_classification = store_display_classification.upper()
-            if store_display_classification == "FULL_GAME":
-                game_type = "Full Game"
-            elif store_display_classification == "ADD_ON":
-                game_type = "Add-on"
-            elif store_display_classification == "PREMIUM_ADD_ON":
-                game_type = "Premium Add-on"
-            elif store_display_classification == "DEMO":
-                game_type = "Demo"
-            elif store_display_classification == "TRIAL":
-                game_type = "Trial"
-            elif store_display_classification == "BUNDLE":
-                game_type = "Bundle"
-            elif store_display_classification == "THEME":
-                game_type = "Theme"
-            elif store_display_classification == "AVATAR":
-                game_type = "Avatar"
-            elif store_display_classification == "SUBSCRIPTION":
-                game_type = "Subscription"
-            elif store_display_classification == "EDITION":
-                game_type = "Edition"
-            elif store_display_classification == "UNKNOWN":
-                pass
-        
-        # Check localized classification for additional info
-        if localized_store_display_classification:
-            localized_lower = localized_store_display_classification.lower()
-            
-            # Finnish classifications
-            if "kokonainen" in localized_lower and "peli" in localized_lower:
-                game_type = "Full Game"
-            elif "lisäosa" in localized_lower or "liite" in localized_lower:
-                game_type = "Add-on"
-            elif "demo" in localized_lower:
-                game_type = "Demo"
-            elif "kokeilu" in localized_lower or "koe" in localized_lower:
-                game_type = "Trial"
-            elif "paketti" in localized_lower or "kokoelma" in localized_lower:
-                game_type = "Bundle"
-            elif "teema" in localized_lower:
-                game_type = "Theme"
-            elif "avatar" in localized_lower:
-                game_type = "Avatar"
-            elif "tilaus" in localized_lower:
-                game_type = "Subscription"
-            elif "versio" in localized_lower or "painos" in localized_lower:
-                game_type = "Edition"
-            
-            # English classifications
-            elif "full game" in localized_lower:
-                game_type = "Full Game"
-            elif "add-on" in localized_lower or "dlc" in localized_lower:
-                game_type = "Add-on"
-            elif "bundle" in localized_lower:
-                game_type = "Bundle"
-            elif "theme" in localized_lower:
-                game_type = "Theme"
-            elif "avatar" in localized_lower:
-                game_type = "Avatar"
-            elif "subscription" in localized_lower:
-                game_type = "Subscription"
-            elif "demo" in localized_lower:
-                game_type = "Demo"
-            elif "trial" in localized_lower:
-                game_type = "Trial"
-            elif "edition" in localized_lower:
-                game_type = "Edition"
-        
-        # Additional checks based on game name patterns
-        name_lower = name.lower()
-        name_upper = name.upper()
-
-        # ── Virtual currency / in-game packs (highest priority catch) ──────────
-        # These must be checked BEFORE generic add-on/DLC patterns because PSN
-        # search often surfaces them first even when the user wants the full game.
-        _currency_keywords = [
-            # Generic currency
-            'coins', 'credits', 'tokens', 'gems', 'gold', 'silver', 'cash',
-            'bucks', 'points', 'stars', 'diamonds', 'crystals', 'rubies',
-            'currency', 'wallet', 'funds',
-            # Common franchise currencies
-            'v-bucks', 'apex coins', 'shark card', 'shark cash', 'moon credits',
-            'rainbow coins', 'cells', 'astral diamonds', 'platinum', 'gil',
-            'zenny', 'munny', 'florins', 'kreds', 'rep', 'orbs', 'essence',
-            'shards', 'dust', 'crowns', 'seeds', 'leaves', 'berries',
-            # Pack / bundle patterns that indicate content packs not full games
-            'starter pack', 'starter bundle', 'founders pack', 'season pass',
-            'character pack', 'skin pack', 'costume pack', 'cosmetic',
-            'booster pack', 'item pack', 'loot pack', 'resource pack',
-            'virtual currency', 'in-game currency', 'digital currency',
-        ]
-        _pack_patterns = [
-            r'\b\d+[kK]?\s*(coins?|credits?|tokens?|gems?|gold|bucks?|points?|diamonds?)\b',
-            r'\b(small|medium|large|huge|massive|mega|ultra|supreme|epic|legendary|starter)\s+(pack|bundle|bag|chest|box|pouch)\b',
-            r'\bpack\s+of\s+\d+\b',
-            r'\b\d+[,\s]\d{3}\s+(coins?|credits?|tokens?)\b',
-        ]
-
-        if game_type not in ("Add-on", "Premium Add-on"):
-            name_lower_check = name_lower
-            if any(kw in name_lower_check for kw in _currency_keywords):
-                game_type = "Virtual Currency"
-            else:
-                for pat in _pack_patterns:
-                    if re.search(pat, name_lower_check):
-                        game_type = "Virtual Currency"
-                        break
-
-        # Check for obvious indicators
-        if game_type not in ("Virtual Currency",):
-            if 'DLC' in name_upper or 'ADD-ON' in name_upper or 'EXPANSION' in name_upper:
-                game_type = "Add-on"
-            elif 'THEME' in name_upper or 'teema' in name_lower:
-                game_type = "Theme"
-            elif 'AVATAR' in name_upper or 'avatar' in name_lower:
-                game_type = "Avatar"
-            elif 'BUNDLE' in name_upper or 'paketti' in name_lower or 'kokoelma' in name_lower:
-                game_type = "Bundle"
-            elif 'EDITION' in name_upper and game_type != "Add-on":
-                game_type = "Edition"
-        
-        # Final safety check
-        if game_type == "Unknown":
-            game_terms = ['game', 'peli', 'assassin', 'creed', 'odyssey', 'valhalla']
-            if any(term in name_lower for term in game_terms):
-                game_type = "Full Game"
-        
-        return game_type
+        return classify_game_type(store_display_classification, localized_store_display_classification, name)
     
     # ── Priority order for PSN result sorting ─────────────────────────────────
     _GAME_TYPE_PRIORITY = {
@@ -590,119 +1689,254 @@ class PSNScraper:
         "Unknown":          11,
     }
 
-    def _sort_by_type_priority(self, games: List['PSNGame']) -> List['PSNGame']:
-        """Return games sorted so Full Game results appear before add-ons / currency packs."""
+    def sort_results(self, games: List['PSNGame']) -> List['PSNGame']:
+        """
+        Return games sorted so Full Game results appear before add-ons / currency packs.
+        
+        search_games_with_pagination returns its results in this order; callers
+        collecting iter_search_pages themselves use it to get the same order.
+        """
         return sorted(
             games,
             key=lambda g: self._GAME_TYPE_PRIORITY.get(g.game_type, 10)
         )
 
-    def search_games_with_pagination(self, query: str, max_results: int = 200, platform_filter: str = None) -> List['PSNGame']:
-        """Search for games on PSN Store with pagination, Cloudflare bypass, and platform filtering"""
+    # Products per PSN search results page
+    SEARCH_PAGE_SIZE = 24
+
+    def _search_page_url(self, encoded_query: str, page: int) -> str:
+        """Build the URL for a search results page (page 1 has no page suffix)"""
+        if page == 1:
+            return f"{self.base_url}/search/{encoded_query}"
+        return f"{self.base_url}/search/{encoded_query}/{page}"
+
+    def _fetch_search_page(self, encoded_query: str, page: int) -> Optional[Tuple[List[PSNGame], int, bool, Optional[int]]]:
+        """
+        Fetch and parse one search results page.
+        
+        Args:
+            encoded_query: URL-encoded search query
+            page: 1-based page number
+        
+        Returns:
+            (games passing the platform filter, raw product count before filtering,
+            served from cache, total result count if reported) or None if
+            pagination should stop
+        """
+        url = self._search_page_url(encoded_query, page)
+        logger.info(f"Search URL (page {page}): {url}")
+        
+        try:
+            # Use cloudscraper with retry (served from cache when fresh)
+            response = self._fetch(url, kind='search')
+            
+            # Check for 404
+            if response.status_code == 404:
+                logger.info(f"Received 404 for page {page}, stopping pagination")
+                return None
+            
+            response.raise_for_status()
+            from_cache = getattr(response, 'from_cache', False)
+            
+            current_page_games, raw_count, total_count = self._parse_search_page(response, page, self.platform_filter)
+            return current_page_games, raw_count, from_cache, total_count
+            
+        except Exception as e:
+            logger.error(f"Request error on page {page}: {e}")
+            return None
+    
+    def _parse_search_page(self, response, page: int,
+                           platform_filter: Optional[str]) -> Tuple[List[PSNGame], int, Optional[int]]:
+        """
+        Parse a fetched search results page and record its products in the catalog.
+        
+        Args:
+            response: Response-like object with .content and .text
+            page: 1-based page number
+            platform_filter: Filter applied to the returned games ('ps4', 'ps5', 'both', or None)
+        
+        Returns:
+            (games passing the platform filter, raw product count before filtering,
+            total result count if reported)
+        """
+        # Extract embedded JSON straight from the raw bytes (no DOM build)
+        json_data = extract_next_data(response.content)
+        
+        if json_data:
+            games_data = json_data.get('props', {}).get('apolloState', {})
+            apollo_index = ApolloStateIndex(games_data)
+            
+            parsed_games = []
+            current_page_games = []
+            for key, value in games_data.items():
+                if isinstance(value, dict) and 'name' in value:
+                    # Index built once per page for SKU extraction
+                    game_info = self._parse_product_from_json(value, apollo_index=apollo_index)
+                    if game_info:
+                        parsed_games.append(game_info)
+                        # Apply platform filter if specified
+                        if self._game_matches_platform(game_info, platform_filter):
+                            current_page_games.append(game_info)
+            
+            raw_count = len(parsed_games)
+            if self.catalog:
+                self.catalog.upsert(parsed_games, self.region)
+            
+            logger.info(f"Parsed {len(current_page_games)}/{raw_count} games from page {page} (platform filter: {platform_filter})")
+            total_count = apollo_index.total_count() if page == 1 else None
+            return current_page_games, raw_count, total_count
+        
+        # Fallback to HTML parsing
+        current_page_games = self._parse_search_results_html(response.text, self.SEARCH_PAGE_SIZE)
+        if self.catalog:
+            self.catalog.upsert(current_page_games, self.region)
+        logger.info(f"Parsed {len(current_page_games)} games from page {page} (HTML fallback)")
+        return current_page_games, len(current_page_games), None
+
+    def iter_search_pages(self, query: str, platform_filter: str = None,
+                          max_pages: int = None) -> Iterator[List[PSNGame]]:
+        """
+        Lazily fetch PSN search results page by page.
+        
+        Pages are yielded in order. When page 1 reports the total result count, the
+        remaining pages (up to max_pages) are prefetched concurrently on
+        max_workers threads under the host rate limiter; otherwise the next page is
+        only requested when the consumer asks for it. Breaking out of the loop
+        stops pagination and cancels outstanding prefetches.
+        
+        Whether another page exists is decided on the raw page size, before the
+        platform filter, so a page whose products are all filtered out does not
+        end the search early.
+        
+        A search recorded in the product catalog within its freshness window is
+        replayed from the catalog; if that recording stopped early, the store is
+        only asked for the pages after it.
+        
+        Args:
+            query: Search query
+            platform_filter: Filter by platform ('ps4', 'ps5', 'both', or None)
+            max_pages: Upper bound on pages to prefetch (None for all reported pages)
+        
+        Yields:
+            List of PSNGame objects for each page (may be empty after filtering)
+        """
         if platform_filter:
             self.platform_filter = platform_filter.lower()
         
         encoded_query = quote(query)
-        all_games = []
         page = 1
+        pool = None
+        prefetched = {}
+        seen_pages = []
+        fetched = False
+        complete = False
         
         logger.info(f"Searching PSN for: '{query}', platform filter: {self.platform_filter}")
         
-        while len(all_games) < max_results:
-            if page == 1:
-                url = f"{self.base_url}/search/{encoded_query}"
-            else:
-                url = f"{self.base_url}/search/{encoded_query}/{page}"
-            
-            logger.info(f"Search URL (page {page}): {url}")
-            
-            try:
-                # Use cloudscraper with retry
-                response = self.scraper.get(url, timeout=30)
+        cached = self.catalog.search_pages(self.region, query, self.platform_filter) if self.catalog else None
+        replayed = bool(cached)
+        if cached:
+            cached_pages, complete = cached
+            logger.info(f"Answering '{query}' from the product catalog ({len(cached_pages)} pages, complete: {complete})")
+            for page_games in cached_pages:
+                seen_pages.append([game.title_id for game in page_games])
+                yield page_games
+            if complete:
+                return
+            page = len(cached_pages) + 1
+        
+        try:
+            while True:
+                if page in prefetched:
+                    result = prefetched.pop(page).result()
+                else:
+                    result = self._fetch_search_page(encoded_query, page)
+                if result is None:
+                    break
                 
-                # Check for 404
-                if response.status_code == 404:
-                    logger.info(f"Received 404 for page {page}, stopping pagination")
+                current_page_games, raw_count, from_cache, total_count = result
+                fetched = True
+                if raw_count == 0:
+                    logger.info(f"No games found on page {page}, stopping")
+                    complete = True
                     break
                 
-                response.raise_for_status()
+                # Page 1 tells us how many pages exist: fetch the rest concurrently
+                if page == 1 and total_count and self.max_workers > 1:
+                    last_page = math.ceil(total_count / self.SEARCH_PAGE_SIZE)
+                    if max_pages:
+                        last_page = min(last_page, max_pages)
+                    if last_page > 1:
+                        logger.info(f"{total_count} results reported, prefetching pages 2-{last_page}")
+                        pool = ThreadPoolExecutor(max_workers=min(self.max_workers, last_page - 1))
+                        prefetched = {
+                            p: pool.submit(self._fetch_search_page, encoded_query, p)
+                            for p in range(2, last_page + 1)
+                        }
                 
-                # Parse the page
-                soup = BeautifulSoup(response.text, 'html.parser')
+                seen_pages.append([game.title_id for game in current_page_games])
                 
-                # Try to extract JSON data
-                script_tags = soup.find_all('script')
-                json_data = None
+                # Check if this was the last page before handing it out
+                if raw_count < self.SEARCH_PAGE_SIZE:
+                    complete = True
                 
-                for script in script_tags:
-                    if script.string and '"search:results"' in script.string:
-                        try:
-                            start_idx = script.string.find('{"props"')
-                            if start_idx != -1:
-                                json_str = script.string[start_idx:]
-                                end_idx = json_str.find('</script>')
-                                if end_idx != -1:
-                                    json_str = json_str[:end_idx]
-                                json_data = json.loads(json_str)
-                                break
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"JSON parse error on page {page}: {e}")
+                yield current_page_games
                 
-                if json_data:
-                    # Extract games from JSON
-                    try:
-                        games_data = json_data.get('props', {}).get('apolloState', {})
-                        
-                        current_page_games = []
-                        for key, value in games_data.items():
-                            if isinstance(value, dict) and 'name' in value:
-                                # Pass apollo_state to parsing method for SKU extraction
-                                game_info = self._parse_product_from_json(value, apollo_state=games_data)
-                                if game_info:
-                                    # Apply platform filter if specified
-                                    if self._matches_platform_filter(game_info):
-                                        current_page_games.append(game_info)
-                        
-                        if not current_page_games:
-                            logger.info(f"No games found on page {page} (after platform filtering), stopping")
-                            break
-                        
-                        all_games.extend(current_page_games)
-                        logger.info(f"Parsed {len(current_page_games)} games from page {page} (platform filter: {self.platform_filter})")
-                        
-                        # Check if we should continue
-                        if len(current_page_games) < 24:
-                            logger.info(f"Less than 24 games on page {page}, stopping pagination")
-                            break
-                        
-                        page += 1
-                        time.sleep(random.uniform(1, 2))  # Random delay
-                        
-                    except Exception as e:
-                        logger.error(f"Error parsing page {page}: {e}")
-                        break
-                else:
-                    # Fallback to HTML parsing
-                    current_page_games = self._parse_search_results_html(response.text, max_results - len(all_games))
-                    if current_page_games:
-                        all_games.extend(current_page_games)
-                        logger.info(f"Parsed {len(current_page_games)} games from page {page} (HTML fallback)")
-                        
-                        if len(current_page_games) < 24:
-                            logger.info(f"Less than 24 games on page {page}, stopping pagination")
-                            break
-                        
-                        page += 1
-                        time.sleep(random.uniform(1, 2))
-                    else:
-                        logger.info(f"No games found on page {page}, stopping")
-                        break
-                        
-            except Exception as e:
-                logger.error(f"Request error on page {page}: {e}")
+                if complete:
+                    logger.info(f"Less than {self.SEARCH_PAGE_SIZE} games on page {page}, stopping pagination")
+                    break
+                
+                page += 1
+                if not from_cache and page not in prefetched:
+                    time.sleep(random.uniform(1, 2))  # Random delay
+        finally:
+            if pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+            # Only record what the store actually returned. After a partial replay the
+            # recording gains the new pages but keeps its search time: the replayed
+            # pages were not fetched again, so they are no fresher than before
+            if self.catalog and fetched and seen_pages:
+                self.catalog.record_search(self.region, query, self.platform_filter, seen_pages, complete,
+                                           keep_searched_at=replayed)
+
+    def iter_search_results(self, query: str, max_results: int = None, platform_filter: str = None) -> Iterator[PSNGame]:
+        """
+        Stream PSN search results as they are parsed, one game at a time.
+        
+        Results come in store order (not sorted by game type). Pagination stops
+        as soon as max_results games have been yielded or the consumer stops iterating.
+        
+        Args:
+            query: Search query
+            max_results: Stop after this many games (None for all pages)
+            platform_filter: Filter by platform ('ps4', 'ps5', 'both', or None)
+        
+        Yields:
+            PSNGame objects
+        """
+        count = 0
+        max_pages = math.ceil(max_results / self.SEARCH_PAGE_SIZE) if max_results else None
+        for page_games in self.iter_search_pages(query, platform_filter, max_pages=max_pages):
+            for game in page_games:
+                yield game
+                count += 1
+                if max_results is not None and count >= max_results:
+                    return
+
+    def search_games_with_pagination(self, query: str, max_results: int = 200, platform_filter: str = None) -> List['PSNGame']:
+        """Search for games on PSN Store with pagination, Cloudflare bypass, and platform filtering"""
+        all_games = []
+        pages = 0
+        
+        # Whole pages are collected so the type-priority sort below sees every product on them
+        max_pages = math.ceil(max_results / self.SEARCH_PAGE_SIZE)
+        for page_games in self.iter_search_pages(query, platform_filter, max_pages=max_pages):
+            all_games.extend(page_games)
+            pages += 1
+            if len(all_games) >= max_results:
                 break
         
-        logger.info(f"Total games found across {page-1} pages: {len(all_games)}")
+        logger.info(f"Total games found across {pages} pages: {len(all_games)}")
         
         # Log statistics
         game_type_counts = {}
@@ -712,7 +1946,7 @@ class PSNScraper:
         logger.info(f"Game type statistics: {game_type_counts}")
 
         # Sort so Full Game results always come first, currency/add-on packs last
-        all_games = self._sort_by_type_priority(all_games)
+        all_games = self.sort_results(all_games)
         logger.info("Results re-sorted by game type priority (Full Game first)")
 
         return all_games[:max_results]
@@ -743,27 +1977,27 @@ class PSNScraper:
             List of PSNGame objects
         """
         games = []
-        soup = BeautifulSoup(html, 'html.parser')
         
         # Look for the JSON data first
-        script_tag = soup.find('script', {'id': '__NEXT_DATA__'})
-        if script_tag:
+        json_data = extract_next_data(html)
+        if json_data:
             try:
-                json_data = json.loads(script_tag.string)
                 # Extract product IDs from the JSON
                 apollo_state = json_data.get('props', {}).get('apolloState', {})
+                apollo_index = ApolloStateIndex(apollo_state)
                 
                 # Look for Product references
-                for key, value in apollo_state.items():
-                    if isinstance(value, dict) and value.get('__typename') == 'Product':
-                        game = self._parse_product_from_json(value, apollo_state=apollo_state)
-                        if game and len(games) < max_results:
-                            games.append(game)
+                for value in apollo_index.products():
+                    game = self._parse_product_from_json(value, apollo_index=apollo_index)
+                    if game and len(games) < max_results:
+                        games.append(game)
             except Exception as e:
                 logger.error(f"Error extracting JSON from script: {e}")
         
         # If no games from JSON, fall back to HTML parsing
         if not games:
+            soup = BeautifulSoup(html, 'html.parser')
+            
             # Find all product tiles
             product_selectors = [
                 '[data-qa^="search#productTile"]',
@@ -805,22 +2039,10 @@ class PSNScraper:
         Returns:
             Normalized name
         """
-        # Remove special characters, extra spaces, convert to lowercase
-        normalized = name.lower()
-        normalized = re.sub(r'[^\w\s]', '', normalized)  # Remove punctuation
-        normalized = re.sub(r'\s+', ' ', normalized).strip()  # Normalize spaces
-        
-        # Remove common suffixes
-        suffixes = ['definitive edition', 'remastered', 'deluxe edition', 
-                   'game of the year', 'goty', 'edition', 'enhanced edition',
-                   'complete edition', 'ultimate edition']
-        
-        for suffix in suffixes:
-            normalized = re.sub(r'\s+' + re.escape(suffix) + r'$', '', normalized)
-        
-        return normalized
+        return normalize_name(name)
     
-    def _parse_product_from_json(self, product_data: Dict, apollo_state: Dict = None) -> Optional[PSNGame]:
+    def _parse_product_from_json(self, product_data: Dict, apollo_state: Dict = None,
+                                 apollo_index: Optional[ApolloStateIndex] = None) -> Optional[PSNGame]:
         """
         Parse a product from JSON data
         
@@ -828,6 +2050,7 @@ class PSNScraper:
             product_data: JSON product data from Apollo state
             
             apollo_state: Full Apollo state dictionary for SKU extraction
+            apollo_index: Per-page ApolloStateIndex (preferred over apollo_state)
         Returns:
             PSNGame object or None
         """
@@ -840,7 +2063,9 @@ class PSNScraper:
             
             # Extract SKU ID if apollo_state is available
             sku_id = None
-            if apollo_state and product_id:
+            if apollo_index is not None and product_id:
+                sku_id = apollo_index.sku_for_product(product_id)
+            elif apollo_state and product_id:
                 sku_id = self._extract_sku_id(apollo_state, product_id)
             
             if not name:
@@ -1040,193 +2265,969 @@ class PSNScraper:
             logger.error(f"Error parsing product element: {e}")
             return None
     
-    def get_game_details(self, game_url: str) -> Optional[Dict]:
+    def get_game_details(self, game_url: str) -> Optional[Dict]:
+        """
+        Get detailed information for a specific game
+        
+        Args:
+            game_url: Game product page URL
+            
+        Returns:
+            Dictionary with game details or None
+        """
+        product_id = _product_id_from_url(game_url)
+        if self.catalog and product_id:
+            details = self.catalog.get_details(product_id, self.region)
+            if details is not None:
+                logger.debug(f"Game details for {product_id} served from catalog")
+                return details
+        
+        try:
+            logger.info(f"Fetching game details from: {game_url}")
+            response = self._fetch(game_url, kind='product')
+            response.raise_for_status()
+            
+            details = self._parse_game_details(response.text)
+            
+            if self.catalog and product_id:
+                self.catalog.set_details(product_id, self.region, details)
+            
+            return details
+            
+        except Exception as e:
+            logger.error(f"Failed to get game details: {e}")
+            return None
+    
+    def _parse_game_details(self, html: str) -> Dict:
+        """
+        Extract description, release date, developer/publisher, rating,
+        features and languages from a product page.
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        details = {
+            'description': None,
+            'release_date': None,
+            'developer': None,
+            'publisher': None,
+            'rating': None,
+            'features': [],
+            'languages': []
+        }
+        
+        # Extract description
+        desc_elem = soup.select_one('[data-qa="mfe-game-overview#description"], .description')
+        if desc_elem:
+            details['description'] = desc_elem.get_text(strip=True)[:500]  # Limit length
+        
+        # Extract release date
+        # Try multiple selectors for different page layouts
+        date_elem = soup.select_one('[data-qa="gameInfo#releaseInformation#releaseDate-value"]')
+        if not date_elem:
+            date_elem = soup.select_one('[data-qa="gameInfo#releaseInformation#releaseDate"]')
+        if date_elem:
+            details['release_date'] = date_elem.get_text(strip=True)
+        
+        # Extract developer and publisher
+        info_elements = soup.select('[data-qa*="gameInfo"]')
+        for elem in info_elements:
+            text = elem.get_text(strip=True)
+            if 'Developer:' in text:
+                details['developer'] = text.replace('Developer:', '').strip()
+            elif 'Publisher:' in text:
+                details['publisher'] = text.replace('Publisher:', '').strip()
+            elif 'PEGI' in text or 'ESRB' in text:
+                details['rating'] = text
+        
+        # Extract features
+        feature_elems = soup.select('[data-qa*="feature"]')
+        for elem in feature_elems:
+            feature_text = elem.get_text(strip=True)
+            if feature_text:
+                details['features'].append(feature_text)
+        
+        # Extract languages
+        lang_elems = soup.select('[data-qa*="language"]')
+        for elem in lang_elems:
+            lang_text = elem.get_text(strip=True)
+            if lang_text:
+                details['languages'].append(lang_text)
+        
+        return details
+    
+    def find_matching_game(self, steam_game: Dict, psn_games: List[PSNGame],
+                           matcher: Optional[GameMatcher] = None) -> Tuple[Optional[PSNGame], float]:
+        """
+        Find the best matching PSN game for a Steam game
+        
+        Args:
+            steam_game: Steam game dictionary
+            psn_games: List of PSN games from search results
+            matcher: Prebuilt GameMatcher for psn_games (reuse when matching many Steam games)
+            
+        Returns:
+            Tuple of (matched PSN game, confidence score). The match is a copy of
+            the PSN game, so psn_games can be shared across Steam games.
+        """
+        if not psn_games:
+            return None, 0.0
+        
+        if matcher is None:
+            matcher = GameMatcher(self, psn_games)
+        
+        best_match, best_score = matcher.best_match(steam_game.get('name', ''))
+        
+        if best_match and best_score > 0.6:
+            return replace(best_match, matched_steam_game=steam_game, match_confidence=best_score), best_score
+        
+        return None, 0.0
+    
+    def _calculate_similarity_score(self, name1: str, name2: str, original1: str, original2: str) -> float:
+        """
+        Calculate similarity score between two names
+        
+        Args:
+            name1: First normalized name
+            name2: Second normalized name
+            original1: First original name
+            original2: Second original name
+            
+        Returns:
+            Similarity score between 0 and 1
+        """
+        from difflib import SequenceMatcher
+        
+        # Basic sequence matcher
+        score = SequenceMatcher(None, name1, name2).ratio()
+        
+        # Boost score if originals are very similar
+        original_score = SequenceMatcher(None, original1.lower(), original2.lower()).ratio()
+        if original_score > 0.8:
+            score = min(1.0, score + 0.2)
+        
+        # Penalty if lengths differ significantly
+        length_diff = abs(len(name1) - len(name2))
+        if length_diff > 5:
+            score -= min(0.2, length_diff * 0.02)
+        
+        # Boost if key words match
+        key_words1 = set(name1.split())
+        key_words2 = set(name2.split())
+        common = key_words1.intersection(key_words2)
+        if len(common) > 1:
+            score += len(common) * 0.1
+        
+        # Check for series names
+        series_keywords = ['assassins creed', 'final fantasy', 'call of duty']
+        for keyword in series_keywords:
+            if keyword in name1 and keyword in name2:
+                score += 0.15
+        
+        return max(0.0, min(1.0, score))
+
+
+# ===========================================
+# ASYNC PSN CLIENT
+# ===========================================
+
+class AsyncPSNScraper(PSNScraper):
+    """
+    asyncio PSN Store client on a pooled httpx.AsyncClient (HTTP/2 when h2 is installed).
+    
+    Parsing, the response cache, the product catalog and the host rate limiter
+    are PSNScraper's, so sync and async lookups share everything they have
+    fetched. The async methods don't change scraper state, so any number of
+    searches can run concurrently on one instance (see search_many); at most
+    max_workers search pages are fetched at once across all of them, and
+    requests to the store are still paced by the shared rate limiter. The cache and
+    catalog are SQLite, so their calls (and page parsing, which records
+    products) run in worker threads via asyncio.to_thread rather than blocking
+    the event loop.
+    """
+    
+    def __init__(self, region: str = 'fi-fi', platform_filter: str = None,
+                 client: Optional['httpx.AsyncClient'] = None, max_connections: int = 10, **kwargs):
+        """
+        Args:
+            region: PSN region (e.g., 'fi-fi', 'en-us', 'en-gb')
+            platform_filter: Default platform filter ('ps4', 'ps5', 'both', or None)
+            client: httpx.AsyncClient to share between scrapers (created and owned if omitted)
+            max_connections: Connection pool size of the created client
+            **kwargs: Passed to PSNScraper (cache, catalog, rate_limiter, ...)
+        """
+        if not HAS_HTTPX:
+            raise RuntimeError("AsyncPSNScraper needs httpx: pip install 'httpx[http2]'")
+        super().__init__(region=region, platform_filter=platform_filter, **kwargs)
+        
+        # Caps page fetches across concurrent searches, like the sync path's thread pool
+        self._page_slots = asyncio.Semaphore(self.max_workers)
+        self._owns_client = client is None
+        if client is None:
+            headers = {k: v for k, v in self.SESSION_HEADERS.items() if k.lower() != 'connection'}
+            # Only encodings httpx can always decode
+            headers['Accept-Encoding'] = 'gzip, deflate'
+            client = httpx.AsyncClient(
+                http2=HAS_H2,
+                headers=headers,
+                limits=httpx.Limits(max_connections=max_connections,
+                                    max_keepalive_connections=max_connections),
+                timeout=30,
+                follow_redirects=True,
+            )
+        self.client = client
+        logger.info(f"Initialized AsyncPSNScraper (HTTP/2: {HAS_H2 and self._owns_client})")
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the HTTP client if this scraper created it"""
+        if self._owns_client:
+            await self.client.aclose()
+    
+    def update_with_cf_clearance(self, cf_clearance_value):
+        """Add the cf_clearance cookie to the async client (and the sync session if one was created)"""
+        cookie_header = f"cf_clearance={cf_clearance_value}"
+        existing_cookies = self.client.headers.get('Cookie')
+        if not existing_cookies:
+            self.client.headers['Cookie'] = cookie_header
+        elif 'cf_clearance' not in existing_cookies:
+            self.client.headers['Cookie'] = f"{existing_cookies}; {cookie_header}"
+        if self._scraper is not None:
+            return super().update_with_cf_clearance(cf_clearance_value)
+        return True
+    
+    async def _fetch_async(self, url: str, kind: str = None, timeout: int = 30):
+        """
+        GET a PSN URL through the response cache.
+        
+        Returns:
+            httpx.Response or CachedResponse
+        """
+        if self.cache:
+            cached = await asyncio.to_thread(self.cache.get, url, self.region)
+            if cached is not None:
+                logger.debug(f"Cache hit: {url}")
+                return cached
+        
+        await self.rate_limiter.acquire_async(url)
+        response = await self.client.get(url, timeout=timeout)
+        
+        if self.cache and response.status_code == 200:
+            await asyncio.to_thread(self.cache.put, url, self.region, response, kind=kind)
+        
+        return response
+    
+    async def _fetch_search_page_async(self, encoded_query: str, page: int,
+                                       platform_filter: Optional[str]) -> Optional[Tuple[List[PSNGame], int, bool, Optional[int]]]:
+        """Async _fetch_search_page with an explicit platform filter (one of max_workers page slots)"""
+        async with self._page_slots:
+            return await self._fetch_search_page_slot(encoded_query, page, platform_filter)
+    
+    async def _fetch_search_page_slot(self, encoded_query: str, page: int,
+                                      platform_filter: Optional[str]) -> Optional[Tuple[List[PSNGame], int, bool, Optional[int]]]:
+        url = self._search_page_url(encoded_query, page)
+        logger.info(f"Search URL (page {page}): {url}")
+        
+        try:
+            response = await self._fetch_async(url, kind='search')
+            
+            if response.status_code == 404:
+                logger.info(f"Received 404 for page {page}, stopping pagination")
+                return None
+            
+            response.raise_for_status()
+            from_cache = getattr(response, 'from_cache', False)
+            
+            current_page_games, raw_count, total_count = await asyncio.to_thread(
+                self._parse_search_page, response, page, platform_filter
+            )
+            return current_page_games, raw_count, from_cache, total_count
+            
+        except Exception as e:
+            logger.error(f"Request error on page {page}: {e}")
+            return None
+    
+    async def iter_search_pages_async(self, query: str, platform_filter: str = None,
+                                      max_pages: int = None) -> AsyncIterator[List[PSNGame]]:
+        """
+        Async iter_search_pages: pages in order, catalog replay, and the remaining
+        pages (up to max_pages) fetched concurrently once page 1 reports the
+        total result count.
+        
+        Args:
+            query: Search query
+            platform_filter: Filter by platform (defaults to the scraper's filter)
+            max_pages: Upper bound on pages to prefetch (None for all reported pages)
+        
+        Yields:
+            List of PSNGame objects for each page (may be empty after filtering)
+        """
+        platform_filter = platform_filter.lower() if platform_filter else self.platform_filter
+        encoded_query = quote(query)
+        page = 1
+        prefetched = {}
+        seen_pages = []
+        fetched = False
+        complete = False
+        
+        logger.info(f"Searching PSN for: '{query}', platform filter: {platform_filter}")
+        
+        cached = (await asyncio.to_thread(self.catalog.search_pages, self.region, query, platform_filter)
+                  if self.catalog else None)
+        replayed = bool(cached)
+        if cached:
+            cached_pages, complete = cached
+            logger.info(f"Answering '{query}' from the product catalog ({len(cached_pages)} pages, complete: {complete})")
+            for page_games in cached_pages:
+                seen_pages.append([game.title_id for game in page_games])
+                yield page_games
+            if complete:
+                return
+            page = len(cached_pages) + 1
+        
+        try:
+            while True:
+                if page in prefetched:
+                    result = await prefetched.pop(page)
+                else:
+                    result = await self._fetch_search_page_async(encoded_query, page, platform_filter)
+                if result is None:
+                    break
+                
+                current_page_games, raw_count, from_cache, total_count = result
+                fetched = True
+                if raw_count == 0:
+                    logger.info(f"No games found on page {page}, stopping")
+                    complete = True
+                    break
+                
+                # Page 1 tells us how many pages exist: fetch the rest concurrently
+                if page == 1 and total_count:
+                    last_page = math.ceil(total_count / self.SEARCH_PAGE_SIZE)
+                    if max_pages:
+                        last_page = min(last_page, max_pages)
+                    if last_page > 1:
+                        logger.info(f"{total_count} results reported, prefetching pages 2-{last_page}")
+                        prefetched = {
+                            p: asyncio.ensure_future(self._fetch_search_page_async(encoded_query, p, platform_filter))
+                            for p in range(2, last_page + 1)
+                        }
+                
+                seen_pages.append([game.title_id for game in current_page_games])
+                
+                if raw_count < self.SEARCH_PAGE_SIZE:
+                    complete = True
+                
+                yield current_page_games
+                
+                if complete:
+                    logger.info(f"Less than {self.SEARCH_PAGE_SIZE} games on page {page}, stopping pagination")
+                    break
+                
+                page += 1
+                if not from_cache and page not in prefetched:
+                    await asyncio.sleep(random.uniform(1, 2))  # Random delay
+        finally:
+            for task in prefetched.values():
+                task.cancel()
+            # Only record what the store actually returned (see iter_search_pages)
+            if self.catalog and fetched and seen_pages:
+                await asyncio.to_thread(self.catalog.record_search, self.region, query, platform_filter,
+                                        seen_pages, complete, keep_searched_at=replayed)
+    
+    async def search_games_async(self, query: str, max_results: int = 50,
+                                 platform_filter: str = None) -> List[PSNGame]:
+        """Async search_games_with_pagination (results sorted Full Game first)"""
+        all_games = []
+        pages = 0
+        
+        max_pages = math.ceil(max_results / self.SEARCH_PAGE_SIZE)
+        page_iter = self.iter_search_pages_async(query, platform_filter, max_pages=max_pages)
+        try:
+            async for page_games in page_iter:
+                all_games.extend(page_games)
+                pages += 1
+                if len(all_games) >= max_results:
+                    break
+        finally:
+            # Stop pagination and cancel prefetches now rather than at garbage collection
+            await page_iter.aclose()
+        
+        logger.info(f"Total games found across {pages} pages for '{query}': {len(all_games)}")
+        return self.sort_results(all_games)[:max_results]
+    
+    async def search_many(self, queries: List[str], max_results: int = 50,
+                          platform_filter: str = None) -> Dict[str, List[PSNGame]]:
         """
-        Get detailed information for a specific game
+        Run several searches concurrently on the shared connection pool.
         
-        Args:
-            game_url: Game product page URL
-            
         Returns:
-            Dictionary with game details or None
+            query -> results (empty list for a search that failed)
         """
+        results = await asyncio.gather(
+            *(self.search_games_async(query, max_results, platform_filter) for query in queries),
+            return_exceptions=True
+        )
+        output = {}
+        for query, result in zip(queries, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Search for '{query}' failed: {result}")
+                result = []
+            output[query] = result
+        return output
+    
+    async def get_game_details_async(self, game_url: str) -> Optional[Dict]:
+        """Async get_game_details (served from the catalog when already fetched)"""
+        product_id = _product_id_from_url(game_url)
+        if self.catalog and product_id:
+            details = await asyncio.to_thread(self.catalog.get_details, product_id, self.region)
+            if details is not None:
+                logger.debug(f"Game details for {product_id} served from catalog")
+                return details
+        
         try:
             logger.info(f"Fetching game details from: {game_url}")
-            response = self.scraper.get(game_url, timeout=30)
+            response = await self._fetch_async(game_url, kind='product')
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            details = {
-                'description': None,
-                'release_date': None,
-                'developer': None,
-                'publisher': None,
-                'rating': None,
-                'features': [],
-                'languages': []
-            }
-            
-            # Extract description
-            desc_elem = soup.select_one('[data-qa="mfe-game-overview#description"], .description')
-            if desc_elem:
-                details['description'] = desc_elem.get_text(strip=True)[:500]  # Limit length
+            details = await asyncio.to_thread(self._parse_game_details, response.text)
             
-            # Extract release date
-            # Try multiple selectors for different page layouts
-            date_elem = soup.select_one('[data-qa="gameInfo#releaseInformation#releaseDate-value"]')
-            if not date_elem:
-                date_elem = soup.select_one('[data-qa="gameInfo#releaseInformation#releaseDate"]')
-            if date_elem:
-                details['release_date'] = date_elem.get_text(strip=True)
-            
-            # Extract developer and publisher
-            info_elements = soup.select('[data-qa*="gameInfo"]')
-            for elem in info_elements:
-                text = elem.get_text(strip=True)
-                if 'Developer:' in text:
-                    details['developer'] = text.replace('Developer:', '').strip()
-                elif 'Publisher:' in text:
-                    details['publisher'] = text.replace('Publisher:', '').strip()
-                elif 'PEGI' in text or 'ESRB' in text:
-                    details['rating'] = text
-            
-            # Extract features
-            feature_elems = soup.select('[data-qa*="feature"]')
-            for elem in feature_elems:
-                feature_text = elem.get_text(strip=True)
-                if feature_text:
-                    details['features'].append(feature_text)
-            
-            # Extract languages
-            lang_elems = soup.select('[data-qa*="language"]')
-            for elem in lang_elems:
-                lang_text = elem.get_text(strip=True)
-                if lang_text:
-                    details['languages'].append(lang_text)
+            if self.catalog and product_id:
+                await asyncio.to_thread(self.catalog.set_details, product_id, self.region, details)
             
             return details
             
         except Exception as e:
             logger.error(f"Failed to get game details: {e}")
             return None
+
+
+# ===========================================
+# BROWSER RESOURCE BLOCKING
+# ===========================================
+
+def _extension_patterns(*extensions: str) -> List[str]:
+    """URL patterns for Network.setBlockedURLs matching files with or without a query string"""
+    return [pattern for ext in extensions for pattern in (f"*.{ext}", f"*.{ext}?*")]
+
+
+_IMAGE_PATTERNS = _extension_patterns('png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'ico', 'bmp')
+_MEDIA_PATTERNS = _extension_patterns('mp4', 'webm', 'm3u8', 'mp3', 'ogg', 'wav')
+_FONT_PATTERNS = _extension_patterns('woff', 'woff2', 'ttf', 'otf', 'eot')
+_ANALYTICS_PATTERNS = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*googlesyndication.com*', '*cloudflareinsights.com*', '*scorecardresearch.com*',
+    '*facebook.net*', '*hotjar.com*', '*quantserve.com*',
+]
+
+# Scripts and XHR stay allowed in every profile: SteamDB's tables, pagination
+# and the Cloudflare challenge all need JavaScript.
+RESOURCE_BLOCKING_PROFILES: Dict[str, List[str]] = {
+    'off': [],
+    'default': _IMAGE_PATTERNS + _MEDIA_PATTERNS + _FONT_PATTERNS + _ANALYTICS_PATTERNS,
+    'aggressive': (_IMAGE_PATTERNS + _MEDIA_PATTERNS + _FONT_PATTERNS + _ANALYTICS_PATTERNS
+                   + _extension_patterns('css', 'svg')),
+}
+
+
+def apply_resource_blocking(driver, profile: str = 'default', reset: bool = False) -> bool:
+    """
+    Block resource URLs for a Chrome driver via CDP (Network.setBlockedURLs).
+    
+    Args:
+        driver: Chrome/Chromium WebDriver (undetected_chromedriver included)
+        profile: Key of RESOURCE_BLOCKING_PROFILES
+        reset: With 'off', also lift a profile applied earlier (otherwise 'off' is a no-op)
     
-    def find_matching_game(self, steam_game: Dict, psn_games: List[PSNGame]) -> Tuple[Optional[PSNGame], float]:
+    Returns:
+        True if the profile was applied (always True for 'off' without reset)
+    """
+    patterns = RESOURCE_BLOCKING_PROFILES.get(profile)
+    if patterns is None:
+        logger.warning(f"Unknown resource blocking profile '{profile}', nothing blocked")
+        return False
+    if not patterns and not reset:
+        return True
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        logger.info(f"Resource blocking profile '{profile}' applied ({len(patterns)} patterns)")
+        return True
+    except Exception as e:
+        logger.warning(f"Could not apply resource blocking ({profile}): {e}")
+        return False
+
+
+# ===========================================
+# DEBUG ARTIFACT CAPTURE
+# ===========================================
+
+class DebugCapture:
+    """
+    Opt-in capture of debug artifacts (page sources, screenshots).
+
+    Off by default. When enabled, routine captures are sampled at sample_rate
+    and each artifact kind keeps only its last `keep` files, written to
+    rotating slots under directory/<kind>/. Producers are callables so nothing
+    (page snapshots, screenshot encoding) is computed for skipped captures.
+    """
+
+    def __init__(self, directory: str = 'debug_artifacts', enabled: bool = False,
+                 sample_rate: float = 1.0, keep: int = 10):
+        self.directory = directory
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.keep = keep
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, enabled: bool = None, sample_rate: float = None, keep: int = None):
+        """Change settings at runtime (None leaves a setting unchanged)"""
+        if enabled is not None:
+            self.enabled = enabled
+        if sample_rate is not None:
+            self.sample_rate = max(0.0, min(1.0, sample_rate))
+        if keep is not None:
+            self.keep = max(1, keep)
+
+    def capture(self, kind: str, ext: str, producer: Callable[[], Any], always: bool = False) -> Optional[str]:
         """
-        Find the best matching PSN game for a Steam game
+        Write one artifact if capture is enabled and the sample is taken.
         
         Args:
-            steam_game: Steam game dictionary
-            psn_games: List of PSN games from search results
-            
+            kind: Artifact type, e.g. 'page', 'captcha_page', 'screenshot'
+            ext: File extension ('html', 'png', ...)
+            producer: Returns the artifact as str or bytes; only called when captured
+            always: Bypass sampling (error paths), still requires enabled
+        
         Returns:
-            Tuple of (matched PSN game, confidence score)
+            Path written, or None if skipped or failed
         """
-        if not psn_games:
-            return None, 0.0
-        
-        steam_name = steam_game.get('name', '').lower()
-        steam_name_normalized = self.normalize_game_name(steam_name)
-        
-        best_match = None
-        best_score = 0.0
-        
-        # First, try to find full games
-        full_games = [game for game in psn_games if game.game_type == "Full Game"]
-        
-        # If no full games found, try all game types
-        search_games = full_games if full_games else psn_games
-        
-        for psn_game in search_games:
-            psn_name = psn_game.name.lower()
-            psn_name_normalized = self.normalize_game_name(psn_name)
-            
-            # Calculate similarity score
-            score = self._calculate_similarity_score(
-                steam_name_normalized, 
-                psn_name_normalized,
-                steam_name,
-                psn_name
-            )
-            
-            # Bonus points for exact platform matches (like "6" in name)
-            if steam_name_normalized == psn_name_normalized:
-                score += 0.3
-            
-            # Bonus points for full games
-            if psn_game.game_type == "Full Game":
-                score += 0.2
-            
-            # Check for numerical sequences (like "5", "6" in game names)
-            steam_numbers = re.findall(r'\d+', steam_name_normalized)
-            psn_numbers = re.findall(r'\d+', psn_name_normalized)
-            if steam_numbers and psn_numbers and steam_numbers == psn_numbers:
-                score += 0.15
-            
-            # Penalty for different types
-            if 'dlc' in psn_name_normalized and 'dlc' not in steam_name_normalized:
-                score -= 0.2
-            
-            # Update best match
-            if score > best_score:
-                best_score = score
-                best_match = psn_game
+        if not self.enabled or (not always and random.random() >= self.sample_rate):
+            return None
         
-        if best_match and best_score > 0.6:
-            best_match.matched_steam_game = steam_game
-            best_match.match_confidence = best_score
-            return best_match, best_score
+        with self._lock:
+            count = self._counters.get(kind, 0)
+            self._counters[kind] = count + 1
         
-        return None, 0.0
+        kind_dir = os.path.join(self.directory, kind)
+        path = os.path.join(kind_dir, f"{count % self.keep:03d}.{ext}")
+        try:
+            data = producer()
+            os.makedirs(kind_dir, exist_ok=True)
+            if isinstance(data, str):
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(data)
+            else:
+                with open(path, 'wb') as f:
+                    f.write(data)
+            logger.debug(f"Debug artifact saved: {path}")
+            return path
+        except Exception as e:
+            logger.warning(f"Could not save debug artifact {kind}: {e}")
+            return None
+
+    def page_source(self, kind: str, page: 'PageSnapshot', limit: int = None, always: bool = False) -> Optional[str]:
+        """Capture a page snapshot's HTML (optionally truncated to limit characters)"""
+        return self.capture(kind, 'html', lambda: page.source[:limit] if limit else page.source, always)
+
+    def screenshot(self, kind: str, driver, always: bool = False) -> Optional[str]:
+        """Capture a PNG screenshot of the current page"""
+        return self.capture(kind, 'png', driver.get_screenshot_as_png, always)
+
+    def stats(self) -> Dict[str, Any]:
+        """Current settings and number of artifacts captured per kind in this process"""
+        with self._lock:
+            counters = dict(self._counters)
+        return {
+            'enabled': self.enabled,
+            'sample_rate': self.sample_rate,
+            'keep': self.keep,
+            'directory': self.directory,
+            'captured': counters,
+        }
+
+
+_shared_debug_capture: Optional[DebugCapture] = None
+
+
+def get_debug_capture() -> DebugCapture:
+    """Return the process-wide DebugCapture (disabled until configured)"""
+    global _shared_debug_capture
+    if _shared_debug_capture is None:
+        _shared_debug_capture = DebugCapture()
+    return _shared_debug_capture
+
+
+# ===========================================
+# PAGE READINESS & LATENCY TRACKING
+# ===========================================
+
+# Selectors that mean SteamDB has rendered a result table (or an empty one)
+STEAMDB_RESULT_SELECTORS = ('tr.app', 'a[href^="/app/"]', 'td.dataTables_empty')
+
+_READINESS_SCRIPT = """
+var selectors = arguments[0];
+var found = selectors.length === 0;
+for (var i = 0; i < selectors.length && !found; i++) {
+    if (document.querySelector(selectors[i])) { found = true; }
+}
+// Element and title lookups only: reading body text every poll costs megabytes on big tables
+var title = document.title || '';
+var challenge = title.indexOf('Just a moment') !== -1
+    || title.indexOf('Attention Required') !== -1
+    || !!document.querySelector('[id^="challenge-"], [id^="cf-challenge"], .cf-browser-verification, iframe[src*="challenges.cloudflare.com"]');
+return [document.readyState, found, challenge];
+"""
+
+
+def wait_for_page_ready(driver, selectors: Tuple[str, ...] = (), timeout: float = 15.0,
+                        poll: float = 0.1) -> str:
+    """
+    Wait until the page is usable instead of sleeping a fixed time.
     
-    def _calculate_similarity_score(self, name1: str, name2: str, original1: str, original2: str) -> float:
+    Ready means document.readyState is 'complete', no challenge markers are
+    present and (if selectors are given) at least one selector matches. All
+    three are read with a single execute_script per poll.
+    
+    Args:
+        driver: Selenium WebDriver
+        selectors: CSS selectors of which at least one must be present
+        timeout: Seconds to wait before giving up
+        poll: Seconds between checks
+    
+    Returns:
+        'ready', 'challenge' (challenge still showing at timeout) or 'timeout'
+    """
+    deadline = time.monotonic() + timeout
+    state = 'timeout'
+    while True:
+        try:
+            ready_state, found, challenge = driver.execute_script(_READINESS_SCRIPT, list(selectors))
+            if ready_state == 'complete' and found and not challenge:
+                return 'ready'
+            state = 'challenge' if challenge else 'timeout'
+        except Exception as e:
+            logger.debug(f"Readiness check failed: {e}")
+        if time.monotonic() >= deadline:
+            return state
+        time.sleep(poll)
+
+
+# Text of an element the way BeautifulSoup's get_text(strip=True) builds it:
+# every text node stripped, then concatenated without a separator.
+_JS_STRIPPED_TEXT = """
+function strippedText(el) {
+    var walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    var out = '', node;
+    while ((node = walker.nextNode())) { out += node.nodeValue.trim(); }
+    return out;
+}
+"""
+
+# [[appid, name], ...] for every tr.app row of the first .table (two cells or more)
+_JS_TABLE_ROWS = _JS_STRIPPED_TEXT + """
+var table = document.querySelector('table.table');
+if (!table) { return '[]'; }
+var rows = table.querySelectorAll('tr.app'), out = [];
+for (var i = 0; i < rows.length; i++) {
+    var cells = rows[i].querySelectorAll('td');
+    if (cells.length >= 2) { out.push([strippedText(cells[0]), strippedText(cells[1])]); }
+}
+return JSON.stringify(out);
+"""
+
+# [[appid, name], ...] for links whose first attribute is href="/app/<id>/", first per appid
+_JS_APP_LINKS = _JS_STRIPPED_TEXT + """
+var links = document.getElementsByTagName('a'), seen = {}, out = [];
+for (var i = 0; i < links.length; i++) {
+    var first = links[i].attributes[0];
+    if (!first || first.name !== 'href') { continue; }
+    var match = /^\\/app\\/(\\d+)\\/$/.exec(first.value);
+    if (!match || seen[match[1]]) { continue; }
+    var name = strippedText(links[i]).replace(/\\s+/g, ' ').trim().replace(/[®©™]/g, '').trim();
+    if (name.length > 2) { seen[match[1]] = true; out.push([match[1], name]); }
+}
+return JSON.stringify(out);
+"""
+
+
+def extract_rows_in_browser(driver, script: str) -> Optional[List[List[str]]]:
+    """
+    Run an extraction script that returns its rows as one JSON string.
+    
+    Returns:
+        Decoded rows, or None if the script could not run (caller falls back
+        to parsing page_source)
+    """
+    try:
+        return json.loads(driver.execute_script(script))
+    except Exception as e:
+        logger.debug(f"In-browser extraction failed: {e}")
+        return None
+
+
+class PageSnapshot:
+    """
+    One read of the browser DOM (source, URL, time taken).
+
+    Every check and parser working on the same page state shares the snapshot
+    instead of pulling driver.page_source again; the lowercase copy and the
+    BeautifulSoup tree are built on first use.
+    """
+
+    def __init__(self, source: str, url: str):
+        self.source = source
+        self.url = url
+        self.taken_at = time.time()
+        self._lower: Optional[str] = None
+        self._soup: Optional[BeautifulSoup] = None
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.source.lower()
+        return self._lower
+
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.source, 'html.parser')
+        return self._soup
+
+
+class LatencyTracker:
+    """Rolling window of durations with percentile reporting"""
+
+    def __init__(self, name: str, window: int = 500):
+        self.name = name
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentiles(self, points: Tuple[int, ...] = (50, 90, 99)) -> Dict[str, float]:
+        """Nearest-rank percentiles in milliseconds (empty dict without samples)"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return {}
+        return {
+            f"p{point}": samples[min(len(samples) - 1, math.ceil(point / 100 * len(samples)) - 1)] * 1000
+            for point in points
+        }
+
+    def log(self, seconds: float):
+        """Record a sample and log it together with the running percentiles"""
+        self.record(seconds)
+        stats = self.percentiles()
+        logger.info(
+            f"{self.name} latency {seconds * 1000:.0f} ms "
+            f"(p50 {stats['p50']:.0f} ms, p90 {stats['p90']:.0f} ms, p99 {stats['p99']:.0f} ms, n={len(self._samples)})"
+        )
+
+
+_latency_trackers: Dict[str, LatencyTracker] = {}
+
+
+def get_latency_tracker(name: str) -> LatencyTracker:
+    """Return the process-wide LatencyTracker for name"""
+    if name not in _latency_trackers:
+        _latency_trackers[name] = LatencyTracker(name)
+    return _latency_trackers[name]
+
+
+# ===========================================
+# STEAMDB APP / TECHNOLOGY STORE
+# ===========================================
+
+def steam_game_entry(appid: str, name: str, base_url: str = "https://steamdb.info") -> Dict:
+    """Build the game dict used for SteamDB technology listings"""
+    return {
+        'appid': appid,
+        'name': name,
+        'steam_link': f"https://store.steampowered.com/app/{appid}/",
+        'steamdb_link': f"{base_url}/app/{appid}/",
+        'image_link': f"https://shared.fastly.steamstatic.com/store_item_assets/steam/apps/{appid}/capsule_231x87.jpg",
+    }
+
+
+class SteamAppStore:
+    """
+    Persistent (SQLite) store of SteamDB apps and technology listings.
+
+    Holds per-appid names and technologies (with fetched_at) and the game lists
+    of each technology page, so the browser is only used when data is missing
+    or older than its max age. Listings are keyed by the technology link
+    (/tech/<Category>/<Name>/), since names repeat across categories.
+    """
+
+    DEFAULT_MAX_AGE = {
+        'technologies': 30 * 24 * 60 * 60,  # 30 days - an app's tech stack rarely changes
+        'empty': 24 * 60 * 60,              # 1 day - "no technologies" may be a SteamDB gap
+        'listing': 7 * 24 * 60 * 60,        # 7 days - games per technology
+    }
+
+    def __init__(self, path: str = 'steamdb_apps.sqlite3', max_age: Dict[str, int] = None):
         """
-        Calculate similarity score between two names
-        
         Args:
-            name1: First normalized name
-            name2: Second normalized name
-            original1: First original name
-            original2: Second original name
-            
-        Returns:
-            Similarity score between 0 and 1
+            path: SQLite database file
+            max_age: Optional per-kind freshness overrides in seconds
         """
-        from difflib import SequenceMatcher
-        
-        # Basic sequence matcher
-        score = SequenceMatcher(None, name1, name2).ratio()
-        
-        # Boost score if originals are very similar
-        original_score = SequenceMatcher(None, original1.lower(), original2.lower()).ratio()
-        if original_score > 0.8:
-            score = min(1.0, score + 0.2)
-        
-        # Penalty if lengths differ significantly
-        length_diff = abs(len(name1) - len(name2))
-        if length_diff > 5:
-            score -= min(0.2, length_diff * 0.02)
-        
-        # Boost if key words match
-        key_words1 = set(name1.split())
-        key_words2 = set(name2.split())
-        common = key_words1.intersection(key_words2)
-        if len(common) > 1:
-            score += len(common) * 0.1
-        
-        # Check for series names
-        series_keywords = ['assassins creed', 'final fantasy', 'call of duty']
-        for keyword in series_keywords:
-            if keyword in name1 and keyword in name2:
-                score += 0.15
+        self.path = path
+        self.max_age = dict(self.DEFAULT_MAX_AGE)
+        if max_age:
+            self.max_age.update(max_age)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            """CREATE TABLE IF NOT EXISTS apps (
+                appid TEXT PRIMARY KEY,
+                name TEXT,
+                technologies TEXT,
+                fetched_at REAL
+            );
+            CREATE TABLE IF NOT EXISTS tech_listings (
+                link TEXT PRIMARY KEY,
+                tech_name TEXT,
+                expected_count INTEGER,
+                pages INTEGER NOT NULL,
+                complete INTEGER NOT NULL,
+                fetched_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS tech_games (
+                link TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                appid TEXT NOT NULL,
+                PRIMARY KEY (link, position)
+            );"""
+        )
+        self._conn.commit()
+
+    def get_technologies(self, appid: str) -> Optional[List[str]]:
+        """Return the stored technologies for appid if fresh, else None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT technologies, fetched_at FROM apps WHERE appid = ?", (str(appid),)
+            ).fetchone()
+        if not row or row[0] is None:
+            return None
+        technologies = json.loads(row[0])
+        max_age = self.max_age['technologies'] if technologies else self.max_age['empty']
+        if time.time() - row[1] > max_age:
+            return None
+        return technologies
+
+    def put_technologies(self, appid: str, technologies: List[str], name: str = None):
+        """Store the technologies fetched for appid"""
+        with self._lock:
+            self._conn.execute(
+                """INSERT INTO apps (appid, name, technologies, fetched_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT (appid) DO UPDATE SET name = COALESCE(excluded.name, apps.name),
+                technologies = excluded.technologies, fetched_at = excluded.fetched_at""",
+                (str(appid), name or None, json.dumps(technologies), time.time())
+            )
+            self._conn.commit()
+
+    def get_listing(self, tech_link: str, max_pages: int, max_age: float = None,
+                    expected_count: int = 0) -> Optional[List[Dict]]:
+        """
+        Return the stored game list for a technology if it is fresh and covers
+        at least max_pages pages (or the whole listing), else None.
         
-        return max(0.0, min(1.0, score))
+        Args:
+            tech_link: Technology page link (identifies the technology within its category)
+            max_age: Freshness in seconds (defaults to max_age['listing'])
+            expected_count: The technology's current game count; a listing stored
+                for a different count is stale however fresh it is (0 skips the check)
+        """
+        max_age = self.max_age['listing'] if max_age is None else max_age
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT pages, complete, fetched_at, expected_count FROM tech_listings WHERE link = ?", (tech_link,)
+            ).fetchone()
+            if not row or time.time() - row[2] > max_age:
+                return None
+            if expected_count and row[3] != expected_count:
+                return None
+            if not row[1] and row[0] < max_pages:
+                return None
+            rows = self._conn.execute(
+                """SELECT tg.appid, apps.name FROM tech_games tg JOIN apps ON apps.appid = tg.appid
+                WHERE tg.link = ? ORDER BY tg.position""", (tech_link,)
+            ).fetchall()
+        return [steam_game_entry(appid, name) for appid, name in rows]
+
+    def put_listing(self, tech_link: str, tech_name: str, games: List[Dict], pages: int,
+                    complete: bool, expected_count: int = 0):
+        """Replace the stored game list for a technology (app names are upserted)"""
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                """INSERT INTO apps (appid, name) VALUES (?, ?)
+                ON CONFLICT (appid) DO UPDATE SET name = excluded.name""",
+                [(str(game['appid']), game.get('name')) for game in games]
+            )
+            self._conn.execute("DELETE FROM tech_games WHERE link = ?", (tech_link,))
+            self._conn.executemany(
+                "INSERT INTO tech_games VALUES (?, ?, ?)",
+                [(tech_link, i, str(game['appid'])) for i, game in enumerate(games)]
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tech_listings VALUES (?, ?, ?, ?, ?, ?)",
+                (tech_link, tech_name, expected_count, pages, int(complete), now)
+            )
+            self._conn.commit()
+
+    def listing_status(self, tech_link: str) -> Optional[Dict[str, Any]]:
+        """Expected count, pages, completeness and fetch time of the stored listing (None if never fetched)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expected_count, pages, complete, fetched_at FROM tech_listings WHERE link = ?",
+                (tech_link,)
+            ).fetchone()
+        if not row:
+            return None
+        return {'expected_count': row[0], 'pages': row[1], 'complete': bool(row[2]), 'fetched_at': row[3]}
+    
+    def clear(self):
+        """Drop all stored apps and listings"""
+        with self._lock:
+            self._conn.execute("DELETE FROM apps")
+            self._conn.execute("DELETE FROM tech_listings")
+            self._conn.execute("DELETE FROM tech_games")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Row counts"""
+        with self._lock:
+            apps = self._conn.execute("SELECT COUNT(*) FROM apps").fetchone()[0]
+            with_tech = self._conn.execute("SELECT COUNT(*) FROM apps WHERE technologies IS NOT NULL").fetchone()[0]
+            listings = self._conn.execute("SELECT COUNT(*) FROM tech_listings").fetchone()[0]
+        return {'apps': apps, 'apps_with_technologies': with_tech, 'technology_listings': listings}
+
+
+_shared_app_stores: Dict[str, SteamAppStore] = {}
+
+
+def get_steam_app_store(path: str = 'steamdb_apps.sqlite3') -> SteamAppStore:
+    """Return a process-wide SteamAppStore for path (shared across parser instances)"""
+    if path not in _shared_app_stores:
+        _shared_app_stores[path] = SteamAppStore(path)
+    return _shared_app_stores[path]
 
 
 class SteamDBSeleniumParser:
     """SteamDB parser with Selenium for CAPTCHA handling"""
     
-    def __init__(self, headless=True, region='fi-fi', platform_filter: str = None):
+    def __init__(self, headless=True, region='fi-fi', platform_filter: str = None,
+                 app_store: Optional[SteamAppStore] = None, use_app_store: bool = True,
+                 resource_blocking: str = 'off'):
         """
         Initialize SteamDB parser
         
@@ -1234,12 +3235,22 @@ class SteamDBSeleniumParser:
             headless: Whether to run browser in headless mode
             region: PSN region for PSNScraper
             platform_filter: Filter by platform ('ps4', 'ps5', 'both', or None)
+            app_store: SteamAppStore for technologies/listings (defaults to the shared store)
+            use_app_store: Set False to always scrape with the browser
+            resource_blocking: RESOURCE_BLOCKING_PROFILES key ('off', 'default', 'aggressive');
+                off by default, the 'all' crawl turns it on. It is lifted while a
+                CAPTCHA is solved by hand, since image challenges need images.
         """
         self.headless = headless
+        self.resource_blocking = resource_blocking
         self.driver = None
         self.base_url = "https://steamdb.info"
         self.platform_filter = platform_filter
         self.psn_scraper = PSNScraper(region=region, platform_filter=platform_filter)
+        self.app_store = (app_store or get_steam_app_store()) if use_app_store else None
+        
+        # Snapshot of the current page, dropped on navigation and clicks
+        self._snapshot: Optional[PageSnapshot] = None
         
         # CAPTCHA handling variables
         self.captcha_detected = False
@@ -1250,6 +3261,23 @@ class SteamDBSeleniumParser:
         
         logger.info(f"Initialized SteamDBSeleniumParser (headless={headless}, platform_filter={platform_filter})")
     
+    @property
+    def page(self) -> PageSnapshot:
+        """Snapshot of the current page, read from the browser on first use after a change"""
+        if self._snapshot is None:
+            self._snapshot = PageSnapshot(self.driver.page_source, self.driver.current_url)
+        return self._snapshot
+    
+    def invalidate_snapshot(self):
+        """Forget the page snapshot (call after anything that can change the DOM)"""
+        self._snapshot = None
+    
+    def _wait_ready(self, selectors: Tuple[str, ...] = (), timeout: float = 10) -> str:
+        """wait_for_page_ready on this driver; the page has settled into a new state afterwards"""
+        readiness = wait_for_page_ready(self.driver, selectors, timeout=timeout)
+        self.invalidate_snapshot()
+        return readiness
+    
     def search_psn_games_with_release_dates(self, query: str, max_results: int = 20):
         """
         Wrapper method to search PSN games with release dates.
@@ -1273,17 +3301,22 @@ class SteamDBSeleniumParser:
         Returns:
             Updated list with release dates
         """
-        updated_games = []
-        for game in games:
-            if 'psn_source' in game and 'url' in game['psn_source']:
-                release_date = self.psn_scraper.get_game_release_date(
-                    game['psn_source']['url'],
-                    game['psn_source']['name']
-                )
-                if release_date:
-                    game['psn_source']['release_date'] = release_date
-            updated_games.append(game)
-        return updated_games
+        pending = [game for game in games if 'psn_source' in game and 'url' in game['psn_source']]
+        
+        release_dates = run_bounded_stage(
+            pending,
+            lambda game: self.psn_scraper.get_game_release_date(
+                game['psn_source']['url'],
+                game['psn_source']['name']
+            ),
+            max_workers=self.psn_scraper.max_workers
+        )
+        
+        for game, release_date in zip(pending, release_dates):
+            if release_date:
+                game['psn_source']['release_date'] = release_date
+        
+        return list(games)
 
     def set_platform_filter(self, platform_filter: str):
         """
@@ -1328,6 +3361,7 @@ class SteamDBSeleniumParser:
                 logger.info(f"Attempting Chrome setup with {strategy_name}...")
                 if strategy_func():
                     logger.info(f"✅ ChromeDriver setup successful with {strategy_name}")
+                    apply_resource_blocking(self.driver, self.resource_blocking)
                     return True
             except Exception as e:
                 logger.warning(f"❌ {strategy_name} failed: {str(e)[:100]}")
@@ -1513,8 +3547,8 @@ class SteamDBSeleniumParser:
     def _check_cloudflare(self):
         """Check if Cloudflare challenge is present"""
         try:
-            page_source = self.driver.page_source
-            return "cloudflare" in page_source.lower() or "challenge" in page_source.lower()
+            page_lower = self.page.lower
+            return "cloudflare" in page_lower or "challenge" in page_lower
         except:
             return False
     
@@ -1524,8 +3558,7 @@ class SteamDBSeleniumParser:
         Returns: (bool, str) - (is_captcha_present, captcha_type)
         """
         try:
-            page_source = self.driver.page_source.lower()
-            current_url = self.driver.current_url
+            page_source = self.page.lower
             
             # Check for hCaptcha
             if "hcaptcha" in page_source or "h-captcha" in page_source:
@@ -1583,37 +3616,27 @@ class SteamDBSeleniumParser:
         Returns: (bool, str) - (success, message)
         """
         self.captcha_detected = True
-        self.captcha_url = self.driver.current_url
+        self.captcha_url = self.page.url
         self.captcha_retries += 1
         
-        logger.warning(f"CAPTCHA detected (type: {captcha_type}) at {self.driver.current_url}")
+        logger.warning(f"CAPTCHA detected (type: {captcha_type}) at {self.captcha_url}")
         print("\n" + "="*60)
         print("⚠️ CAPTCHA DETECTED")
         print("="*60)
         print(f"Type: {captcha_type}")
-        print(f"URL: {self.driver.current_url}")
+        print(f"URL: {self.captcha_url}")
         print(f"Context: {context_info}")
         print(f"Retry count: {self.captcha_retries}/{self.max_captcha_retries}")
         print("="*60)
         
-        # Save screenshot for debugging
-        try:
-            timestamp = int(time.time())
-            screenshot_path = f"captcha_detected_{timestamp}.png"
-            self.driver.save_screenshot(screenshot_path)
+        # Save screenshot and page source for debugging (when debug capture is on)
+        debug_capture = get_debug_capture()
+        screenshot_path = debug_capture.screenshot('captcha_screenshot', self.driver, always=True)
+        if screenshot_path:
             print(f"Screenshot saved: {screenshot_path}")
-        except Exception as e:
-            print(f"Could not save screenshot: {e}")
-        
-        # Save page source for debugging
-        try:
-            timestamp = int(time.time())
-            page_source_path = f"captcha_page_{timestamp}.html"
-            with open(page_source_path, 'w', encoding='utf-8') as f:
-                f.write(self.driver.page_source)
+        page_source_path = debug_capture.page_source('captcha_page', self.page, always=True)
+        if page_source_path:
             print(f"Page source saved: {page_source_path}")
-        except Exception as e:
-            print(f"Could not save page source: {e}")
         
         # Different handling based on CAPTCHA type
         if captcha_type == "hcaptcha":
@@ -1637,6 +3660,8 @@ class SteamDBSeleniumParser:
             element = WebDriverWait(self.driver, timeout).until(
                 EC.presence_of_element_located((by, value))
             )
+            # The page changed while we waited
+            self.invalidate_snapshot()
             
             # Check for CAPTCHA after waiting
             if check_captcha:
@@ -1648,6 +3673,7 @@ class SteamDBSeleniumParser:
             
             return element
         except TimeoutException:
+            self.invalidate_snapshot()
             # Check if timeout was due to CAPTCHA
             if check_captcha:
                 is_captcha, captcha_type = self._check_captcha()
@@ -1657,41 +3683,38 @@ class SteamDBSeleniumParser:
             logger.warning(f"Timeout waiting for element: {value}")
             return None
     
-    def navigate_to_url(self, url: str, check_captcha=True):
-        """Navigate to URL and handle Cloudflare/CAPTCHA challenges"""
+    def navigate_to_url(self, url: str, check_captcha=True, ready_selectors: Tuple[str, ...] = ()):
+        """
+        Navigate to URL and handle Cloudflare/CAPTCHA challenges
+        
+        Returns as soon as the page is ready (see wait_for_page_ready) rather than
+        after fixed sleeps; ready_selectors optionally names content that must exist.
+        """
         full_url = url if url.startswith('http') else f"{self.base_url}{url}"
         logger.info(f"Navigating to: {full_url}")
         
         try:
+            start = time.monotonic()
+            self.invalidate_snapshot()
             self.driver.get(full_url)
             
             # Wait for page to load
-            time.sleep(3)
-            
-            # Check for Cloudflare challenge
-            page_source = self.driver.page_source
+            readiness = self._wait_ready(ready_selectors, timeout=10)
             
-            if 'Checking your browser' in page_source or 'cf-browser-verification' in page_source:
+            if readiness == 'challenge':
                 logger.warning("Cloudflare challenge detected")
                 print("\n⚠️ Cloudflare challenge detected. Waiting for it to complete...")
                 
                 # Wait for challenge to complete
-                for i in range(1, 61):
-                    time.sleep(1)
-                    current_source = self.driver.page_source
-                    if 'Checking your browser' not in current_source:
-                        logger.info(f"Cloudflare challenge completed after {i} seconds")
+                for i in range(5, 61, 5):
+                    readiness = self._wait_ready(ready_selectors, timeout=5)
+                    if readiness != 'challenge':
+                        logger.info(f"Cloudflare challenge completed after about {i} seconds")
                         break
-                    
-                    if i % 5 == 0:
-                        print(f"  Still waiting... ({i}/60 seconds)")
+                    print(f"  Still waiting... ({i}/60 seconds)")
                 
                 # Take screenshot
-                try:
-                    self.driver.save_screenshot('cloudflare_complete.png')
-                    logger.info("Saved screenshot after Cloudflare challenge")
-                except:
-                    pass
+                get_debug_capture().screenshot('cloudflare_complete', self.driver)
             
             # Check for CAPTCHA after navigation
             if check_captcha:
@@ -1701,16 +3724,10 @@ class SteamDBSeleniumParser:
                     if not success:
                         return False, message
             
-            # Wait a bit more for content to load
-            time.sleep(2)
+            get_latency_tracker('SteamDB navigation').log(time.monotonic() - start)
             
             # Save page source for debugging
-            try:
-                with open('current_page.html', 'w', encoding='utf-8') as f:
-                    f.write(self.driver.page_source[:50000])
-                logger.info("Saved page source to current_page.html")
-            except:
-                pass
+            get_debug_capture().page_source('current_page', self.page, limit=50000)
             
             logger.info("Navigation successful")
             return True, "success"
@@ -1744,7 +3761,7 @@ class SteamDBSeleniumParser:
                         return None, message
                 
                 # Get page content
-                page_source = self.driver.page_source
+                page_source = self.page.source
                 
                 # Verify we got valid content (not a CAPTCHA page)
                 is_captcha, captcha_type = self._check_captcha()
@@ -1779,10 +3796,25 @@ class SteamDBSeleniumParser:
         print(f"Please visit: {self.driver.current_url}")
         print("Solve the CAPTCHA in the browser window.")
         
+        # Image challenges cannot be solved with images blocked: lift blocking and
+        # reload so the challenge renders in full, then restore it afterwards
+        blocking = self.resource_blocking != 'off'
+        if blocking and apply_resource_blocking(self.driver, 'off', reset=True):
+            self.driver.refresh()
+            self.invalidate_snapshot()
+        try:
+            return self._poll_captcha_solved(wait_time)
+        finally:
+            if blocking:
+                apply_resource_blocking(self.driver, self.resource_blocking)
+    
+    def _poll_captcha_solved(self, wait_time: int) -> bool:
+        """Poll once a second until the CAPTCHA is gone (True) or wait_time runs out (False)"""
         for i in range(wait_time):
             time.sleep(1)
             
-            # Check if CAPTCHA is still present
+            # Check if CAPTCHA is still present (on a fresh snapshot, the user is changing the page)
+            self.invalidate_snapshot()
             is_captcha, captcha_type = self._check_captcha()
             
             if not is_captcha:
@@ -1797,13 +3829,22 @@ class SteamDBSeleniumParser:
         print(f"\n❌ Timeout waiting for CAPTCHA solving")
         return False
     
-    def get_game_technologies(self, appid, game_name=""):
+    def get_game_technologies(self, appid, game_name="", refresh: bool = False):
         """
         Get technologies for a game from the main app page
+        
+        Known appids are answered from the app store without opening the browser
+        unless refresh is set or the stored entry is older than its max age.
         Returns: (list, str, str) - (technologies_list, status_message, captcha_url_if_detected)
         """
         url = f"https://steamdb.info/app/{appid}/"  # NOT /technologies/
         
+        if self.app_store and not refresh:
+            technologies = self.app_store.get_technologies(appid)
+            if technologies is not None:
+                logger.info(f"Technologies for {game_name or appid} served from app store ({len(technologies)})")
+                return technologies, ("success" if technologies else "no_technologies_found"), None
+        
         try:
             logger.info(f"Fetching technologies for {game_name} (AppID: {appid})")
             
@@ -1813,13 +3854,14 @@ class SteamDBSeleniumParser:
             if page_source is None:
                 if "captcha" in status:
                     logger.warning(f"CAPTCHA detected for {game_name}")
-                    return [], "captcha_detected", self.driver.current_url
+                    return [], "captcha_detected", self.page.url
                 else:
                     return [], status, None
             
             # Parse technologies from the main app page
             technologies = []
-            soup = BeautifulSoup(page_source, 'html.parser')
+            # page_source is the current snapshot, so its parsed tree can be reused
+            soup = self.page.soup()
             
             # Find the technologies row - looking for <td>Technologies</td>
             rows = soup.find_all('tr')
@@ -1863,9 +3905,13 @@ class SteamDBSeleniumParser:
                 # Clean up technologies - remove duplicates and sort
                 technologies = list(dict.fromkeys(technologies))
                 technologies.sort()
+                if self.app_store:
+                    self.app_store.put_technologies(appid, technologies, game_name)
                 return technologies, "success", None
             else:
                 logger.info(f"No technologies found for {game_name}")
+                if self.app_store:
+                    self.app_store.put_technologies(appid, [], game_name)
                 return [], "no_technologies_found", None
             
         except Exception as e:
@@ -1917,6 +3963,8 @@ class SteamDBSeleniumParser:
             logger.info("  → Setting anti-detection scripts...")
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
+            apply_resource_blocking(self.driver, self.resource_blocking)
+            
             logger.info("  ✅ SUCCESS with webdriver-manager!")
             logger.info("="*60)
             return True
@@ -1944,6 +3992,8 @@ class SteamDBSeleniumParser:
                 logger.info("  → Setting anti-detection scripts...")
                 self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
                 
+                apply_resource_blocking(self.driver, self.resource_blocking)
+                
                 logger.info("  ✅ SUCCESS with system ChromeDriver!")
                 logger.info("="*60)
                 return True
@@ -1979,6 +4029,8 @@ class SteamDBSeleniumParser:
                     logger.info("  → Setting anti-detection scripts...")
                     self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
                     
+                    apply_resource_blocking(self.driver, self.resource_blocking)
+                    
                     logger.info(f"  ✅ SUCCESS with ChromeDriver at {path}!")
                     logger.info("="*60)
                     return True
@@ -1999,6 +4051,8 @@ class SteamDBSeleniumParser:
             logger.info("  → Setting anti-detection scripts...")
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
+            apply_resource_blocking(self.driver, self.resource_blocking)
+            
             logger.info("  ✅ SUCCESS with default Selenium detection!")
             logger.info("="*60)
             return True
@@ -2034,10 +4088,7 @@ class SteamDBSeleniumParser:
             Tuple: (is_captcha_present, captcha_url, captcha_status_message)
         """
         try:
-            if page_source is None:
-                page_source = self.driver.page_source
-            
-            page_lower = page_source.lower()
+            page_lower = self.page.lower if page_source is None else page_source.lower()
             
             # Check for various CAPTCHA indicators
             captcha_indicators = [
@@ -2096,8 +4147,9 @@ class SteamDBSeleniumParser:
         logger.info(f"Navigating to: {full_url}")
         
         try:
+            self.invalidate_snapshot()
             self.driver.get(full_url)
-            time.sleep(3)  # Wait for page load
+            self._wait_ready()  # Wait for page load
             
             # Check for CAPTCHA
             has_captcha, captcha_url, message = self.check_for_captcha()
@@ -2155,7 +4207,8 @@ class SteamDBSeleniumParser:
         technologies = list(dict.fromkeys(tech for tech in technologies if tech))
         return technologies
     
-    def navigate_to_url_with_turnstile(self, url: str, bypass_turnstile: bool = True, max_retries: int = 3) -> bool:
+    def navigate_to_url_with_turnstile(self, url: str, bypass_turnstile: bool = True, max_retries: int = 3,
+                                       ready_selectors: Tuple[str, ...] = ()) -> bool:
         """
         Navigate to URL (Turnstile solver removed)
         
@@ -2163,6 +4216,7 @@ class SteamDBSeleniumParser:
             url: URL to navigate to
             bypass_turnstile: Ignored (kept for compatibility)
             max_retries: Maximum retry attempts
+            ready_selectors: CSS selectors to wait for (any one) besides document readiness
             
         Returns:
             True if navigation successful, False otherwise
@@ -2172,8 +4226,9 @@ class SteamDBSeleniumParser:
         
         for attempt in range(max_retries):
             try:
+                self.invalidate_snapshot()
                 self.driver.get(full_url)
-                time.sleep(3)  # Wait for page load
+                self._wait_ready(ready_selectors, timeout=10)
                 
                 # Check if navigation successful
                 if 'steamdb.info' in self.driver.current_url:
@@ -2185,31 +4240,76 @@ class SteamDBSeleniumParser:
             if attempt < max_retries - 1:
                 time.sleep(2)
         
-        logger.error(f"Failed to navigate to {full_url} after {max_retries} attempts")
-        return False
+        logger.error(f"Failed to navigate to {full_url} after {max_retries} attempts")
+        return False
+    
+    def _table_state(self) -> Tuple[Any, str]:
+        """(first result row element or None, DataTables info text) of the current table"""
+        rows = self.driver.find_elements(By.CSS_SELECTOR, 'table tbody tr')
+        info = self.driver.find_elements(By.CSS_SELECTOR, '.dataTables_info')
+        return (rows[0] if rows else None), (info[0].text if info else '')
+    
+    def _wait_for_table_redraw(self, old_state: Tuple[Any, str], timeout: float = 10) -> bool:
+        """
+        Wait until the result table has been redrawn after a filter change.
+        
+        The rows rendered before the change still match the readiness selectors,
+        so readiness alone returns straight away on the stale table. Instead wait
+        for the old first row to go stale or the "Showing x of y" text to change,
+        and for the DataTables processing indicator to disappear.
+        """
+        old_row, old_info = old_state
+        
+        def _redrawn(driver):
+            try:
+                if driver.find_elements(By.CSS_SELECTOR, '.dataTables_processing[style*="block"]'):
+                    return False
+                if old_row is not None:
+                    try:
+                        old_row.is_enabled()
+                    except StaleElementReferenceException:
+                        return True
+                info = driver.find_elements(By.CSS_SELECTOR, '.dataTables_info')
+                return bool(info) and info[0].text != old_info
+            except StaleElementReferenceException:
+                return False
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(_redrawn)
+            return True
+        except TimeoutException:
+            logger.warning("Result table did not redraw after the filter change")
+            return False
+        finally:
+            self.invalidate_snapshot()
     
-    def remove_min_reviews_filter(self):
-        """Remove the '≥ 500 reviews' filter from SteamDB page"""
+    def remove_min_reviews_filter(self) -> bool:
+        """
+        Remove the '≥ 500 reviews' filter from SteamDB page
+        
+        Returns:
+            True if the filter was removed (the table has been redrawn on return)
+        """
         try:
-            wait = WebDriverWait(self.driver, 5)
-            
             # Check for active filters
             active_filters = self.driver.find_elements(By.CSS_SELECTOR, '.js-tag-active')
             if not active_filters:
-                return
+                return False
             
             # Find and remove '≥ 500 reviews'
             for filter_elem in active_filters:
                 if '≥ 500 reviews' in filter_elem.text:
+                    old_state = self._table_state()
                     # Click the close button
                     close_btn = filter_elem.find_element(By.CSS_SELECTOR, '.js-tag-close')
                     close_btn.click()
-                    time.sleep(0.5)
+                    self._wait_for_table_redraw(old_state)
                     logger.info("Removed '≥ 500 reviews' filter")
-                    break
+                    return True
                     
         except Exception as e:
             logger.warning(f"Error removing min reviews filter: {e}")
+        return False
     
     def remove_all_filters_if_present(self):
         """Remove all active filters if present"""
@@ -2219,10 +4319,11 @@ class SteamDBSeleniumParser:
             # Find all active tags
             active_tags = self.driver.find_elements(By.CSS_SELECTOR, '.js-tag-active')
             for tag in active_tags:
+                old_state = self._table_state()
                 # Click close button
                 close_btn = tag.find_element(By.CSS_SELECTOR, '.js-tag-close')
                 close_btn.click()
-                time.sleep(0.3)
+                self._wait_for_table_redraw(old_state, timeout=5)
             
             logger.info(f"Removed {len(active_tags)} active filters")
             
@@ -2233,19 +4334,17 @@ class SteamDBSeleniumParser:
         """Get all technology categories"""
         url = f"{self.base_url}/technologies/"
         
-        if not self.navigate_to_url_with_turnstile(url, bypass_turnstile=True):
+        if not self.navigate_to_url_with_turnstile(url, bypass_turnstile=True,
+                                                   ready_selectors=('h2.table-heading',)):
             return {}
         
-        # Remove all filters if present
+        # Remove all filters if present (each removal waits for the table redraw)
         self.remove_all_filters_if_present()
         
-        # Wait for table to load
-        time.sleep(2)
-        
         categories = {}
         
         try:
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            soup = self.page.soup()
             
             # Find all category sections
             category_sections = soup.find_all('h2', class_='table-heading')
@@ -2284,19 +4383,41 @@ class SteamDBSeleniumParser:
             logger.info(f"Found {len(categories)} categories with total {sum(len(v) for v in categories.values())} technologies")
             
             # Save screenshot for debug
-            self.driver.save_screenshot('tech_categories.png')
+            get_debug_capture().screenshot('tech_categories', self.driver)
             
             return categories
             
         except Exception as e:
             logger.error(f"Failed to get technologies: {e}")
-            with open('current_page.html', 'w', encoding='utf-8') as f:
-                f.write(self.driver.page_source)
+            get_debug_capture().page_source('error_page', self.page, always=True)
             return {}
     
+    def stored_games_for_technology(self, tech_link: str, tech_name: str, max_pages: int = 3,
+                                    count: int = 0, max_age: float = None) -> Optional[List[Dict]]:
+        """The app store's listing for a technology as get_games_for_technology would serve it, else None"""
+        if not self.app_store:
+            return None
+        games = self.app_store.get_listing(tech_link, max_pages, max_age=max_age, expected_count=count)
+        if games is not None:
+            logger.info(f"Found {len(games)} games for {tech_name} (app store)")
+        return games
+    
     def get_games_for_technology(self, tech_link: str, tech_name: str, 
-                                max_pages: int = 3, count: int = 0) -> List[Dict]:
-        """Get games for a specific technology"""
+                                max_pages: int = 3, count: int = 0, refresh: bool = False,
+                                max_age: float = None) -> List[Dict]:
+        """
+        Get games for a specific technology
+        
+        A fresh stored listing covering max_pages, recorded for the same game
+        count, is returned without the browser; otherwise the listing is scraped
+        and written back to the app store. max_age overrides the store's listing
+        freshness (seconds).
+        """
+        if not refresh:
+            games = self.stored_games_for_technology(tech_link, tech_name, max_pages, count, max_age=max_age)
+            if games is not None:
+                return games
+        
         if not self.navigate_to_url_with_turnstile(tech_link, bypass_turnstile=True):
             return []
         
@@ -2308,6 +4429,7 @@ class SteamDBSeleniumParser:
         
         games = []
         current_page = 1
+        complete = False
         
         try:
             while current_page <= max_pages:
@@ -2316,20 +4438,26 @@ class SteamDBSeleniumParser:
                 games.extend(current_games)
                 
                 if len(current_games) == 0:
+                    complete = True
                     break
                 
                 # Check for next page
                 next_button = self.driver.find_elements(By.CSS_SELECTOR, '.paginate_container .next')
                 if not next_button or 'disabled' in next_button[0].get_attribute('class'):
+                    complete = True
                     break
                 
-                # Click next
+                # Click next and wait for the next page's rows
+                old_state = self._table_state()
                 next_button[0].click()
-                time.sleep(2)
+                self._wait_for_table_redraw(old_state)
                 
                 current_page += 1
             
             logger.info(f"Found {len(games)} games for {tech_name}")
+            if self.app_store and games:
+                self.app_store.put_listing(tech_link, tech_name, games, min(current_page, max_pages),
+                                           complete, expected_count=count)
             return games
             
         except Exception as e:
@@ -2341,18 +4469,28 @@ class SteamDBSeleniumParser:
         try:
             select_elem = self.driver.find_element(By.CSS_SELECTOR, 'select.js-per-page')
             select = Select(select_elem)
+            if select.first_selected_option.text.strip() == 'All':
+                return
+            old_state = self._table_state()
             select.select_by_visible_text('All')
-            time.sleep(1)
+            self._wait_for_table_redraw(old_state)
             logger.info("Set table filter to 'All'")
         except Exception as e:
             logger.warning(f"Failed to set 'All' filter: {e}")
     
     def _parse_games_from_current_page(self) -> List[Dict]:
         """Parse games from current table"""
+        # One round trip: the browser returns [appid, name] rows as JSON
+        rows = extract_rows_in_browser(self.driver, _JS_TABLE_ROWS)
+        if rows is not None:
+            games = [steam_game_entry(appid, name, self.base_url) for appid, name in rows]
+            logger.info(f"Parsed {len(games)} games from current page")
+            return games
+        
         games = []
         
         try:
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            soup = self.page.soup()
             
             table = soup.find('table', class_='table')
             if table:
@@ -2367,17 +4505,7 @@ class SteamDBSeleniumParser:
                             appid = appid_cell.get_text(strip=True)
                             name = name_cell.get_text(strip=True)
                             
-                            # Get links
-                            steam_link = f"https://store.steampowered.com/app/{appid}/"
-                            steamdb_link = f"{self.base_url}/app/{appid}/"
-                            
-                            games.append({
-                                'appid': appid,
-                                'name': name,
-                                'steam_link': steam_link,
-                                'steamdb_link': steamdb_link,
-                                'image_link': f"https://shared.fastly.steamstatic.com/store_item_assets/steam/apps/{appid}/capsule_231x87.jpg",
-                            })
+                            games.append(steam_game_entry(appid, name, self.base_url))
                     except:
                         continue
             
@@ -2390,10 +4518,17 @@ class SteamDBSeleniumParser:
     
     def _extract_games_regex(self) -> List[Dict]:
         """Extract games directly from page source using regex"""
+        # Same rules evaluated in the browser, returned in one JSON round trip
+        rows = extract_rows_in_browser(self.driver, _JS_APP_LINKS)
+        if rows is not None:
+            games = [steam_game_entry(appid, name, self.base_url) for appid, name in rows]
+            logger.info(f"Regex extraction found {len(games)} games")
+            return games
+        
         games = []
         
         try:
-            page_source = self.driver.page_source
+            page_source = self.page.source
             
             # Pattern to find app links with their text
             # This handles cases with mark tags: <a href="/app/368500/"><mark>Assassin</mark>'s <mark>Creed</mark>® <mark>Syndicate</mark></a>
@@ -2442,14 +4577,16 @@ class SteamDBSeleniumParser:
         logger.info(f"Searching SteamDB for: {query}")
         
         try:
-            if not self.navigate_to_url_with_turnstile(search_url, bypass_turnstile=True):
+            start = time.monotonic()
+            if not self.navigate_to_url_with_turnstile(search_url, bypass_turnstile=True,
+                                                       ready_selectors=STEAMDB_RESULT_SELECTORS):
                 return []
             
             # Remove min reviews filter
             self.remove_min_reviews_filter()
             
             # Wait for search results
-            time.sleep(3)
+            self._wait_ready(STEAMDB_RESULT_SELECTORS, timeout=5)
             
             # Parse results
             games = self._extract_games_regex()
@@ -2458,6 +4595,7 @@ class SteamDBSeleniumParser:
             games = games[:max_results]
             
             logger.info(f"Found {len(games)} games in SteamDB search for '{query}'")
+            get_latency_tracker('SteamDB search').log(time.monotonic() - start)
             
             return games
             
@@ -2480,14 +4618,16 @@ class SteamDBSeleniumParser:
         logger.info(f"Searching SteamDB for architecture: {query}")
         
         try:
-            if not self.navigate_to_url_with_turnstile(search_url, bypass_turnstile=True):
+            start = time.monotonic()
+            if not self.navigate_to_url_with_turnstile(search_url, bypass_turnstile=True,
+                                                       ready_selectors=STEAMDB_RESULT_SELECTORS):
                 return []
             
             # NEW: Remove min reviews filter
             self.remove_min_reviews_filter()
             
             # Wait for search results to load
-            time.sleep(3)
+            self._wait_ready(STEAMDB_RESULT_SELECTORS, timeout=5)
             
             # For search, set to 'All' since results small
             self._change_table_filter_to_all()
@@ -2495,6 +4635,7 @@ class SteamDBSeleniumParser:
             # Parse results
             games = self._parse_games_from_current_page()
             logger.info(f"Found {len(games)} games in SteamDB search for '{query}'")
+            get_latency_tracker('SteamDB search').log(time.monotonic() - start)
             
             return games
             
@@ -2503,18 +4644,26 @@ class SteamDBSeleniumParser:
             return []
     
     def find_psn_matches_for_steam_games(self, steam_games: List[Dict], 
-                                        max_psn_results: int = 5) -> Dict[str, List[Dict]]:
+                                        max_psn_results: int = 5,
+                                        psn_results: Optional[List[PSNGame]] = None) -> Dict[str, List[Dict]]:
         """
         Find PSN matches for Steam games
         
         Args:
             steam_games: List of Steam game dictionaries
             max_psn_results: Maximum PSN results per game
+            psn_results: PSN results already fetched for the same query; every Steam
+                game is matched against this one list (one GameMatcher, no PSN
+                search per game) instead of searching PSN for each game. The
+                caller already holds the list, so the entries then carry no
+                'psn_results' of their own.
         
         Returns:
             Dictionary mapping Steam game names to PSN matches
         """
         matches = {}
+        shared_results = psn_results
+        shared_matcher = GameMatcher(self.psn_scraper, shared_results) if shared_results else None
         
         print(f"\n{'='*60}")
         print("SEARCHING FOR PSN MATCHES")
@@ -2524,20 +4673,27 @@ class SteamDBSeleniumParser:
             game_name = steam_game.get('name', '')
             appid = steam_game.get('appid', '')
             
-            print(f"\n[{i+1}/{len(steam_games)}] Searching PSN for: {game_name}")
-            
-            # Search PSN for this game
-            psn_results = self.psn_scraper.search_games(game_name, max_results=max_psn_results)
+            if shared_matcher:
+                print(f"\n[{i+1}/{len(steam_games)}] Matching: {game_name}")
+                skip_delay = True
+                psn_results = shared_results
+            else:
+                print(f"\n[{i+1}/{len(steam_games)}] Searching PSN for: {game_name}")
+                # Search PSN for this game (known searches come from the product catalog)
+                skip_delay = self.psn_scraper.is_search_cached(game_name)
+                psn_results = self.psn_scraper.search_games(game_name, max_results=max_psn_results)
             
             if not psn_results:
                 print(f"  No PSN results found for '{game_name}'")
                 matches[game_name] = []
                 continue
             
-            print(f"  Found {len(psn_results)} PSN results")
+            if not shared_matcher:
+                print(f"  Found {len(psn_results)} PSN results")
             
             # Find the best match
-            best_match, confidence = self.psn_scraper.find_matching_game(steam_game, psn_results)
+            best_match, confidence = self.psn_scraper.find_matching_game(steam_game, psn_results,
+                                                                         matcher=shared_matcher)
             
             if best_match:
                 print(f"  ✓ Best match: {best_match.name} (confidence: {confidence:.2f})")
@@ -2566,15 +4722,17 @@ class SteamDBSeleniumParser:
             # Store all results
             game_matches = {
                 'steam_game': steam_game,
-                'psn_results': [game.to_dict() for game in psn_results],
                 'best_match': best_match.to_dict() if best_match else None,
                 'match_confidence': confidence
             }
+            if not shared_matcher:
+                game_matches['psn_results'] = [game.to_dict() for game in psn_results]
             
             matches[game_name] = game_matches
             
             # Add delay to avoid rate limiting
-            time.sleep(random.uniform(2, 4))
+            if not skip_delay:
+                time.sleep(random.uniform(2, 4))
         
         print(f"\n{'='*60}")
         print("PSN MATCHING COMPLETE")
@@ -2629,6 +4787,98 @@ class SteamDBSeleniumParser:
         
         return output_data
     
+    def generate_jsonl_output(self, categories: Dict, sources: List[Tuple[str, str, str]],
+                              output_file: str = 'steamdb_psn_combined.jsonl', compression: str = 'none') -> Dict:
+        """
+        Stream the combined output as JSON Lines from the per-technology files.
+        
+        Records are copied one line at a time, so memory stays flat however large
+        the crawl is. The summary metadata goes to a .meta.json sidecar.
+        
+        Args:
+            categories: Category -> technology -> {'link', 'count'} (games not needed)
+            sources: (category, technology, per-technology output file) of finished technologies
+            output_file: Combined JSONL path
+            compression: 'none', 'gzip' or 'zstd'
+            
+        Returns:
+            The summary written to the sidecar file
+        """
+        technologies = {
+            cat_name: {tech_name: {'link': tech_info.get('link'), 'count': tech_info.get('count'), 'games': 0}
+                       for tech_name, tech_info in techs.items()}
+            for cat_name, techs in categories.items()
+        }
+        total_games = total_psn_matches = successful_matches = 0
+        
+        with JsonlWriter(output_file, compression) as writer:
+            for cat_name, tech_name, path in sources:
+                if path.endswith('.json'):
+                    # Written by an earlier non-streaming run
+                    tech_data = _load_technology_file(path) or {}
+                    games = tech_data.get('games', [])
+                    matches = tech_data.get('psn_matches') or {}
+                    for record in _technology_records(cat_name, tech_name, games, matches):
+                        writer.write(record)
+                    game_count = len(games)
+                    match_count = len(matches)
+                    successful = sum(1 for match in matches.values() if match.get('best_match'))
+                else:
+                    for line in iter_jsonl_lines(path):
+                        writer.write_line(line)
+                    tech_metadata = (_load_technology_file(jsonl_summary_path(path)) or {}).get('metadata', {})
+                    game_count = tech_metadata.get('total_games', 0)
+                    match_count = tech_metadata.get('psn_matches', 0)
+                    successful = tech_metadata.get('successful_psn_matches', 0)
+                
+                technologies.setdefault(cat_name, {}).setdefault(tech_name, {})['games'] = game_count
+                total_games += game_count
+                total_psn_matches += match_count
+                successful_matches += successful
+        
+        summary = {
+            'metadata': {
+                'generated_at': datetime.now().isoformat(),
+                'source': 'SteamDB + PSN Store',
+                'steamdb_url': self.base_url,
+                'psn_region': self.psn_scraper.region,
+                'method': 'selenium_automation',
+                'format': 'jsonl',
+                'compression': compression,
+                'records_file': os.path.basename(output_file),
+                'total_records': writer.records,
+                'total_categories': len(technologies),
+                'total_technologies': sum(len(techs) for techs in technologies.values()),
+                'total_steam_games': total_games,
+                'total_psn_matches': total_psn_matches
+            },
+            'technologies': technologies
+        }
+        summary_path = write_jsonl_summary(output_file, summary)
+        
+        logger.info(f"Data saved to {output_file} ({writer.records} records, summary in {summary_path})")
+        
+        print("\n" + "="*60)
+        print("PARSING SUMMARY")
+        print("="*60)
+        print(f"Output file: {output_file}")
+        print(f"Summary file: {summary_path}")
+        print(f"Total categories: {summary['metadata']['total_categories']}")
+        print(f"Total technologies: {summary['metadata']['total_technologies']}")
+        print(f"Total Steam games collected: {total_games}")
+        print(f"Total PSN matches analyzed: {total_psn_matches}")
+        if total_psn_matches:
+            print(f"Successful PSN matches: {successful_matches}")
+        
+        print("\nGames per technology:")
+        for cat_name, techs in technologies.items():
+            for tech_name, tech_info in techs.items():
+                if tech_info.get('games'):
+                    print(f"  {cat_name}/{tech_name}: {tech_info['games']} games")
+        print("="*60)
+        
+        return summary
+    
     def test_psn_search(self, test_query: str = "bloons td 6"):
         """Test PSN search functionality"""
         print(f"\n{'='*60}")
@@ -2660,6 +4910,16 @@ class SteamDBSeleniumParser:
             if game.image_url:
                 print(f"   Image: {game.image_url[:80]}...")
     
+    def driver_alive(self) -> bool:
+        """True if the browser still answers (a crashed Chrome fails every command)"""
+        if not self.driver or not getattr(self.driver, 'session_id', None):
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+    
     def close(self):
         """Close the browser"""
         if self.driver:
@@ -2669,6 +4929,113 @@ class SteamDBSeleniumParser:
             except:
                 logger.warning("Error closing browser")
 
+class SteamDBDriverPool:
+    """
+    A fixed set of SteamDBSeleniumParser instances, each with its own browser.
+
+    Workers take technologies from a shared queue so a long crawl keeps every
+    driver busy; a HostConcurrencyLimiter bounds how many of them hit SteamDB
+    at the same time. A worker whose browser dies puts its item back, restarts
+    the browser once and retires if it dies again, so a crashed Chrome cannot
+    fail the rest of the queue.
+    """
+
+    def __init__(self, size: int = 2, headless: bool = True, max_per_host: int = 2, **parser_kwargs):
+        """
+        Args:
+            size: Number of browsers to start
+            headless: Whether to run the browsers headless
+            max_per_host: Concurrent page loads allowed per host
+            parser_kwargs: Passed through to SteamDBSeleniumParser
+        """
+        self.size = size
+        self.headless = headless
+        self.host_limiter = HostConcurrencyLimiter(default_cap=max_per_host)
+        self.parser_kwargs = parser_kwargs
+        self.parsers: List[SteamDBSeleniumParser] = []
+        self._borrowed: Optional[SteamDBSeleniumParser] = None
+
+    def start(self, first: Optional[SteamDBSeleniumParser] = None) -> int:
+        """
+        Start the browsers (reusing first if given; the caller keeps ownership of
+        it). Returns the number of working drivers; failed setups are closed and
+        left out of the pool.
+        """
+        if first is not None:
+            self._borrowed = first
+            self.parsers.append(first)
+        while len(self.parsers) < self.size:
+            parser = SteamDBSeleniumParser(headless=self.headless, **self.parser_kwargs)
+            if parser.setup_driver_with_turnstile():
+                self.parsers.append(parser)
+            else:
+                logger.warning(f"Driver {len(self.parsers) + 1}/{self.size} failed to start, continuing with fewer")
+                parser.close()
+                break
+        logger.info(f"Driver pool ready with {len(self.parsers)} browser(s)")
+        return len(self.parsers)
+
+    def run(self, items: List[Any], worker: Callable[[SteamDBSeleniumParser, Any], Any]) -> List[Any]:
+        """
+        Process items on the pool, one worker thread per browser.
+        
+        Args:
+            items: Work items (e.g. technologies)
+            worker: Called as worker(parser, item); it should wrap its SteamDB page
+                loads in `pool.host_limiter.slot(url)`
+        
+        Returns:
+            Worker results in the same order as items (None where the worker raised)
+        """
+        work = queue.Queue()
+        for index, item in enumerate(items):
+            work.put((index, item))
+        results: List[Any] = [None] * len(items)
+        
+        def _drain(parser):
+            restarted = False
+            while True:
+                try:
+                    index, item = work.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    results[index] = worker(parser, item)
+                except Exception as e:
+                    logger.error(f"Pool worker failed: {e}")
+                
+                if parser.driver_alive():
+                    continue
+                # The item most likely failed because of the dead browser: let a working driver retry it
+                work.put((index, item))
+                if not restarted and self._restart(parser):
+                    restarted = True
+                    continue
+                logger.warning("Retiring a pool worker whose browser died; the other drivers take the rest")
+                return
+        
+        threads = [threading.Thread(target=_drain, args=(parser,), daemon=True) for parser in self.parsers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def _restart(self, parser: SteamDBSeleniumParser) -> bool:
+        """Replace a dead browser with a new one; True if it started"""
+        logger.warning("Pool browser died, restarting it")
+        parser.close()
+        parser.invalidate_snapshot()
+        return parser.setup_driver_with_turnstile()
+
+    def close(self):
+        """Quit every browser the pool started"""
+        for parser in self.parsers:
+            if parser is not self._borrowed:
+                parser.close()
+        self.parsers = []
+
+
 # Streamlit Integration Functions
 def display_captcha_challenge(captcha_url: str, game_name: str = "", appid: str = ""):
     """
@@ -2809,42 +5176,475 @@ def run_technology_search_streamlit(parser, appid: str, game_name: str = ""):
             # No technologies found
             return [], message, None
 
+# ===========================================
+# STREAMING JSONL OUTPUT
+# ===========================================
+
+OUTPUT_COMPRESSION_SUFFIXES = {'none': '', 'gzip': '.gz', 'zstd': '.zst'}
+
+
+def _output_base(path: str) -> str:
+    """Path without its compression and .json/.jsonl extensions"""
+    for suffix in ('.gz', '.zst'):
+        if path.endswith(suffix):
+            path = path[:-len(suffix)]
+            break
+    for suffix in ('.jsonl', '.json'):
+        if path.endswith(suffix):
+            return path[:-len(suffix)]
+    return path
+
+
+def jsonl_output_path(path: str, compression: str = 'none') -> str:
+    """'out.json' -> 'out.jsonl' / 'out.jsonl.gz' / 'out.jsonl.zst'"""
+    return _output_base(path) + '.jsonl' + OUTPUT_COMPRESSION_SUFFIXES[compression]
+
+
+def jsonl_summary_path(path: str) -> str:
+    """Sidecar file holding the summary metadata of a JSONL output"""
+    return _output_base(path) + '.meta.json'
+
+
+def _open_text_stream(path: str, mode: str, compression: str = None):
+    """
+    Open a text stream for reading ('r'), writing ('w') or appending ('a'), compressed by suffix.
+    
+    Appending to a compressed file adds a new gzip member / zstd frame, which
+    readers decode as one continuous stream.
+    
+    Args:
+        path: File path (.gz -> gzip, .zst -> zstd, anything else plain)
+        mode: 'r', 'w' or 'a'
+        compression: Force 'none', 'gzip' or 'zstd' instead of using the suffix
+    """
+    if compression is None:
+        compression = 'gzip' if path.endswith('.gz') else 'zstd' if path.endswith('.zst') else 'none'
+    
+    if compression == 'gzip':
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    if compression == 'zstd':
+        if not HAS_ZSTD:
+            raise RuntimeError("zstd compression needs the zstandard package: pip install zstandard")
+        raw = open(path, mode + 'b')
+        if mode in ('w', 'a'):
+            stream = zstandard.ZstdCompressor().stream_writer(raw)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+        return io.TextIOWrapper(stream, encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+class JsonlWriter:
+    """
+    Writes one JSON record per line, optionally gzip/zstd compressed.
+    
+    Records go straight to the (compressed) stream, so memory does not grow with
+    the output size. The file is written under a .part name and only renamed
+    into place on a clean close, so an interrupted crawl never leaves a
+    truncated file that looks finished.
+    """
+    
+    def __init__(self, path: str, compression: str = 'none'):
+        self.path = path
+        self.records = 0
+        self._part_path = path + '.part'
+        self._stream = _open_text_stream(self._part_path, 'w', compression)
+    
+    def write(self, record: Dict):
+        self._stream.write(json.dumps(record, ensure_ascii=False))
+        self._stream.write('\n')
+        self.records += 1
+    
+    def write_line(self, line: str):
+        """Write an already serialized record (e.g. copied from another JSONL file)"""
+        self._stream.write(line.rstrip('\n'))
+        self._stream.write('\n')
+        self.records += 1
+    
+    def close(self, keep: bool = True):
+        if self._stream is None:
+            return
+        self._stream.close()
+        self._stream = None
+        if keep:
+            os.replace(self._part_path, self.path)
+        else:
+            os.remove(self._part_path)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close(keep=exc_type is None)
+        return False
+
+
+def iter_jsonl_lines(path: str) -> Iterator[str]:
+    """Yield the raw record lines of a (possibly compressed) JSONL file"""
+    with _open_text_stream(path, 'r') as f:
+        for line in f:
+            if line.strip():
+                yield line
+
+
+def write_jsonl_summary(path: str, summary: Dict) -> str:
+    """Write the summary sidecar for a JSONL output and return its path"""
+    summary_path = jsonl_summary_path(path)
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+    return summary_path
+
+
+def _technology_records(cat_name: str, tech_name: str, games: List[Dict],
+                        psn_matches: Dict = None) -> Iterator[Dict]:
+    """JSONL records of one technology: its games, then its PSN matches"""
+    for game in games:
+        yield {'record': 'game', 'category': cat_name, 'technology': tech_name, 'data': game}
+    for steam_name, match in (psn_matches or {}).items():
+        yield {'record': 'psn_match', 'category': cat_name, 'technology': tech_name,
+               'steam_game': steam_name, 'data': match}
+
+
+# ===========================================
+# CRAWL JOURNAL
+# ===========================================
+
+class CrawlJournal:
+    """
+    Per-technology progress of a run_all_mode crawl (SQLite).
+
+    Each planned (category, technology) is recorded with its link and expected
+    count, then marked running/done/failed with the game count and output file,
+    so an interrupted crawl can be resumed without fetching the categories again.
+    The options the crawl was planned with are kept too, so a resume can tell
+    when it is asked for a different crawl.
+    """
+
+    def __init__(self, path: str = os.path.join('SteamDB', 'crawl_journal.sqlite3')):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS entries (
+                category TEXT NOT NULL,
+                technology TEXT NOT NULL,
+                link TEXT,
+                expected_count INTEGER,
+                status TEXT NOT NULL,
+                game_count INTEGER,
+                output_path TEXT,
+                error TEXT,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (category, technology)
+            )"""
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS options (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._conn.commit()
+
+    def plan(self, work: List[Tuple[str, str, Dict]], options: Dict = None):
+        """Start a new crawl: forget previous entries and record the work list as pending"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute("DELETE FROM options")
+            self._conn.executemany(
+                "INSERT INTO entries VALUES (?, ?, ?, ?, 'pending', NULL, NULL, NULL, ?)",
+                [(cat_name, tech_name, tech_info['link'], tech_info['count'], now)
+                 for cat_name, tech_name, tech_info in work]
+            )
+            self._conn.executemany(
+                "INSERT INTO options VALUES (?, ?)",
+                [(name, json.dumps(value)) for name, value in (options or {}).items()]
+            )
+            self._conn.commit()
+
+    def options(self) -> Dict:
+        """The options the current crawl was planned with (empty for journals without them)"""
+        with self._lock:
+            rows = self._conn.execute("SELECT name, value FROM options").fetchall()
+        return {name: json.loads(value) for name, value in rows}
+
+    def unfinished(self) -> List[Dict]:
+        """Entries of the current crawl that are not done yet"""
+        return [entry for entry in self.entries() if entry['status'] != 'done']
+
+    def _set(self, cat_name: str, tech_name: str, status: str, game_count: int = None,
+             output_path: str = None, error: str = None):
+        with self._lock:
+            self._conn.execute(
+                """UPDATE entries SET status = ?, game_count = ?, output_path = ?, error = ?, updated_at = ?
+                WHERE category = ? AND technology = ?""",
+                (status, game_count, output_path, error, time.time(), cat_name, tech_name)
+            )
+            self._conn.commit()
+
+    def mark_running(self, cat_name: str, tech_name: str):
+        self._set(cat_name, tech_name, 'running')
+
+    def mark_done(self, cat_name: str, tech_name: str, game_count: int, output_path: str):
+        self._set(cat_name, tech_name, 'done', game_count, output_path)
+
+    def mark_failed(self, cat_name: str, tech_name: str, error: str):
+        self._set(cat_name, tech_name, 'failed', error=error)
+
+    def entries(self) -> List[Dict]:
+        """All journal entries in planning order"""
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT category, technology, link, expected_count, status, game_count, output_path, error
+                FROM entries ORDER BY rowid"""
+            ).fetchall()
+        keys = ('category', 'technology', 'link', 'expected_count', 'status', 'game_count', 'output_path', 'error')
+        return [dict(zip(keys, row)) for row in rows]
+
+
+def _load_technology_file(path: str) -> Optional[Dict]:
+    """Read a finished per-technology JSON or JSONL file (None if missing or unreadable)"""
+    try:
+        if path.endswith('.json'):
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        tech_data = {'games': [], 'psn_matches': {}}
+        for line in iter_jsonl_lines(path):
+            record = json.loads(line)
+            if record['record'] == 'game':
+                tech_data['games'].append(record['data'])
+            else:
+                tech_data['psn_matches'][record['steam_game']] = record['data']
+        return tech_data
+    except (OSError, ValueError, KeyError, RuntimeError) as e:
+        logger.warning(f"Could not read {path}: {e}")
+        return None
+
+
+def _technology_max_pages(count: int, max_pages: int) -> int:
+    """Pages to crawl for a technology listing of count games"""
+    if count > 10000:
+        # For large counts, calculate pages needed (100 games per page)
+        games_per_page = 100
+        needed_pages = (count // games_per_page) + 1
+        # Limit to reasonable number to avoid timeout
+        return min(needed_pages, 100)  # Max 100 pages = 10k games
+    return max_pages
+
+
+def plan_incremental_refresh(app_store: Optional[SteamAppStore], work: List[Tuple[str, str, Dict]],
+                             max_pages: int, max_age: float) -> Dict[Tuple[str, str], str]:
+    """
+    Decide which technologies need their game list fetched again.
+    
+    A technology is refetched when it was never crawled, its current count
+    differs from the count at the last crawl, the stored listing is older than
+    max_age, or the last crawl stopped before the pages now requested.
+    
+    Returns:
+        (category, technology) -> reason, for the technologies to refetch
+    """
+    refresh = {}
+    now = time.time()
+    for cat_name, tech_name, tech_info in work:
+        # By link: the same technology name can appear in several categories
+        status = app_store.listing_status(tech_info['link']) if app_store else None
+        if not status:
+            refresh[(cat_name, tech_name)] = 'not crawled yet'
+        elif status['expected_count'] != tech_info['count']:
+            refresh[(cat_name, tech_name)] = f"count changed ({status['expected_count']} -> {tech_info['count']})"
+        elif now - status['fetched_at'] > max_age:
+            refresh[(cat_name, tech_name)] = f"last crawled {(now - status['fetched_at']) / 86400:.1f} days ago"
+        elif not status['complete'] and status['pages'] < _technology_max_pages(tech_info['count'], max_pages):
+            refresh[(cat_name, tech_name)] = 'incomplete'
+    return refresh
+
+
+def _crawl_technology(parser_obj: 'SteamDBSeleniumParser', host_limiter: HostConcurrencyLimiter,
+                      cat_name: str, tech_name: str, tech_info: Dict, args,
+                      journal: Optional[CrawlJournal] = None, refresh: bool = False) -> Dict:
+    """
+    Fetch one technology's games (and optionally PSN matches) and write its JSON file.
+    
+    With args.incremental, technologies not marked refresh are served from the
+    app store (up to args.refresh_after days old) without opening the page.
+    Only real SteamDB page loads hold a host slot and are followed by the pause.
+    
+    Returns:
+        PSN matches found for the technology's games
+    """
+    max_age = args.refresh_after * 86400 if args.incremental and not refresh else None
+    print(f"  Fetching games for {tech_name} ({tech_info['count']} games total)...")
+    tech_psn_matches = {}
+    if journal:
+        journal.mark_running(cat_name, tech_name)
+    try:
+        # Adjust max_pages based on count
+        actual_max_pages = _technology_max_pages(tech_info['count'], args.max_pages)
+        if tech_info['count'] > 10000:
+            print(f"    [{tech_name}] Large dataset: using {actual_max_pages} pages")
+        
+        # A stored listing needs neither a host slot nor the pause
+        games = None if refresh else parser_obj.stored_games_for_technology(
+            tech_info['link'], tech_name, actual_max_pages, tech_info['count'], max_age=max_age
+        )
+        if games is None:
+            with host_limiter.slot(tech_info['link']):
+                games = parser_obj.get_games_for_technology(
+                    tech_info['link'],
+                    tech_name,
+                    max_pages=actual_max_pages,
+                    count=tech_info['count'],
+                    refresh=True
+                )
+                # Pause before releasing the slot: the pause then paces SteamDB per
+                # host (--max-per-host) however many drivers are running
+                time.sleep(5)
+        
+        tech_info['games'] = games
+        print(f"    [{tech_name}] Found {len(games)} games (expected: {tech_info['count']})")
+        
+        # Calculate percentage retrieved
+        if tech_info['count'] > 0:
+            percentage = (len(games) / tech_info['count']) * 100
+            print(f"    [{tech_name}] Retrieved: {percentage:.1f}% of expected")
+        
+        if games and args.find_psn_matches:
+            print(f"    [{tech_name}] Searching for PSN matches...")
+            tech_psn_matches = parser_obj.find_psn_matches_for_steam_games(
+                games, 
+                max_psn_results=args.psn_max_results
+            )
+        
+        # Save individual JSON
+        file_stem = f"{cat_name.lower()}_{tech_name.replace(' ', '_').replace('/', '_').replace('\\', '_')}"
+        metadata = {
+            'generated_at': datetime.now().isoformat(),
+            'category': cat_name,
+            'technology': tech_name,
+            'total_games': len(games),
+            'expected_games': tech_info['count'],
+            'retrieval_rate': f"{(len(games) / tech_info['count'] * 100) if tech_info['count'] > 0 else 0:.1f}%"
+        }
+        
+        if args.output_format == 'jsonl':
+            file_path = jsonl_output_path(os.path.join("SteamDB", file_stem), args.compress)
+            with JsonlWriter(file_path, args.compress) as writer:
+                for record in _technology_records(cat_name, tech_name, games, tech_psn_matches):
+                    writer.write(record)
+            metadata['psn_matches'] = len(tech_psn_matches)
+            metadata['successful_psn_matches'] = sum(1 for match in tech_psn_matches.values() if match.get('best_match'))
+            write_jsonl_summary(file_path, {
+                'metadata': metadata,
+                'technology_info': {'link': tech_info['link'], 'count': tech_info['count']},
+            })
+            # Written once the technology's full list is in; from here on the
+            # combined output reads it back from the file, so don't keep it for the whole crawl
+            tech_info.pop('games', None)
+        else:
+            file_path = os.path.join("SteamDB", file_stem + '.json')
+            tech_data = {
+                'metadata': metadata,
+                'technology_info': tech_info,
+                'games': games,
+                'psn_matches': tech_psn_matches
+            }
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(tech_data, f, indent=2, ensure_ascii=False)
+        
+        print(f"    [{tech_name}] Saved results to {file_path}")
+        
+        if journal:
+            if games or not tech_info['count']:
+                journal.mark_done(cat_name, tech_name, len(games), file_path)
+            else:
+                # Usually a blocked navigation (expired cf_clearance): retry on --resume
+                journal.mark_failed(cat_name, tech_name, "no games returned")
+        
+    except Exception as e:
+        print(f"    [{tech_name}] Error fetching games: {e}")
+        tech_info['games'] = []
+        tech_info['error'] = str(e)
+        if journal:
+            journal.mark_failed(cat_name, tech_name, str(e))
+    
+    return tech_psn_matches
+
+
 def run_all_mode(args):
     """Run the 'all' command mode"""
     print("="*60)
     print("ALL MODE: Fetching all games and architectures")
     print("="*60)
     
-    parser_obj = SteamDBSeleniumParser(headless=args.headless)
-    
-    print("\nSetting up Chrome browser...")
-    if not parser_obj.setup_driver_with_turnstile():
-        print("Failed to setup ChromeDriver. Exiting.")
+    if args.output_format == 'jsonl' and args.compress == 'zstd' and not HAS_ZSTD:
+        print("zstd compression needs the zstandard package: pip install zstandard")
         return
     
-    print("\nFetching technology categories...")
-    categories = parser_obj.get_all_technologies()
+    debug_capture = get_debug_capture()
+    debug_capture.configure(enabled=args.debug_capture, sample_rate=args.debug_sample_rate)
     
-    if not categories:
-        print("\nNo categories found. Check the screenshots and logs.")
-        print("Check saved files: tech_categories.png, current_page.html")
-        return
+    # Create SteamDB folder
+    os.makedirs("SteamDB", exist_ok=True)
+    journal = CrawlJournal()
+    journal_entries = journal.entries() if args.resume else []
+    crawl_options = {'categories': args.categories.split(','), 'limit_tech': args.limit_tech}
+    
+    if journal_entries:
+        # The work list comes from the journal, so these options cannot change a resumed crawl
+        planned = journal.options()
+        if 'categories' in planned and planned['categories'] != crawl_options['categories']:
+            print(f"Warning: --categories is ignored with --resume; the journal's crawl covers "
+                  f"{','.join(planned['categories'])}")
+        if 'limit_tech' in planned and planned['limit_tech'] != crawl_options['limit_tech']:
+            print(f"Warning: --limit-tech is ignored with --resume; the journal's crawl was planned with "
+                  f"--limit-tech {planned['limit_tech']}")
+    elif not args.test and not args.discard_journal:
+        unfinished = journal.unfinished()
+        if unfinished:
+            print(f"\nThe crawl journal has {len(unfinished)} unfinished technologies from an earlier crawl.")
+            print("Continue it with --resume, or pass --discard-journal to plan a new crawl and drop its progress.")
+            return
     
-    target_categories = args.categories.split(',')
-    categories = {k: v for k, v in categories.items() if k in target_categories}
+    parser_obj = SteamDBSeleniumParser(headless=args.headless, resource_blocking=args.resource_blocking)
     
-    if not categories:
-        print(f"\nNo matching categories found from: {target_categories}")
-        print(f"Available categories: {list(categories.keys())}")
+    print("\nSetting up Chrome browser...")
+    if not parser_obj.setup_driver_with_turnstile():
+        print("Failed to setup ChromeDriver. Exiting.")
         return
     
     psn_matches = {}
     
-    # Create SteamDB folder
-    os.makedirs("SteamDB", exist_ok=True)
+    if journal_entries:
+        # Rebuild the work list from the journal instead of re-reading the categories page
+        categories = {}
+        for entry in journal_entries:
+            categories.setdefault(entry['category'], {})[entry['technology']] = {
+                'link': entry['link'],
+                'count': entry['expected_count'],
+            }
+        done = [entry for entry in journal_entries if entry['status'] == 'done']
+        print(f"\nResuming crawl: {len(done)}/{len(journal_entries)} technologies already done")
+    else:
+        print("\nFetching technology categories...")
+        categories = parser_obj.get_all_technologies()
+        
+        if not categories:
+            print("\nNo categories found. Check the logs.")
+            if debug_capture.enabled:
+                print(f"Check saved debug files in: {debug_capture.directory}")
+            else:
+                print("Re-run with --debug-capture to save page sources and screenshots")
+            return
+        
+        target_categories = crawl_options['categories']
+        categories = {k: v for k, v in categories.items() if k in target_categories}
+        
+        if not categories:
+            print(f"\nNo matching categories found from: {target_categories}")
+            print(f"Available categories: {list(categories.keys())}")
+            return
     
     if not args.test:
         print("\nFetching games for technologies...")
+        work = []
         for cat_name, techs in categories.items():
             print(f"\nProcessing {cat_name} category:")
             
@@ -2854,95 +5654,88 @@ def run_all_mode(args):
                 reverse=True
             )
             
-            if args.limit_tech != -1:
+            if args.limit_tech != -1 and not journal_entries:
                 sorted_techs = sorted_techs[:args.limit_tech]
-            
-            for tech_name, tech_info in sorted_techs:
-                if tech_info['count'] < args.min_count:
-                    print(f"  Skipping {tech_name} (count: {tech_info['count']} < {args.min_count})")
-                    continue
-                
-                print(f"  Fetching games for {tech_name} ({tech_info['count']} games total)...")
-                try:
-                    # Adjust max_pages based on count
-                    if tech_info['count'] > 10000:
-                        # For large counts, calculate pages needed (100 games per page)
-                        games_per_page = 100
-                        needed_pages = (tech_info['count'] // games_per_page) + 1
-                        # Limit to reasonable number to avoid timeout
-                        actual_max_pages = min(needed_pages, 100)  # Max 100 pages = 10k games
-                        print(f"    Large dataset: using {actual_max_pages} pages")
-                    else:
-                        actual_max_pages = args.max_pages
-                    
-                    games = parser_obj.get_games_for_technology(
-                        tech_info['link'],
-                        tech_name,
-                        max_pages=actual_max_pages,
-                        count=tech_info['count']
-                    )
-                    
-                    tech_info['games'] = games
-                    print(f"    Found {len(games)} games (expected: {tech_info['count']})")
-                    
-                    # Calculate percentage retrieved
-                    if tech_info['count'] > 0:
-                        percentage = (len(games) / tech_info['count']) * 100
-                        print(f"    Retrieved: {percentage:.1f}% of expected")
-                    
-                    tech_psn_matches = {}
-                    if games and args.find_psn_matches:
-                        print(f"    Searching for PSN matches...")
-                        tech_psn_matches = parser_obj.find_psn_matches_for_steam_games(
-                            games, 
-                            max_psn_results=args.psn_max_results
-                        )
-                        psn_matches.update(tech_psn_matches)
-                    
-                    # Save individual JSON
-                    file_name = f"{cat_name.lower()}_{tech_name.replace(' ', '_').replace('/', '_').replace('\\', '_')}.json"
-                    file_path = os.path.join("SteamDB", file_name)
-                    
-                    tech_data = {
-                        'metadata': {
-                            'generated_at': datetime.now().isoformat(),
-                            'category': cat_name,
-                            'technology': tech_name,
-                            'total_games': len(games),
-                            'expected_games': tech_info['count'],
-                            'retrieval_rate': f"{(len(games) / tech_info['count'] * 100) if tech_info['count'] > 0 else 0:.1f}%"
-                        },
-                        'technology_info': tech_info,
-                        'games': games,
-                        'psn_matches': tech_psn_matches
-                    }
-                    
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump(tech_data, f, indent=2, ensure_ascii=False)
-                    
-                    print(f"    Saved results to {file_path}")
-                    
-                    # Add delay between technologies to avoid rate limiting
-                    time.sleep(5)
-                    
-                except Exception as e:
-                    print(f"    Error fetching games: {e}")
-                    tech_info['games'] = []
-                    tech_info['error'] = str(e)
+            
+            for tech_name, tech_info in sorted_techs:
+                if tech_info['count'] < args.min_count:
+                    print(f"  Skipping {tech_name} (count: {tech_info['count']} < {args.min_count})")
+                    continue
+                work.append((cat_name, tech_name, tech_info))
+        
+        if journal_entries:
+            completed = {(entry['category'], entry['technology']): entry
+                         for entry in journal_entries if entry['status'] == 'done'}
+            for cat_name, tech_name, tech_info in work:
+                entry = completed.get((cat_name, tech_name))
+                if entry:
+                    print(f"  Already done: {tech_name} ({entry['game_count']} games)")
+            work = [item for item in work if (item[0], item[1]) not in completed]
+        else:
+            journal.plan(work, crawl_options)
+        
+        refresh_plan = {}
+        if args.incremental:
+            refresh_plan = plan_incremental_refresh(parser_obj.app_store, work, args.max_pages,
+                                                    args.refresh_after * 86400)
+            print(f"\nIncremental refresh: {len(refresh_plan)}/{len(work)} technologies changed or stale")
+            for (cat_name, tech_name), reason in refresh_plan.items():
+                print(f"  Refetching {cat_name}/{tech_name}: {reason}")
+        
+        pool = SteamDBDriverPool(size=max(1, args.drivers), headless=args.headless,
+                                 max_per_host=args.max_per_host, resource_blocking=args.resource_blocking)
+        if args.drivers > 1 and work:
+            print(f"\nStarting {args.drivers} browsers (max {args.max_per_host} concurrent SteamDB page loads)...")
+        pool.start(first=parser_obj)
+        
+        results = pool.run(
+            work,
+            lambda worker_parser, item: _crawl_technology(worker_parser, pool.host_limiter, *item, args, journal=journal,
+                                                          refresh=(item[0], item[1]) in refresh_plan)
+        )
+        if args.output_format == 'json':
+            for tech_psn_matches in results:
+                if tech_psn_matches:
+                    psn_matches.update(tech_psn_matches)
+        
+        pool.close()
+        
+        # Technologies finished in an earlier run are only read back for the combined output
+        # (jsonl output streams them from their files instead)
+        crawled = {(cat_name, tech_name) for cat_name, tech_name, _ in work}
+        for entry in journal.entries() if args.output_format == 'json' else []:
+            key = (entry['category'], entry['technology'])
+            if entry['status'] != 'done' or key in crawled or entry['category'] not in categories:
+                continue
+            tech_data = _load_technology_file(entry['output_path'])
+            if tech_data:
+                categories[entry['category']][entry['technology']]['games'] = tech_data.get('games', [])
+                psn_matches.update(tech_data.get('psn_matches') or {})
     
-    print(f"\nGenerating summary output: {args.output}")
-    parser_obj.generate_json_output(categories, psn_matches, args.output)
+    if args.output_format == 'jsonl':
+        output_file = jsonl_output_path(args.output, args.compress)
+        print(f"\nGenerating summary output: {output_file}")
+        sources = [
+            (entry['category'], entry['technology'], entry['output_path'])
+            for entry in journal.entries()
+            if entry['status'] == 'done' and entry['category'] in categories
+        ] if not args.test else []
+        parser_obj.generate_jsonl_output(categories, sources, output_file, args.compress)
+    else:
+        output_file = args.output
+        print(f"\nGenerating summary output: {output_file}")
+        parser_obj.generate_json_output(categories, psn_matches, output_file)
     
     print("\n" + "="*60)
     print("PARSING COMPLETE!")
     print("="*60)
     print(f"Individual results saved to SteamDB folder")
-    print(f"Summary output saved to: {args.output}")
+    print(f"Summary output saved to: {output_file}")
     print(f"Log file: steamdb_psn_scraper.log")
-    print(f"Debug files saved:")
-    print(f"  - tech_categories.png (screenshot of categories page)")
-    print(f"  - current_page.html (HTML of last page visited)")
-    print(f"  - psn_search_debug.html (PSN search HTML)")
+    if debug_capture.enabled:
+        print(f"Debug files saved to {debug_capture.directory} (last {debug_capture.keep} per type):")
+        for kind, captured in debug_capture.stats()['captured'].items():
+            print(f"  - {kind}: {captured} captured")
     print("="*60)
     
     parser_obj.close()
@@ -2961,9 +5754,18 @@ def run_query_mode(args):
         print("Failed to setup ChromeDriver. Exiting.")
         return
     
-    # Step 1: Query PSN with pagination
+    # Step 1: Query PSN with pagination, printing each page as it arrives
     print(f"\nSearching PSN for '{args.game_query}'...")
-    psn_results = parser_obj.psn_scraper.search_games_with_pagination(args.game_query, max_results=200)
+    psn_scraper = parser_obj.psn_scraper
+    psn_results = []
+    for page_num, page_games in enumerate(psn_scraper.iter_search_pages(args.game_query, max_pages=math.ceil(200 / psn_scraper.SEARCH_PAGE_SIZE)), start=1):
+        psn_results.extend(page_games)
+        print(f"  Page {page_num}: {len(page_games)} results (total so far: {len(psn_results)})")
+        for game in page_games:
+            print(f"    - {game.name} [{game.game_type}]")
+        if len(psn_results) >= 200:
+            break
+    psn_results = psn_scraper.sort_results(psn_results)[:200]
     
     if not psn_results:
         print("No PSN results found.")
@@ -3232,194 +6034,1032 @@ def run_query_mode(args):
     parser_obj.close()
 
 
+def run_psn_mode(args):
+    """Run the 'psn' command mode: several PSN searches at once on AsyncPSNScraper"""
+    if not HAS_HTTPX:
+        print("The psn command needs httpx: pip install 'httpx[http2]'")
+        return
+    
+    async def _search():
+        async with AsyncPSNScraper(region=args.region, platform_filter=args.platform,
+                                   max_workers=args.workers) as scraper:
+            return await scraper.search_many(args.queries, max_results=args.max_results)
+    
+    start = time.time()
+    results = asyncio.run(_search())
+    logger.info(f"{len(args.queries)} PSN searches finished in {time.time() - start:.1f}s")
+    print(json.dumps({query: [game.to_dict() for game in games] for query, games in results.items()},
+                     indent=2, ensure_ascii=False))
+
+
+# ===========================================
+# PATCH SITE CLIENT (prosperopatches.com / orbispatches.com)
+# ===========================================
+
+# Concurrent title loads per patch site (page fetch + loadpatches POST each)
+PATCH_SITE_CONCURRENCY = {
+    'prosperopatches.com': 4,
+    'orbispatches.com': 4,
+}
+
+_patch_site_limiter = HostConcurrencyLimiter(caps=PATCH_SITE_CONCURRENCY)
+
+
+class PatchKeyStore:
+    """
+    Persistent (SQLite) titleid -> loadpatches key cache for the patch sites.
+
+    The key (and the page metadata scraped next to it) is only fetched from the
+    title page once; later lookups go straight to the loadpatches POST. A key
+    the site rejects is dropped and fetched again by PatchSiteClient.
+    """
+
+    KEY_PATTERN = re.compile(r'^[a-f0-9]{64}$')
+    DEFAULT_MAX_AGE = 30 * 24 * 60 * 60  # 30 days
+
+    def __init__(self, path: str = 'patch_keys.sqlite3', max_age: int = DEFAULT_MAX_AGE):
+        """
+        Args:
+            path: SQLite database file
+            max_age: Seconds before a key is fetched again even if not rejected
+        """
+        self.path = path
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS title_keys (
+                site TEXT NOT NULL,
+                titleid TEXT NOT NULL,
+                key TEXT NOT NULL,
+                metadata TEXT,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (site, titleid)
+            )"""
+        )
+        self._conn.commit()
+
+    def get(self, site: str, titleid: str) -> Optional[Tuple[str, Dict]]:
+        """Return (key, page metadata) if a valid, fresh key is stored (counted as hit/miss)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT key, metadata, fetched_at FROM title_keys WHERE site = ? AND titleid = ?",
+                (site, titleid)
+            ).fetchone()
+            if row and self.KEY_PATTERN.match(row[0]) and time.time() - row[2] <= self.max_age:
+                self.hits += 1
+                return row[0], json.loads(row[1] or '{}')
+            self.misses += 1
+            return None
+
+    def put(self, site: str, titleid: str, key: str, metadata: Dict = None):
+        """Store a key scraped from a title page (invalid keys are ignored)"""
+        if not self.KEY_PATTERN.match(key or ''):
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO title_keys VALUES (?, ?, ?, ?, ?)",
+                (site, titleid, key, json.dumps(metadata or {}, ensure_ascii=False), time.time())
+            )
+            self._conn.commit()
+
+    def invalidate(self, site: str, titleid: str):
+        """Forget a key the site rejected"""
+        with self._lock:
+            self._conn.execute("DELETE FROM title_keys WHERE site = ? AND titleid = ?", (site, titleid))
+            self._conn.commit()
+
+    def clear(self):
+        """Drop all stored keys and reset counters"""
+        with self._lock:
+            self._conn.execute("DELETE FROM title_keys")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and per-site key counts"""
+        with self._lock:
+            rows = self._conn.execute("SELECT site, COUNT(*) FROM title_keys GROUP BY site").fetchall()
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': (self.hits / total) if total else 0.0,
+            'entries': dict(rows),
+        }
+
+
+_shared_patch_key_stores: Dict[str, PatchKeyStore] = {}
+
+
+def get_patch_key_store(path: str = 'patch_keys.sqlite3') -> PatchKeyStore:
+    """Return a process-wide PatchKeyStore for path (shared across clients)"""
+    if path not in _shared_patch_key_stores:
+        _shared_patch_key_stores[path] = PatchKeyStore(path)
+    return _shared_patch_key_stores[path]
+
+
+class PatchResultCache:
+    """
+    Persistent (SQLite) cache of per-title patch results, keyed by (site, titleid).
+
+    Cached results are served immediately. An entry is validated against the
+    lastupdated value a search hit carries when there is one; otherwise it is
+    revalidated in the background once it is older than revalidate_after. A
+    revalidation first asks the search API for the title's lastupdated and only
+    downloads the patch list when that value differs or is missing, and the
+    entry is only rewritten when the downloaded patch list or lastupdated differs.
+    """
+
+    DEFAULT_REVALIDATE_AFTER = 12 * 60 * 60  # 12 hours
+
+    def __init__(self, path: str = 'patch_results.sqlite3', revalidate_after: int = DEFAULT_REVALIDATE_AFTER):
+        """
+        Args:
+            path: SQLite database file
+            revalidate_after: Seconds before a served entry is checked against the site again
+        """
+        self.path = path
+        self.revalidate_after = revalidate_after
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.changed = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS patch_results (
+                site TEXT NOT NULL,
+                titleid TEXT NOT NULL,
+                result TEXT NOT NULL,
+                last_updated TEXT,
+                fetched_at REAL NOT NULL,
+                checked_at REAL NOT NULL,
+                PRIMARY KEY (site, titleid)
+            )"""
+        )
+        self._conn.commit()
+
+    def get(self, site: str, titleid: str, last_updated: str = None) -> Optional[Tuple[Dict, bool]]:
+        """
+        Return (cached result, needs background revalidation), or None on a miss.
+        
+        Args:
+            last_updated: Current lastupdated value if already known (e.g. from a
+                search hit); a different stored value counts as a miss
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, last_updated, checked_at FROM patch_results WHERE site = ? AND titleid = ?",
+                (site, titleid)
+            ).fetchone()
+            if not row or (last_updated is not None and str(last_updated) != row[1]):
+                self.misses += 1
+                return None
+            self.hits += 1
+            if last_updated is not None:
+                self._conn.execute(
+                    "UPDATE patch_results SET checked_at = ? WHERE site = ? AND titleid = ?", (now, site, titleid)
+                )
+                self._conn.commit()
+                return json.loads(row[0]), False
+            return json.loads(row[0]), now - row[2] > self.revalidate_after
+
+    def put(self, site: str, titleid: str, result: Dict):
+        """Store a freshly loaded result"""
+        now = time.time()
+        last_updated = result.get('last_updated')
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO patch_results VALUES (?, ?, ?, ?, ?, ?)",
+                (site, titleid, json.dumps(result, ensure_ascii=False),
+                 str(last_updated) if last_updated is not None else None, now, now)
+            )
+            self._conn.commit()
+
+    def confirm(self, site: str, titleid: str, last_updated: str) -> bool:
+        """
+        Mark an entry as checked if its stored lastupdated equals last_updated.
+        
+        Returns:
+            True if the entry is still current (no download needed)
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE patch_results SET checked_at = ? WHERE site = ? AND titleid = ? AND last_updated = ?",
+                (time.time(), site, titleid, str(last_updated))
+            )
+            self._conn.commit()
+            if cursor.rowcount:
+                self.revalidations += 1
+            return cursor.rowcount > 0
+
+    def revalidated(self, site: str, titleid: str, result: Dict) -> bool:
+        """
+        Record a revalidation: the stored result is only replaced if the patch
+        list or the lastupdated value changed.
+        
+        The patches themselves are compared because lastupdated is not always
+        fresh: Orbis falls back to the page badge kept in the key store, which
+        can be weeks old while the downloaded patch list is current.
+        
+        Returns:
+            True if the stored result was replaced
+        """
+        last_updated = result.get('last_updated')
+        with self._lock:
+            self.revalidations += 1
+            row = self._conn.execute(
+                "SELECT result, last_updated FROM patch_results WHERE site = ? AND titleid = ?", (site, titleid)
+            ).fetchone()
+            unchanged = (
+                row is not None
+                and json.loads(row[0]).get('patches') == json.loads(json.dumps(result.get('patches'), ensure_ascii=False))
+                and (str(last_updated) if last_updated is not None else None) == row[1]
+            )
+            if unchanged:
+                self._conn.execute(
+                    "UPDATE patch_results SET checked_at = ? WHERE site = ? AND titleid = ?",
+                    (time.time(), site, titleid)
+                )
+                self._conn.commit()
+                return False
+            self.changed += 1
+        self.put(site, titleid, result)
+        return True
+
+    def iter_results(self, site: str = None) -> Iterator[Tuple[str, str, Dict]]:
+        """Yield (site, titleid, result) for every cached title (optionally one site only)"""
+        with self._lock:
+            if site:
+                rows = self._conn.execute(
+                    "SELECT site, titleid, result FROM patch_results WHERE site = ?", (site,)
+                ).fetchall()
+            else:
+                rows = self._conn.execute("SELECT site, titleid, result FROM patch_results").fetchall()
+        for row_site, titleid, result in rows:
+            yield row_site, titleid, json.loads(result)
+
+    def signature(self) -> Tuple:
+        """Cheap fingerprint of the cached data (changes whenever a result is stored or removed)"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*), MAX(fetched_at) FROM patch_results").fetchone()
+
+    def clear(self):
+        """Drop all cached results and reset counters"""
+        with self._lock:
+            self._conn.execute("DELETE FROM patch_results")
+            self._conn.commit()
+            self.hits = self.misses = self.revalidations = self.changed = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters, revalidation counts, per-site entries and entry ages (seconds)"""
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute("SELECT site, COUNT(*) FROM patch_results GROUP BY site").fetchall()
+            oldest, newest, unchecked = self._conn.execute(
+                "SELECT MIN(fetched_at), MAX(fetched_at), MIN(checked_at) FROM patch_results"
+            ).fetchone()
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': (self.hits / total) if total else 0.0,
+            'revalidations': self.revalidations,
+            'changed': self.changed,
+            'entries': dict(rows),
+            'oldest_age': (now - oldest) if oldest else None,
+            'newest_age': (now - newest) if newest else None,
+            'longest_unchecked': (now - unchecked) if unchecked else None,
+        }
+
+
+_shared_patch_result_caches: Dict[str, PatchResultCache] = {}
+
+
+def get_patch_result_cache(path: str = 'patch_results.sqlite3') -> PatchResultCache:
+    """Return a process-wide PatchResultCache for path (shared across clients)"""
+    if path not in _shared_patch_result_caches:
+        _shared_patch_result_caches[path] = PatchResultCache(path)
+    return _shared_patch_result_caches[path]
+
+
+class PatchSiteClient:
+    """
+    Client for prosperopatches.com (PS5) and orbispatches.com (PS4).
+
+    Both sites work the same way: /api/internal/search by name, a title page
+    that embeds a 64-hex key, and a /api/internal/loadpatches POST with
+    {titleid, key}. The client keeps one pooled requests.Session per site and
+    caches keys in a PatchKeyStore, so a title seen before costs a single POST.
+    Complete title results are cached in a PatchResultCache and revalidated in
+    the background.
+    """
+
+    SITES = {
+        'prospero': {
+            'base_url': 'https://prosperopatches.com',
+            'title_pattern': r'^PPSA\d{5,}$',
+            'key_patterns': [
+                r'var\s+key\s*=\s*["\']([a-f0-9]{64})["\']',
+                r'"key"\s*:\s*"([a-f0-9]{64})"',
+                r'key:\s*["\']([a-f0-9]{64})["\']',
+                r'data-key=["\']([a-f0-9]{64})["\']',
+                r'loadPatches\(["\']([a-f0-9]{64})["\']',
+            ],
+        },
+        'orbis': {
+            'base_url': 'https://orbispatches.com',
+            'title_pattern': r'^CUSA\d{5,}$',
+            'key_patterns': [
+                r'data-loadparams=["\'][^"\']*"key"\s*:\s*"([a-f0-9]{64})["\']',
+                r'"key"\s*:\s*"([a-f0-9]{64})"',
+                r"'key'\s*:\s*'([a-f0-9]{64})'",
+                r'data-key=["\']([a-f0-9]{64})["\']',
+                r'key:\s*["\']([a-f0-9]{64})["\']',
+            ],
+        },
+    }
+
+    def __init__(self, site: str, session: Optional[requests.Session] = None,
+                 key_store: Optional[PatchKeyStore] = None, use_key_store: bool = True,
+                 result_cache: Optional[PatchResultCache] = None, use_result_cache: bool = True):
+        """
+        Args:
+            site: 'prospero' or 'orbis'
+            session: Session to use (defaults to a new pooled session)
+            key_store: PatchKeyStore for title keys (defaults to the shared store)
+            use_key_store: Set False to always scrape the key from the title page
+            result_cache: PatchResultCache for title results (defaults to the shared cache)
+            use_result_cache: Set False to always load patches from the site
+        """
+        config = self.SITES[site]
+        self.site = site
+        self.base_url = config['base_url']
+        self.title_pattern = re.compile(config['title_pattern'])
+        self.key_patterns = config['key_patterns']
+        self.key_store = (key_store or get_patch_key_store()) if use_key_store else None
+        self.result_cache = (result_cache or get_patch_result_cache()) if use_result_cache else None
+        self._revalidating = set()
+        self._revalidation_lock = threading.Lock()
+        self._revalidation_pool = None
+        
+        if session is None:
+            session = requests.Session()
+            pool_size = PATCH_SITE_CONCURRENCY.get(urlparse(self.base_url).netloc, 2) * 2
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            session.mount('https://', adapter)
+        self.session = session
+
+    def headers(self, kind: str = 'api', referer: str = None) -> Dict[str, str]:
+        """
+        Request headers for an 'api' call, a title 'page' load or the loadpatches 'post'.
+        """
+        headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36",
+            "Accept": "*/*",
+            "sec-ch-ua": '"Not(A:Brand";v="8", "Chromium";v="144", "Google Chrome";v="144"',
+            "sec-ch-ua-mobile": "?0",
+            "sec-ch-ua-platform": '"Windows"',
+            "sec-fetch-site": "same-origin",
+            "sec-fetch-mode": "cors",
+            "sec-fetch-dest": "empty",
+            "referer": referer or f"{self.base_url}/",
+            "accept-encoding": "gzip, deflate, br, zstd",
+            "accept-language": "fi-FI,fi;q=0.9,en-US;q=0.8,en;q=0.7",
+            "priority": "u=1, i",
+        }
+        if kind == 'page':
+            headers.update({
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+                "sec-fetch-mode": "navigate",
+                "sec-fetch-dest": "document",
+                "upgrade-insecure-requests": "1",
+                "priority": "u=0, i",
+            })
+        elif kind == 'post':
+            headers.update({
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "origin": self.base_url,
+            })
+        return headers
+
+    def is_title_id(self, query: str) -> bool:
+        """True if query is a title ID of this site (PPSA##### / CUSA#####)"""
+        return bool(self.title_pattern.match(query.strip().upper()))
+
+    @classmethod
+    def site_for_title_id(cls, titleid: str) -> Optional[str]:
+        """'prospero' for PPSA IDs, 'orbis' for CUSA IDs, None for anything else (no client is built)"""
+        titleid = titleid.strip().upper()
+        for site, config in cls.SITES.items():
+            if re.match(config['title_pattern'], titleid):
+                return site
+        return None
+
+    def search(self, term: str) -> List[Dict]:
+        """
+        Search the site by name.
+        
+        Returns:
+            Search hits (titleid, name, region, icon), [] when nothing matched
+        
+        Raises:
+            requests.HTTPError: If the search request failed
+        """
+        response = self.session.get(f"{self.base_url}/api/internal/search", params={"term": term},
+                                    headers=self.headers('api'), timeout=15)
+        if response.status_code != 200:
+            logger.error(f"Search failed with status {response.status_code}")
+            raise requests.HTTPError(f"HTTP {response.status_code}")
+        search_data = response.json()
+        if not search_data.get("success"):
+            return []
+        return search_data.get("results") or []
+
+    def current_last_updated(self, titleid: str) -> Optional[str]:
+        """lastupdated of a title as the search API reports it now (None if the site gives none)"""
+        for hit in self.search(titleid):
+            if str(hit.get("titleid", "")).upper() == titleid.upper():
+                return hit.get("lastupdated")
+        return None
+
+    def _extract_key(self, page_text: str) -> Optional[str]:
+        """Find the loadpatches key in a title page"""
+        for pattern in self.key_patterns:
+            match = re.search(pattern, page_text)
+            if match:
+                return match.group(1)
+        
+        if self.site == 'prospero':
+            # Try to find it in the first script tag
+            script_match = re.search(r'<script[^>]*>(.*?)</script>', page_text, re.DOTALL)
+            page_text = script_match.group(1) if script_match else ''
+        # Fallback: any 64-char hex string
+        key_match = re.search(r'([a-f0-9]{64})', page_text)
+        return key_match.group(1) if key_match else None
+
+    def _parse_page_metadata(self, page_text: str, name: str = None) -> Dict[str, Any]:
+        """Sidebar metadata of an ORBISPatches title page (content ID, publisher, last updated, icon)"""
+        metadata = {}
+        if self.site != 'orbis':
+            return metadata
+        try:
+            soup = BeautifulSoup(page_text, 'html.parser')
+            # Sidebar info items
+            for li in soup.select('li.bd-links-group'):
+                heading = li.find(class_='bd-links-heading')
+                if heading:
+                    label = heading.get_text(strip=True).lower()
+                    # Get the text that follows the heading within the <li>
+                    full_text = li.get_text(strip=True)
+                    value = full_text.replace(heading.get_text(strip=True), '', 1).strip()
+                    # Strip any nested link text
+                    value = re.sub(r'\s*View\s*', '', value).strip()
+                    if 'content id' in label:
+                        metadata['content_id'] = value
+                    elif 'publisher' in label and 'id' not in label:
+                        metadata['publisher'] = value
+            # Last updated badge
+            badge = soup.find('div', class_='bd-badge')
+            if badge and 'last updated' in badge.get_text().lower():
+                metadata['last_updated'] = badge.get_text(strip=True).replace('Last updated', '').strip()
+            # Icon from header bg
+            img = soup.find('img', alt=name) if name else None
+            if img:
+                metadata['icon'] = img.get('src')
+        except Exception as parse_err:
+            logger.debug(f"Metadata parse error: {parse_err}")
+        return metadata
+
+    def title_key(self, titleid: str, name: str = None, refresh: bool = False) -> Optional[Tuple[str, Dict, bool]]:
+        """
+        Key (and page metadata) for a title, from the key store or the title page.
+        
+        Returns:
+            (key, metadata, served from the key store) or None if no key was found
+        """
+        if self.key_store and not refresh:
+            cached = self.key_store.get(self.site, titleid)
+            if cached:
+                return cached[0], cached[1], True
+        
+        page_url = f"{self.base_url}/{titleid}"
+        page_response = self.session.get(page_url, headers=self.headers('page'), timeout=15)
+        if page_response.status_code != 200:
+            logger.warning(f"Could not load page for {titleid}: HTTP {page_response.status_code}")
+            return None
+        
+        key = self._extract_key(page_response.text)
+        if not key:
+            logger.warning(f"Could not extract key for {titleid}")
+            logger.debug(f"Page content sample: {page_response.text[:500]}")
+            return None
+        logger.info(f"Found key for {titleid}")
+        
+        metadata = self._parse_page_metadata(page_response.text, name)
+        if self.key_store:
+            self.key_store.put(self.site, titleid, key, metadata)
+        return key, metadata, False
+
+    def _post_loadpatches(self, titleid: str, key: str) -> Optional[Dict]:
+        """POST {titleid, key} to loadpatches; None if the site rejected it"""
+        patch_response = self.session.post(
+            f"{self.base_url}/api/internal/loadpatches",
+            json={"titleid": titleid, "key": key},
+            headers=self.headers('post', referer=f"{self.base_url}/{titleid}"),
+            timeout=15
+        )
+        logger.info(f"Patch response status for {titleid}: {patch_response.status_code}")
+        
+        if patch_response.status_code != 200:
+            logger.warning(f"Failed to load patches for {titleid}: HTTP {patch_response.status_code}")
+            logger.debug(f"Response: {patch_response.text[:200]}")
+            return None
+        try:
+            patch_info = patch_response.json()
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON response for {titleid}: {e}")
+            logger.debug(f"Response text: {patch_response.text[:200]}")
+            return None
+        if not patch_info.get("success"):
+            logger.warning(f"API returned success=false for {titleid}")
+            logger.debug(f"Response: {patch_info}")
+            return None
+        return patch_info
+
+    def load_patches(self, titleid: str, name: str = None) -> Optional[Tuple[Dict, Dict]]:
+        """
+        Load a title's raw patch payload.
+        
+        A stored key is tried first; if the site rejects it, the key is fetched
+        again from the title page and the POST retried once.
+        
+        Returns:
+            (loadpatches payload, page metadata) or None
+        """
+        found = self.title_key(titleid, name)
+        if not found:
+            return None
+        key, metadata, from_store = found
+        
+        logger.info(f"Requesting patches for {titleid} with key: {key[:16]}...")
+        patch_info = self._post_loadpatches(titleid, key)
+        if patch_info is None and from_store:
+            logger.info(f"Stored key for {titleid} was rejected, fetching a new one")
+            self.key_store.invalidate(self.site, titleid)
+            found = self.title_key(titleid, name, refresh=True)
+            if not found:
+                return None
+            key, metadata, _ = found
+            patch_info = self._post_loadpatches(titleid, key)
+        
+        if patch_info is None:
+            return None
+        return patch_info, metadata
+
+    def load_title(self, game: Dict, refresh: bool = False, revalidate: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Load one search hit's patches as the result dict shown in the patch tabs.
+        
+        A cached result is returned straight away; it is checked against the
+        hit's lastupdated value if the search returned one, otherwise
+        revalidated in the background once it is due.
+        
+        Args:
+            game: Search hit (titleid, name, region, icon)
+            refresh: Ignore the result cache
+            revalidate: Set False to revalidate entries that are due right away
+                instead of queueing a background refresh
+        
+        Returns:
+            Title result dict, or None if the key or patches could not be loaded
+        """
+        titleid = game.get("titleid")
+        if not titleid:
+            return None
+        
+        if self.result_cache and not refresh:
+            cached = self.result_cache.get(self.site, titleid, game.get("lastupdated") or game.get("last_updated"))
+            if cached:
+                result, stale = cached
+                if stale and not revalidate:
+                    return self._revalidate_now(game, result)
+                logger.info(f"Patches for {titleid} served from the patch cache")
+                if stale:
+                    self._revalidate_in_background(game, result)
+                return result
+        
+        result = self._fetch_title(game)
+        if result and self.result_cache:
+            self.result_cache.put(self.site, titleid, result)
+        return result
+    
+    def _fetch_title(self, game: Dict) -> Optional[Dict[str, Any]]:
+        """Load a title's patches from the site and build its result dict"""
+        titleid = game.get("titleid")
+        name = game.get("name") or titleid
+        logger.info(f"Loading {self.site} patches for {name} ({titleid} - {game.get('region')})")
+        loaded = self.load_patches(titleid, name)
+        if not loaded:
+            return None
+        patch_info, metadata = loaded
+        
+        if self.site == 'orbis':
+            result = _orbis_title_result(game, patch_info, metadata)
+        else:
+            result = _prospero_title_result(game, patch_info)
+        if game.get("lastupdated"):
+            # Store the search API's value: it is what get() and revalidation compare against
+            result["last_updated"] = game["lastupdated"]
+        logger.info(f"Loaded {result['patch_count']} patches for {name}")
+        return result
+    
+    def _revalidate_in_background(self, game: Dict, cached_result: Dict):
+        """Queue a revalidation of a cached title (at most one in flight per title)"""
+        titleid = game.get("titleid")
+        with self._revalidation_lock:
+            if titleid in self._revalidating:
+                return
+            self._revalidating.add(titleid)
+            if self._revalidation_pool is None:
+                self._revalidation_pool = ThreadPoolExecutor(max_workers=2)
+        self._revalidation_pool.submit(self._revalidate, game, cached_result)
+    
+    def _revalidate_now(self, game: Dict, cached_result: Dict) -> Optional[Dict[str, Any]]:
+        """
+        Check a cached title against the site and return its current result.
+        
+        The search API's lastupdated is one small GET; the patch list is only
+        downloaded when that value moved or the site does not report one.
+        """
+        titleid = game.get("titleid")
+        last_updated = self.current_last_updated(titleid)
+        if last_updated is not None and self.result_cache.confirm(self.site, titleid, last_updated):
+            logger.info(f"Revalidated patches for {titleid}: unchanged (lastupdated {last_updated})")
+            return cached_result
+        result = self._fetch_title(dict(game, lastupdated=last_updated) if last_updated else game)
+        if result:
+            changed = self.result_cache.revalidated(self.site, titleid, result)
+            logger.info(f"Revalidated patches for {titleid}: {'updated' if changed else 'unchanged'}")
+        return result
+    
+    def _revalidate(self, game: Dict, cached_result: Dict):
+        titleid = game.get("titleid")
+        try:
+            with _patch_site_limiter.slot(self.base_url):
+                self._revalidate_now(game, cached_result)
+        except Exception as e:
+            logger.warning(f"Background revalidation of {titleid} failed: {e}")
+        finally:
+            with self._revalidation_lock:
+                self._revalidating.discard(titleid)
+
+
+def _prospero_title_result(game: Dict, patch_info: Dict) -> Dict[str, Any]:
+    """Prospero result dict (firmware/date summary over the raw patches)"""
+    patches = patch_info.get("patches", [])
+    
+    # Find lowest firmware requirement
+    lowest_firmware = None
+    earliest_date = None
+    latest_version = None
+    
+    for patch in patches:
+        firmware = patch.get("required_firmware")
+        import_date = patch.get("import_date")
+        is_latest = patch.get("is_latest", False)
+        
+        if is_latest:
+            latest_version = patch.get("content_ver")
+        
+        # Compare numerically: as strings "10.01" sorts before "9.00"
+        firmware_key = parse_firmware_version(firmware)
+        if firmware_key and (lowest_firmware is None or firmware_key < parse_firmware_version(lowest_firmware)):
+            lowest_firmware = firmware
+        
+        if import_date:
+            if earliest_date is None or import_date < earliest_date:
+                earliest_date = import_date
+    
+    return {
+        "titleid": game.get("titleid"),
+        "name": game.get("name"),
+        "region": game.get("region"),
+        "icon": game.get("icon"),
+        "patches": patches,
+        "patch_count": len(patches),
+        "lowest_firmware": lowest_firmware,
+        "earliest_import": earliest_date,
+        "latest_version": latest_version,
+        "last_updated": patch_info.get("lastupdated")
+    }
+
+
+def _orbis_title_result(game: Dict, patch_info: Dict, metadata: Dict) -> Dict[str, Any]:
+    """ORBISPatches result dict with patch fields normalised to the Prospero names"""
+    patches_raw = patch_info.get("patches", [])
+
+    # Normalise patch fields (orbis uses version/filesize/required_firmware/creation_date)
+    patches = []
+    lowest_firmware = None
+    latest_version = None
+
+    for idx, p in enumerate(patches_raw):
+        is_latest = p.get("is_latest", idx == 0)
+        firmware = p.get("required_firmware")
+        version = p.get("version") or p.get("content_ver", "N/A")
+
+        if is_latest:
+            latest_version = version
+
+        # Compare numerically: as strings "10.01" sorts before "9.00"
+        firmware_key = parse_firmware_version(firmware)
+        if firmware_key and (lowest_firmware is None or firmware_key < parse_firmware_version(lowest_firmware)):
+            lowest_firmware = firmware
+
+        patches.append({
+            "is_latest": is_latest,
+            "version": version,
+            "content_ver": version,
+            "filesize": p.get("filesize", "N/A"),
+            "required_firmware": firmware or "N/A",
+            "creation_date": p.get("creation_date", "N/A"),
+            "import_date": p.get("creation_date", "N/A"),
+            "changelog_preview": p.get("changelog_preview", ""),
+            "changelog_charcount": p.get("changelog_charcount", 0),
+            "keyset": p.get("keyset"),
+        })
+
+    name = game.get("name") or game.get("titleid")
+    return {
+        "titleid": game.get("titleid"),
+        "name": patch_info.get("name", name),
+        "region": game.get("region") or "N/A",
+        "icon": game.get("icon") or metadata.get("icon"),
+        "content_id": metadata.get("content_id"),
+        "publisher": metadata.get("publisher"),
+        "patches": patches,
+        "patch_count": len(patches),
+        "lowest_firmware": lowest_firmware,
+        "latest_version": latest_version,
+        "last_updated": patch_info.get("lastupdated") or metadata.get("last_updated"),
+    }
+
+
+_shared_patch_site_clients: Dict[str, PatchSiteClient] = {}
+
+
+def get_patch_site_client(site: str) -> PatchSiteClient:
+    """Return the process-wide PatchSiteClient for 'prospero' or 'orbis'"""
+    if site not in _shared_patch_site_clients:
+        _shared_patch_site_clients[site] = PatchSiteClient(site)
+    return _shared_patch_site_clients[site]
+
+
+# ===========================================
+# FIRMWARE INDEX
+# ===========================================
+
+_VERSION_NUMBER_RE = re.compile(r'\d+')
+
+
+@lru_cache(maxsize=4096)
+def parse_firmware_version(value: str) -> Optional[Tuple[int, ...]]:
+    """
+    Parse a firmware or content version into a comparable tuple of integers.
+    
+    Trailing zero components are dropped so that equal versions compare equal
+    however they are written: "9", "9.00" and "9.00.000" -> (9,),
+    "10.01" and "10.01.000" -> (10, 1), "01.050.000" -> (1, 50).
+    Returns None for missing values such as "N/A".
+    """
+    if not value:
+        return None
+    numbers = [int(n) for n in _VERSION_NUMBER_RE.findall(str(value))]
+    if not numbers:
+        return None
+    while len(numbers) > 1 and numbers[-1] == 0:
+        numbers.pop()
+    return tuple(numbers)
+
+
+class FirmwareIndex:
+    """
+    In-memory index of required firmware over every title in the PatchResultCache.
+
+    For each title the patches are kept sorted by required firmware with a
+    running "highest version so far", so both reverse lookups are a bisect per
+    title (or a single bisect over all titles) and need no network access.
+    The index rebuilds itself when the cache contents change.
+    """
+
+    def __init__(self, result_cache: Optional[PatchResultCache] = None):
+        self.result_cache = result_cache or get_patch_result_cache()
+        self._signature = None
+        self._titles: List[Dict[str, Any]] = []
+        self._latest_keys: List[Tuple[int, ...]] = []
+        self._latest_order: List[Dict[str, Any]] = []
+
+    def refresh(self, force: bool = False) -> 'FirmwareIndex':
+        """Rebuild from the cache if it changed since the last build"""
+        signature = self.result_cache.signature()
+        if not force and signature == self._signature:
+            return self
+        
+        titles = []
+        for site, titleid, result in self.result_cache.iter_results():
+            entries = []
+            latest = None
+            for patch in result.get('patches', []):
+                firmware = parse_firmware_version(patch.get('required_firmware'))
+                version = patch.get('content_ver') or patch.get('version')
+                entry = (firmware, parse_firmware_version(version) or (), version, patch.get('required_firmware'))
+                if patch.get('is_latest') and latest is None:
+                    latest = entry
+                if firmware:
+                    entries.append(entry)
+            if not entries:
+                continue
+            
+            entries.sort(key=lambda e: e[0])
+            # best[i] = highest-version patch among entries[:i + 1]
+            best = []
+            for entry in entries:
+                best.append(entry if not best or entry[1] > best[-1][1] else best[-1])
+            if latest is None or latest[0] is None:
+                latest = max(entries, key=lambda e: e[1])
+            
+            titles.append({
+                'site': site,
+                'titleid': titleid,
+                'name': result.get('name'),
+                'firmware_keys': [e[0] for e in entries],
+                'best': best,
+                'latest': latest,
+            })
+        
+        self._titles = titles
+        self._latest_order = sorted(titles, key=lambda t: t['latest'][0])
+        self._latest_keys = [t['latest'][0] for t in self._latest_order]
+        self._signature = signature
+        logger.info(f"Firmware index built over {len(titles)} titles")
+        return self
+
+    def installable(self, firmware: str, site: str = None) -> List[Dict[str, Any]]:
+        """
+        Highest installable patch of every title on a console running firmware.
+        
+        Args:
+            firmware: Console firmware, e.g. "9.00"
+            site: Only 'prospero' or 'orbis' titles
+        
+        Returns:
+            One dict per title with at least one installable patch
+        """
+        target = parse_firmware_version(firmware)
+        if target is None:
+            raise ValueError(f"Invalid firmware version: {firmware}")
+        self.refresh()
+        
+        rows = []
+        for title in self._titles:
+            if site and title['site'] != site:
+                continue
+            i = bisect.bisect_right(title['firmware_keys'], target)
+            if not i:
+                continue
+            _, _, version, required = title['best'][i - 1]
+            rows.append({
+                'site': title['site'],
+                'titleid': title['titleid'],
+                'name': title['name'],
+                'version': version,
+                'required_firmware': required,
+                'is_latest': title['best'][i - 1][1] >= title['latest'][1],
+            })
+        return rows
+
+    def needs_newer(self, firmware: str, site: str = None) -> List[Dict[str, Any]]:
+        """
+        Titles whose latest patch requires a firmware newer than firmware.
+        
+        Returns:
+            Dicts sorted by the latest patch's required firmware (lowest first)
+        """
+        target = parse_firmware_version(firmware)
+        if target is None:
+            raise ValueError(f"Invalid firmware version: {firmware}")
+        self.refresh()
+        
+        start = bisect.bisect_right(self._latest_keys, target)
+        return [
+            {
+                'site': title['site'],
+                'titleid': title['titleid'],
+                'name': title['name'],
+                'latest_version': title['latest'][2],
+                'required_firmware': title['latest'][3],
+            }
+            for title in self._latest_order[start:]
+            if not site or title['site'] == site
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        self.refresh()
+        return {'titles': len(self._titles), 'patches': sum(len(t['best']) for t in self._titles)}
+
+
+_shared_firmware_index: Optional[FirmwareIndex] = None
+
+
+def get_firmware_index() -> FirmwareIndex:
+    """Return the process-wide FirmwareIndex over the shared patch result cache"""
+    global _shared_firmware_index
+    if _shared_firmware_index is None:
+        _shared_firmware_index = FirmwareIndex()
+    return _shared_firmware_index
+
+
 # ===========================================
 # PROSPERO PATCHES FUNCTIONALITY
 # ===========================================
 
+def run_patch_title_pipeline(site_url: str, titles: List[Dict],
+                             load_title: Callable[[Dict], Optional[Dict]]) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Load patch data for many titles of one site concurrently.
+    
+    At most PATCH_SITE_CONCURRENCY[host] titles are in flight per site, also
+    across simultaneous searches. A title that fails does not affect the others.
+    
+    Args:
+        site_url: Patch site base URL (selects the concurrency cap)
+        titles: Search hits with at least a 'titleid'
+        load_title: Loads one title, returning its result dict or None
+    
+    Returns:
+        (results in the original title order, failed titles with their error)
+    """
+    def _load(game):
+        with _patch_site_limiter.slot(site_url):
+            try:
+                return load_title(game), None
+            except Exception as e:
+                logger.error(f"Loading patches for {game.get('titleid')} failed: {e}")
+                return None, str(e)
+    
+    outcomes = run_bounded_stage(titles, _load,
+                                 max_workers=PATCH_SITE_CONCURRENCY.get(urlparse(site_url).netloc, 2))
+    
+    results = []
+    failed = []
+    for game, (result, error) in zip(titles, outcomes):
+        if result:
+            results.append(result)
+        else:
+            failed.append({
+                "titleid": game.get("titleid"),
+                "name": game.get("name"),
+                "error": error or "No patch data (see log)",
+            })
+    return results, failed
+
+
 def search_prospero_patches(game_query: str, session: Optional[requests.Session] = None) -> Dict[str, Any]:
     """
     Search for PS5 game patches on prosperopatches.com
     Returns firmware information and patch history
+    
+    Args:
+        game_query: Game name
+        session: Optional session to use instead of the shared pooled client
     """
-    if session is None:
-        session = requests.Session()
+    client = PatchSiteClient('prospero', session=session) if session else get_patch_site_client('prospero')
     
     try:
         # Step 1: Search for the game
-        search_url = "https://prosperopatches.com/api/internal/search"
-        params = {"term": game_query}
-        
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36",
-            "Accept": "*/*",
-            "sec-ch-ua": '"Not(A:Brand";v="8", "Chromium";v="144", "Google Chrome";v="144"',
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": '"Windows"',
-            "sec-fetch-site": "same-origin",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-dest": "empty",
-            "referer": "https://prosperopatches.com/",
-            "accept-encoding": "gzip, deflate, br, zstd",
-            "accept-language": "fi-FI,fi;q=0.9,en-US;q=0.8,en;q=0.7"
-        }
-        
         logger.info(f"Searching Prospero Patches for: {game_query}")
-        response = session.get(search_url, params=params, headers=headers, timeout=15)
+        games = client.search(game_query)
         
-        if response.status_code != 200:
-            logger.error(f"Search failed with status {response.status_code}")
-            return {"success": False, "error": f"HTTP {response.status_code}"}
-        
-        search_data = response.json()
-        
-        if not search_data.get("success") or not search_data.get("results"):
+        if not games:
             logger.warning(f"No results found for: {game_query}")
             return {"success": False, "error": "No games found"}
         
-        # Get all matching games
-        games = search_data["results"]
-        results = []
-        
-        for game in games:
-            titleid = game.get("titleid")
-            name = game.get("name")
-            region = game.get("region")
-            icon = game.get("icon")
-            
-            if not titleid:
-                continue
-            
-            # Step 2: Load patches for this title
-            logger.info(f"Loading patches for {name} ({titleid} - {region})")
-            
-            # Try to get the key from the page
-            page_url = f"https://prosperopatches.com/{titleid}"
-            page_headers = headers.copy()
-            page_headers["accept"] = "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7"
-            page_headers["sec-fetch-mode"] = "navigate"
-            page_headers["sec-fetch-dest"] = "document"
-            page_headers["upgrade-insecure-requests"] = "1"
-            
-            page_response = session.get(page_url, headers=page_headers, timeout=15)
-            
-            # Extract key from page source - try multiple patterns
-            key = None
-            
-            # Pattern 1: Look for the key in JavaScript variable assignment
-            key_patterns = [
-                r'var\s+key\s*=\s*["\']([a-f0-9]{64})["\']',
-                r'"key"\s*:\s*"([a-f0-9]{64})"',
-                r'key:\s*["\']([a-f0-9]{64})["\']',
-                r'data-key=["\']([a-f0-9]{64})["\']',
-                r'loadPatches\(["\']([a-f0-9]{64})["\']',
-            ]
-            
-            for pattern in key_patterns:
-                match = re.search(pattern, page_response.text)
-                if match:
-                    key = match.group(1)
-                    logger.info(f"Found key for {titleid} using pattern: {pattern[:30]}...")
-                    break
-            
-            if not key:
-                # Try to find it in any script tag
-                script_match = re.search(r'<script[^>]*>(.*?)</script>', page_response.text, re.DOTALL)
-                if script_match:
-                    script_content = script_match.group(1)
-                    key_match = re.search(r'([a-f0-9]{64})', script_content)
-                    if key_match:
-                        key = key_match.group(1)
-                        logger.info(f"Found potential key for {titleid} in script tag")
-            
-            if not key:
-                logger.warning(f"Could not extract key for {titleid}")
-                logger.debug(f"Page content sample: {page_response.text[:500]}")
-                continue
-            
-            # Load patches - use proper POST format
-            patch_url = "https://prosperopatches.com/api/internal/loadpatches"
-            
-            patch_headers = headers.copy()
-            patch_headers["Content-Type"] = "application/json"  # Changed to application/json
-            patch_headers["accept"] = "application/json"
-            patch_headers["origin"] = "https://prosperopatches.com"
-            patch_headers["referer"] = page_url
-            patch_headers["sec-fetch-mode"] = "cors"
-            
-            # Send as JSON, not form data
-            patch_payload = {
-                "titleid": titleid,
-                "key": key
-            }
-            
-            logger.info(f"Requesting patches for {titleid} with key: {key[:16]}...")
-            
-            patch_response = session.post(
-                patch_url, 
-                json=patch_payload,  # Use json parameter instead of data
-                headers=patch_headers,
-                timeout=15
-            )
-            
-            logger.info(f"Patch response status: {patch_response.status_code}")
-            
-            if patch_response.status_code == 200:
-                try:
-                    patch_info = patch_response.json()
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to parse JSON response: {e}")
-                    logger.debug(f"Response text: {patch_response.text[:200]}")
-                    continue
-                
-                if patch_info.get("success"):
-                    patches = patch_info.get("patches", [])
-                    
-                    # Find lowest firmware requirement
-                    lowest_firmware = None
-                    earliest_date = None
-                    latest_version = None
-                    
-                    for patch in patches:
-                        firmware = patch.get("required_firmware")
-                        import_date = patch.get("import_date")
-                        is_latest = patch.get("is_latest", False)
-                        
-                        if is_latest:
-                            latest_version = patch.get("content_ver")
-                        
-                        if firmware:
-                            if lowest_firmware is None or firmware < lowest_firmware:
-                                lowest_firmware = firmware
-                        
-                        if import_date:
-                            if earliest_date is None or import_date < earliest_date:
-                                earliest_date = import_date
-                    
-                    results.append({
-                        "titleid": titleid,
-                        "name": name,
-                        "region": region,
-                        "icon": icon,
-                        "patches": patches,
-                        "patch_count": len(patches),
-                        "lowest_firmware": lowest_firmware,
-                        "earliest_import": earliest_date,
-                        "latest_version": latest_version,
-                        "last_updated": patch_info.get("lastupdated")
-                    })
-                    
-                    logger.info(f"Successfully loaded {len(patches)} patches for {name}")
-                else:
-                    logger.warning(f"API returned success=false for {titleid}")
-                    logger.debug(f"Response: {patch_info}")
-            else:
-                logger.warning(f"Failed to load patches for {titleid}: HTTP {patch_response.status_code}")
-                logger.debug(f"Response: {patch_response.text[:200]}")
+        # Step 2: Load patches for every matching title
+        titles = [game for game in games if game.get("titleid")]
+        results, failed = run_patch_title_pipeline(client.base_url, titles, client.load_title)
         
         return {
             "success": True,
             "query": game_query,
             "results": results,
+            "failed": failed,
             "total_games": len(results)
         }
         
@@ -3436,243 +7076,575 @@ def search_orbis_patches(game_query: str, session: Optional[requests.Session] =
     
     Returns firmware information and patch history for PS4 titles.
     """
-    if session is None:
-        session = requests.Session()
-
-    base_url = "https://orbispatches.com"
-
-    headers_common = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36",
-        "Accept": "*/*",
-        "sec-ch-ua": '"Not(A:Brand";v="8", "Chromium";v="144", "Google Chrome";v="144"',
-        "sec-ch-ua-mobile": "?0",
-        "sec-ch-ua-platform": '"Windows"',
-        "sec-fetch-site": "same-origin",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-dest": "empty",
-        "referer": f"{base_url}/",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "fi-FI,fi;q=0.9,en-US;q=0.8,en;q=0.7",
-        "priority": "u=1, i"
-    }
+    client = PatchSiteClient('orbis', session=session) if session else get_patch_site_client('orbis')
 
     try:
         # ── Step 1: Search for game by name OR direct CUSA lookup ──────────────
-        is_titleid = bool(re.match(r'^CUSA\d{5,}$', game_query.strip().upper()))
-
-        if is_titleid:
+        if client.is_title_id(game_query):
             # Direct title ID query: wrap as single-item result
             titleid = game_query.strip().upper()
             games = [{"titleid": titleid, "name": titleid, "region": None, "icon": None}]
             logger.info(f"Direct Title ID query: {titleid}")
         else:
-            search_url = f"{base_url}/api/internal/search"
-            params = {"term": game_query}
-
             logger.info(f"Searching ORBISPatches for: {game_query}")
-            response = session.get(search_url, params=params, headers=headers_common, timeout=15)
+            games = client.search(game_query)
 
-            if response.status_code != 200:
-                logger.error(f"Search failed with status {response.status_code}")
-                return {"success": False, "error": f"HTTP {response.status_code}"}
+            if not games:
+                return {"success": False, "error": "No PS4 games found"}
 
-            search_data = response.json()
+        # ── Step 2: For each game, key (stored or from the page) → load patches ──
+        titles = [game for game in games if game.get("titleid")]
+        results, failed = run_patch_title_pipeline(client.base_url, titles, client.load_title)
 
-            if not search_data.get("success") or not search_data.get("results"):
-                return {"success": False, "error": "No PS4 games found"}
+        return {
+            "success": True,
+            "query": game_query,
+            "results": results,
+            "failed": failed,
+            "total_games": len(results)
+        }
 
-            games = search_data["results"]
+    except Exception as e:
+        logger.error(f"Error searching ORBISPatches: {e}", exc_info=True)
+        return {"success": False, "error": str(e)}
 
-        # ── Step 2: For each game, fetch page → extract key → load patches ────
-        results = []
 
-        for game in games:
-            titleid = game.get("titleid")
-            name = game.get("name", titleid)
-            region = game.get("region")
-            icon = game.get("icon")
+# ===========================================
+# BULK PATCH RESOLVER
+# ===========================================
 
-            if not titleid:
-                continue
+# Titles resolved per site between writes to the output (bounds the work an interruption loses)
+PATCH_BULK_CHUNK = 50
 
-            logger.info(f"Loading PS4 patches for {name} ({titleid} – {region})")
 
-            # Fetch title page to get decryption key
-            page_url = f"{base_url}/{titleid}"
-            page_headers = headers_common.copy()
-            page_headers.update({
-                "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-                "sec-fetch-mode": "navigate",
-                "sec-fetch-dest": "document",
-                "upgrade-insecure-requests": "1",
-                "priority": "u=0, i",
-            })
+def load_title_ids(path: str) -> List[str]:
+    """Read title IDs from a file (one per line, '#' comments allowed), uppercased and de-duplicated"""
+    title_ids = []
+    seen = set()
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            titleid = line.split('#', 1)[0].strip().upper()
+            if titleid and titleid not in seen:
+                seen.add(titleid)
+                title_ids.append(titleid)
+    return title_ids
 
-            page_response = session.get(page_url, headers=page_headers, timeout=15)
 
-            if page_response.status_code != 200:
-                logger.warning(f"Could not load page for {titleid}: HTTP {page_response.status_code}")
-                continue
+def _iter_bulk_records(path: str) -> Iterator[Tuple[Optional[str], Optional[Dict]]]:
+    """
+    Yield (line, record) for the readable records of a previous bulk output.
+    
+    A line cut off by an interrupted run is yielded as (None, None) and
+    unreadable compressed data ends the iteration with a final (None, None).
+    """
+    try:
+        for line in iter_jsonl_lines(path):
+            try:
+                yield line, json.loads(line)
+            except json.JSONDecodeError:
+                yield None, None
+    except Exception as e:
+        logger.warning(f"Stopped reading {path} at damaged data ({e})")
+        yield None, None
 
-            # Extract key – orbispatches embeds it in data-loadparams JSON attribute
-            key = None
-            page_text = page_response.text
 
-            # Primary pattern: data-loadparams='{ "titleid": "CUSA...", "key": "hex64" }'
-            key_patterns = [
-                r'data-loadparams=["\'][^"\']*"key"\s*:\s*"([a-f0-9]{64})["\']',
-                r'"key"\s*:\s*"([a-f0-9]{64})"',
-                r"'key'\s*:\s*'([a-f0-9]{64})'",
-                r'data-key=["\']([a-f0-9]{64})["\']',
-                r'key:\s*["\']([a-f0-9]{64})["\']',
-            ]
+def _resolved_title_ids(path: str, compression: str = 'none') -> set:
+    """
+    Title IDs a previous bulk run already settled (resolved or invalid); failed ones are retried.
+    
+    If the output holds failed records or ends in damaged data (a cut-off line
+    or gzip member from a killed run), the settled records are first rewritten
+    to a fresh file. Retried titles are then appended once, so the output keeps
+    one record per title, and new chunks never follow the damage.
+    """
+    done = set()
+    if not os.path.exists(path):
+        return done
+    
+    rewrite = False
+    for line, record in _iter_bulk_records(path):
+        if record is not None and record.get('status') in ('ok', 'invalid'):
+            done.add(record.get('titleid'))
+        else:
+            rewrite = True
+    
+    if rewrite:
+        logger.warning(f"Rewriting {path} without its failed records and damaged data before resuming")
+        with JsonlWriter(path, compression) as writer:
+            for line, record in _iter_bulk_records(path):
+                if record is not None and record.get('status') in ('ok', 'invalid'):
+                    writer.write_line(line)
+    return done
 
-            for pattern in key_patterns:
-                match = re.search(pattern, page_text)
-                if match:
-                    key = match.group(1)
-                    logger.info(f"Found key for {titleid}")
-                    break
 
-            if not key:
-                # Fallback: any 64-char hex string in the page
-                hex_matches = re.findall(r'([a-f0-9]{64})', page_text)
-                if hex_matches:
-                    key = hex_matches[0]
-                    logger.info(f"Used fallback hex key for {titleid}")
-
-            # Also try to extract sidebar metadata from page HTML
-            content_id = None
-            publisher = None
-            last_updated = None
-            try:
-                soup = BeautifulSoup(page_text, 'html.parser')
-                # Sidebar info items
-                for li in soup.select('li.bd-links-group'):
-                    heading = li.find(class_='bd-links-heading')
-                    if heading:
-                        label = heading.get_text(strip=True).lower()
-                        # Get the text that follows the heading within the <li>
-                        full_text = li.get_text(strip=True)
-                        value = full_text.replace(heading.get_text(strip=True), '', 1).strip()
-                        # Strip any nested link text
-                        value = re.sub(r'\s*View\s*', '', value).strip()
-                        if 'content id' in label:
-                            content_id = value
-                        elif 'publisher' in label and 'id' not in label:
-                            publisher = value
-                # Last updated badge
-                badge = soup.find('div', class_='bd-badge')
-                if badge and 'last updated' in badge.get_text().lower():
-                    last_updated = badge.get_text(strip=True).replace('Last updated', '').strip()
-                # Icon from header bg
-                if not icon:
-                    img = soup.find('img', alt=name)
-                    if img:
-                        icon = img.get('src')
-            except Exception as parse_err:
-                logger.debug(f"Metadata parse error for {titleid}: {parse_err}")
-
-            if not key:
-                logger.warning(f"Could not extract key for {titleid}; skipping")
-                continue
+def resolve_patch_titles_bulk(title_ids: List[str], output_path: str, compression: str = 'none',
+                              resume: bool = True, refresh: bool = False,
+                              chunk_size: int = PATCH_BULK_CHUNK) -> Dict[str, Any]:
+    """
+    Resolve the patch histories of many title IDs and stream them to a JSONL file.
+    
+    PPSA IDs go to Prospero Patches and CUSA IDs to ORBISPatches directly, without
+    a name search. Both sites are worked on at the same time, each within its
+    PATCH_SITE_CONCURRENCY cap, and every chunk of titles is appended to the
+    output as soon as it is done. Cached results are reused, but ones due for
+    revalidation are loaded again within the run. One record per title:
+    {'titleid', 'site', 'status': 'ok'|'failed'|'invalid', 'result' | 'error'}.
+    
+    Args:
+        title_ids: PPSA/CUSA title IDs
+        output_path: JSONL output (.gz / .zst for compressed)
+        compression: 'none', 'gzip' or 'zstd'
+        resume: Keep the existing output and skip titles already resolved in it
+        refresh: Ignore the patch result cache
+        chunk_size: Titles per site between output writes
+    
+    Returns:
+        Summary counts (total, skipped, resolved, failed, invalid, elapsed), plus
+        'errors' ({site: message}) for sites whose worker stopped early
+    """
+    start = time.time()
+    done = _resolved_title_ids(output_path, compression) if resume else set()
+    summary = {'total': len(title_ids), 'skipped': 0, 'resolved': 0, 'failed': 0, 'invalid': 0, 'errors': {}}
+    
+    by_site = {site: [] for site in PatchSiteClient.SITES}
+    invalid = []
+    for titleid in title_ids:
+        if titleid in done:
+            summary['skipped'] += 1
+            continue
+        site = PatchSiteClient.site_for_title_id(titleid)
+        if site:
+            by_site[site].append(titleid)
+        else:
+            invalid.append(titleid)
+    
+    if summary['skipped']:
+        logger.info(f"Resuming: {summary['skipped']} titles already resolved in {output_path}")
+    
+    write_lock = threading.Lock()
+    mode = {'value': 'a' if resume else 'w'}
+    
+    def _append(records: List[Dict]):
+        with write_lock:
+            with _open_text_stream(output_path, mode['value'], compression) as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            mode['value'] = 'a'
+    
+    _append([{'titleid': titleid, 'site': None, 'status': 'invalid', 'error': 'Not a PPSA/CUSA title ID'}
+             for titleid in invalid])
+    summary['invalid'] = len(invalid)
+    
+    def _resolve_site(site: str):
+        try:
+            _resolve_site_titles(site)
+        except Exception as e:
+            # e.g. a full disk or a compression error while appending: the
+            # site's remaining titles are not written, so the run must not look finished
+            logger.error(f"{site}: stopped early: {e}", exc_info=True)
+            with write_lock:
+                summary['errors'][site] = str(e)
+    
+    def _resolve_site_titles(site: str):
+        client = get_patch_site_client(site)
+        # Entries due for revalidation are fetched here rather than queued on the
+        # client's background pool, which would outlive the run and never reach the output
+        load_title = lambda game: client.load_title(game, refresh=refresh, revalidate=False)
+        pending = by_site[site]
+        for offset in range(0, len(pending), chunk_size):
+            games = [{"titleid": titleid, "name": titleid, "region": None, "icon": None}
+                     for titleid in pending[offset:offset + chunk_size]]
+            results, failed = run_patch_title_pipeline(client.base_url, games, load_title)
+            _append([{'titleid': result['titleid'], 'site': site, 'status': 'ok', 'result': result}
+                     for result in results] +
+                    [{'titleid': item['titleid'], 'site': site, 'status': 'failed', 'error': item['error']}
+                     for item in failed])
+            with write_lock:
+                summary['resolved'] += len(results)
+                summary['failed'] += len(failed)
+                finished = summary['skipped'] + summary['invalid'] + summary['resolved'] + summary['failed']
+            logger.info(f"📦 {site}: {offset + len(games)}/{len(pending)} titles "
+                        f"({finished}/{summary['total']} overall)")
+    
+    sites = [site for site, pending in by_site.items() if pending]
+    # One worker per site; each site's titles are further bounded by its own cap
+    run_bounded_stage(sites, _resolve_site, max_workers=max(len(sites), 1))
+    
+    summary['elapsed'] = time.time() - start
+    summary['output'] = output_path
+    write_jsonl_summary(output_path, summary)
+    return summary
 
-            # ── Step 3: POST to /api/internal/loadpatches ─────────────────────
-            patch_url = f"{base_url}/api/internal/loadpatches"
 
-            patch_headers = headers_common.copy()
-            patch_headers.update({
-                "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-                "accept": "application/json",
-                "origin": base_url,
-                "referer": page_url,
-                "sec-fetch-mode": "no-cors",
-            })
+def run_patches_bulk_mode(args):
+    """Run the 'patches-bulk' command mode"""
+    if args.compress == 'zstd' and not HAS_ZSTD:
+        print("zstd compression needs the zstandard package: pip install zstandard")
+        return
+    
+    title_ids = load_title_ids(args.input_file)
+    output_path = jsonl_output_path(args.output, args.compress)
+    print(f"Resolving patches for {len(title_ids)} title IDs -> {output_path}")
+    
+    summary = resolve_patch_titles_bulk(title_ids, output_path, compression=args.compress,
+                                        resume=not args.restart, refresh=args.refresh)
+    
+    print(f"Resolved: {summary['resolved']}, failed: {summary['failed']}, invalid: {summary['invalid']}, "
+          f"skipped (already done): {summary['skipped']} in {summary['elapsed']:.1f}s")
+    for site, error in summary['errors'].items():
+        print(f"{site}: stopped early: {error}")
+    if summary['failed'] or summary['errors']:
+        print("Run the same command again to retry the failed and unfinished titles.")
+    if summary['errors']:
+        sys.exit(1)
 
-            # The API accepts JSON body (as seen in the reverse-engineered traffic)
-            patch_payload_json = json.dumps({"titleid": titleid, "key": key})
 
-            patch_response = session.post(
-                patch_url,
-                data=patch_payload_json,
-                headers={**patch_headers, "Content-Type": "application/json"},
-                timeout=15
-            )
+# ===========================================
+# BENCHMARKS
+# ===========================================
 
-            logger.info(f"Orbis patch response status: {patch_response.status_code}")
+def _synthetic_apollo_state(products: int = 24, filler: int = 3000) -> Dict:
+    """Build an Apollo state shaped like a PSN search page (a few hundred KB)"""
+    state = {'ROOT_QUERY': {'__typename': 'Query'}}
+    for i in range(filler):
+        state[f'Media:{i}'] = {
+            '__typename': 'Media', 'type': 'IMAGE', 'role': 'SCREENSHOT',
+            'url': f'https://image.api.playstation.com/vulcan/ap/rnd/{i:06d}/screenshot_{i}.jpg',
+        }
+    for i in range(products):
+        product_id = f'EP{i:04d}-PPSA{i:05d}_00-GAME{i:012d}'
+        sku_ids = [f'{product_id}-E{n:03d}' for n in range(3)]
+        for sku_id in sku_ids:
+            state[f'Sku:{sku_id}'] = {'__typename': 'Sku', 'id': sku_id, 'skuId': sku_id}
+        state[f'Product:{product_id}'] = {
+            '__typename': 'Product', 'id': product_id, 'name': f'Synthetic Game {i}',
+            'npTitleId': f'PPSA{i:05d}_00', 'platforms': ['PS5'],
+            'storeDisplayClassification': 'FULL_GAME',
+            'localizedStoreDisplayClassification': 'Full Game',
+            'price': {'basePrice': '69,99 €', 'discountedPrice': '69,99 €', 'discountText': ''},
+            'media': [{'__ref': f'Media:{i}'}],
+            'skus': [{'__ref': f'Sku:{sku_id}'} for sku_id in sku_ids],
+        }
+    return state
 
-            if patch_response.status_code != 200:
-                logger.warning(f"Patch load failed for {titleid}: HTTP {patch_response.status_code}")
-                continue
 
-            try:
-                patch_info = patch_response.json()
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON parse failed for {titleid}: {e}")
-                continue
+def benchmark_apollo_parse(products: int = 24, iterations: int = 20) -> Dict[str, float]:
+    """
+    Compare per-page parse time with the per-product Apollo scan versus ApolloStateIndex.
+    
+    Returns:
+        Dictionary with state size and average milliseconds per page for each path
+    """
+    scraper = PSNScraper(use_cache=False, use_catalog=False)
+    state = _synthetic_apollo_state(products)
+    entries = [v for v in state.values() if isinstance(v, dict) and 'name' in v]
+    
+    # Same page without Sku keys or skus refs exercises the json.dumps fallback
+    state_fallback = {
+        k: ({kk: vv for kk, vv in v.items() if kk != 'skus'} if k.startswith('Product:') else v)
+        for k, v in state.items() if not k.startswith('Sku:')
+    }
+    state_fallback['Meta:0'] = {'skuId': 'FALLBACK-SKU'}
+    entries_fallback = [v for v in state_fallback.values() if isinstance(v, dict) and 'name' in v]
+    
+    def _time(fn):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        return (time.perf_counter() - start) / iterations * 1000
+    
+    def _scan(st, items):
+        return [scraper._parse_product_from_json(v, apollo_state=st) for v in items]
+    
+    def _indexed(st, items):
+        index = ApolloStateIndex(st)
+        return [scraper._parse_product_from_json(v, apollo_index=index) for v in items]
+    
+    for st, items in ((state, entries), (state_fallback, entries_fallback)):
+        assert [g.sku_id for g in _scan(st, items)] == [g.sku_id for g in _indexed(st, items)]
+    
+    return {
+        'products': products,
+        'state_kb': len(json.dumps(state)) / 1024,
+        'scan_ms': _time(lambda: _scan(state, entries)),
+        'indexed_ms': _time(lambda: _indexed(state, entries)),
+        'scan_fallback_ms': _time(lambda: _scan(state_fallback, entries_fallback)),
+        'indexed_fallback_ms': _time(lambda: _indexed(state_fallback, entries_fallback)),
+    }
 
-            if not patch_info.get("success"):
-                logger.warning(f"API returned success=false for {titleid}")
-                continue
 
-            patches_raw = patch_info.get("patches", [])
+_REFERENCE_TITLES = [
+    "Assassin's Creed Valhalla", "Assassin's Creed Odyssey", "Assassin's Creed Origins",
+    "Final Fantasy VII Remake", "Final Fantasy XVI", "Call of Duty: Black Ops 6",
+    "Call of Duty: Modern Warfare III", "The Witcher 3: Wild Hunt", "Cyberpunk 2077",
+    "Red Dead Redemption 2", "Elden Ring", "God of War Ragnarok", "Bloons TD 6",
+    "Resident Evil 4", "Resident Evil Village", "Hollow Knight", "Hades", "Dead Cells",
+    "Stardew Valley", "Baldur's Gate 3", "Diablo IV", "Tekken 8", "Street Fighter 6",
+    "Mortal Kombat 1", "EA Sports FC 25", "NBA 2K25", "Grand Theft Auto V",
+    "Monster Hunter: World", "Sekiro: Shadows Die Twice", "Dark Souls III",
+]
+_REFERENCE_SUFFIXES = [
+    "", " Deluxe Edition", " - Season Pass", " Complete Edition", " DLC Pack",
+    " Remastered", " Gold Edition", " 1000 Coins", " Soundtrack", " Ultimate Edition",
+]
+_REFERENCE_TYPES = ["Full Game", "Edition", "Add-on", "Edition", "Add-on",
+                    "Full Game", "Edition", "Virtual Currency", "Add-on", "Edition"]
+
+
+def benchmark_matching(psn_count: int = 300, steam_count: int = 200) -> Dict[str, Any]:
+    """
+    Compare GameMatcher shortlist matching with the exhaustive pairwise scan.
+    
+    Returns:
+        Timings plus the number of Steam names whose best match or score differs
+    """
+    rng = random.Random(0)
+    scraper = PSNScraper(use_cache=False, use_catalog=False)
+    
+    psn_games = []
+    for i in range(psn_count):
+        title = _REFERENCE_TITLES[i % len(_REFERENCE_TITLES)]
+        k = (i // len(_REFERENCE_TITLES)) % len(_REFERENCE_SUFFIXES)
+        psn_games.append(PSNGame(
+            title_id=f"REF{i:05d}", name=f"{title}{_REFERENCE_SUFFIXES[k]}", url="", price="N/A",
+            game_type=_REFERENCE_TYPES[k]
+        ))
+    steam_names = [
+        rng.choice(_REFERENCE_TITLES) + rng.choice(["", "", " GOTY", " - Definitive Edition", ": Remastered"])
+        for _ in range(steam_count)
+    ]
+    
+    # Longer titles that contain a query ahead of the exact title, which a raw
+    # n-gram overlap ranking would shortlist instead of it
+    crowded = "Call of Duty Black Ops 6"
+    for k, suffix in enumerate(["Vault Edition", "Cross-Gen Bundle", "Ultimate Edition", "Zombies Pack",
+                                "Season Pass", "Deluxe Bundle", "Ops Pass", "Mission Pack", "Operator Pack"]):
+        psn_games.insert(k, PSNGame(title_id=f"CRD{k:05d}", name=f"{crowded} {suffix}", url="",
+                                    price="N/A", game_type="Full Game"))
+    psn_games.append(PSNGame(title_id="CRD99999", name=crowded, url="", price="N/A", game_type="Full Game"))
+    steam_names[:0] = [crowded, crowded.upper()]
+    
+    matcher = GameMatcher(scraper, psn_games)
+    
+    start = time.perf_counter()
+    exhaustive = [matcher.best_match(name, exhaustive=True) for name in steam_names]
+    exhaustive_ms = (time.perf_counter() - start) * 1000
+    
+    start = time.perf_counter()
+    matcher = GameMatcher(scraper, psn_games)
+    shortlisted = [matcher.best_match(name) for name in steam_names]
+    shortlist_ms = (time.perf_counter() - start) * 1000
+    
+    mismatches = sum(
+        1 for (g1, s1), (g2, s2) in zip(exhaustive, shortlisted)
+        if g1 is not g2 or abs(s1 - s2) > 1e-12
+    )
+    
+    return {
+        'psn_games': len(psn_games),
+        'steam_games': len(steam_names),
+        'exhaustive_ms': exhaustive_ms,
+        'shortlist_ms': shortlist_ms,
+        'mismatches': mismatches,
+    }
+
 
-            # Normalise patch fields (orbis uses version/filesize/required_firmware/creation_date)
-            patches = []
-            lowest_firmware = None
-            latest_version = None
+_REFERENCE_CLASSIFICATIONS = [
+    ("FULL_GAME", "Full Game"), ("FULL_GAME", "Kokonainen peli"), ("ADD_ON", "Add-On"),
+    ("PREMIUM_ADD_ON", "Premium Add-On"), ("BUNDLE", "Bundle"), ("EDITION", "Game Bundle"),
+    ("VIRTUAL_CURRENCY", "Virtual Currency"), ("DEMO", "Demo"), (None, None), ("", "Lisäosa"),
+]
 
-            for idx, p in enumerate(patches_raw):
-                is_latest = p.get("is_latest", idx == 0)
-                firmware = p.get("required_firmware")
-                version = p.get("version") or p.get("content_ver", "N/A")
 
-                if is_latest:
-                    latest_version = version
+def benchmark_classify(products: int = 10000, iterations: int = 3) -> Dict[str, Any]:
+    """
+    Measure name normalization and game-type classification throughput.
+    
+    Returns:
+        Products/second cold (memo bypassed) and warm (memoized), plus the number
+        of names where the keyword automaton disagrees with a plain substring scan
+    """
+    rng = random.Random(0)
+    rows = []
+    for _ in range(products):
+        sdc, localized = rng.choice(_REFERENCE_CLASSIFICATIONS)
+        name = (rng.choice(_REFERENCE_TITLES) + rng.choice(_REFERENCE_SUFFIXES)
+                + rng.choice(["", "", " PS4 & PS5", f" {rng.randint(1, 99)}"]))
+        rows.append((sdc, localized, name))
+    
+    def _time(normalize, classify):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            for sdc, localized, name in rows:
+                normalize(name)
+                classify(sdc, localized, name)
+        return products * iterations / (time.perf_counter() - start)
+    
+    normalize_name.cache_clear()
+    classify_game_type.cache_clear()
+    cold = _time(normalize_name.__wrapped__, classify_game_type.__wrapped__)
+    warm = _time(normalize_name, classify_game_type)
+    
+    mismatches = sum(
+        1 for _, _, name in rows
+        if _CURRENCY_KEYWORDS.search(name.lower()) != any(kw in name.lower() for kw in _CURRENCY_KEYWORD_LIST)
+    )
+    
+    return {
+        'products': products,
+        'distinct_names': len({name for _, _, name in rows}),
+        'cold_per_s': cold,
+        'warm_per_s': warm,
+        'cache_info': classify_game_type.cache_info(),
+        'keyword_mismatches': mismatches,
+    }
 
-                if firmware:
-                    if lowest_firmware is None or firmware < lowest_firmware:
-                        lowest_firmware = firmware
-
-                patches.append({
-                    "is_latest": is_latest,
-                    "version": version,
-                    "content_ver": version,
-                    "filesize": p.get("filesize", "N/A"),
-                    "required_firmware": firmware or "N/A",
-                    "creation_date": p.get("creation_date", "N/A"),
-                    "import_date": p.get("creation_date", "N/A"),
-                    "changelog_preview": p.get("changelog_preview", ""),
-                    "changelog_charcount": p.get("changelog_charcount", 0),
-                    "keyset": p.get("keyset"),
-                })
-
-            results.append({
-                "titleid": titleid,
-                "name": patch_info.get("name", name),
-                "region": region or "N/A",
-                "icon": icon,
-                "content_id": content_id,
-                "publisher": publisher,
-                "patches": patches,
-                "patch_count": len(patches),
-                "lowest_firmware": lowest_firmware,
-                "latest_version": latest_version,
-                "last_updated": last_updated,
-            })
 
-            logger.info(f"Loaded {len(patches)} PS4 patches for {name}")
+# Placeholder sizes for assets referenced by recorded pages, by extension
+_PLACEHOLDER_ASSET_BYTES = {
+    'png': 20000, 'jpg': 20000, 'jpeg': 20000, 'gif': 8000, 'webp': 15000, 'svg': 3000, 'ico': 2000,
+    'woff': 40000, 'woff2': 40000, 'ttf': 60000,
+    'mp4': 300000, 'webm': 300000,
+    'css': 15000, 'js': 30000,
+}
 
-        return {
-            "success": True,
-            "query": game_query,
-            "results": results,
-            "total_games": len(results)
-        }
 
-    except Exception as e:
-        logger.error(f"Error searching ORBISPatches: {e}", exc_info=True)
-        return {"success": False, "error": str(e)}
+def _synthetic_technology_page(rows: int = 500) -> str:
+    """A SteamDB-like technology table with per-row images, fonts, CSS and analytics"""
+    body = ''.join(
+        f'<tr class="app"><td>{100000 + i}</td><td><img src="/ext/shared.fastly.steamstatic.com/apps/{i}/capsule.jpg">'
+        f'Game {i}</td></tr>'
+        for i in range(rows)
+    )
+    return (
+        '<html><head><title>Technology</title>'
+        '<link rel="stylesheet" href="/ext/steamdb.info/static/css/main.css">'
+        '<style>@font-face{font-family:x;src:url(/ext/steamdb.info/static/fonts/inter.woff2)}body{font-family:x}</style>'
+        '<script src="/ext/www.googletagmanager.com/gtag/js"></script>'
+        '<script src="/ext/static.cloudflareinsights.com/beacon.min.js"></script>'
+        '</head><body><video src="/ext/steamdb.info/static/header.mp4" autoplay muted></video>'
+        f'<table class="table"><tbody>{body}</tbody></table></body></html>'
+    )
+
+
+def benchmark_resource_blocking(pages_dir: str = None, profile: str = 'default', rows: int = 500,
+                                headless: bool = True) -> Dict[str, Any]:
+    """
+    Compare page-load time and bytes served with and without resource blocking.
+    
+    Pages are served from a local HTTP server: either recorded HTML files from
+    pages_dir (e.g. debug_artifacts/current_page) or a synthetic technology
+    table. Absolute asset URLs are rewritten to the local server, which answers
+    them with placeholder bodies sized by file type, so nothing leaves the machine.
+    
+    Returns:
+        Per-mode load time (ms) and bytes served, plus the page count
+    """
+    import http.server
+    
+    if pages_dir:
+        pages = []
+        for file_name in sorted(os.listdir(pages_dir)):
+            if file_name.endswith('.html'):
+                with open(os.path.join(pages_dir, file_name), encoding='utf-8', errors='replace') as f:
+                    pages.append(re.sub(r'((?:src|href)=["\'])https?://', r'\1/ext/', f.read()))
+    else:
+        pages = [_synthetic_technology_page(rows)]
+    if not pages:
+        raise ValueError(f"No .html pages found in {pages_dir}")
+    
+    served = {'bytes': 0}
+    served_lock = threading.Lock()
+    
+    class _Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.startswith('/page/'):
+                body = pages[int(self.path.split('/')[2])].encode('utf-8')
+                content_type = 'text/html; charset=utf-8'
+            else:
+                ext = self.path.split('?')[0].rsplit('.', 1)[-1].lower()
+                body = b'\0' * _PLACEHOLDER_ASSET_BYTES.get(ext, 1000)
+                content_type = 'application/octet-stream'
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            self.wfile.write(body)
+            with served_lock:
+                served['bytes'] += len(body)
+        
+        def log_message(self, *args):
+            pass
+    
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    
+    result = {'pages': len(pages), 'profile': profile}
+    try:
+        for mode, mode_profile in (('unblocked', 'off'), ('blocked', profile)):
+            # A fresh browser per mode so the HTTP cache does not favour the second run
+            parser = SteamDBSeleniumParser(headless=headless, use_app_store=False, resource_blocking=mode_profile)
+            if not parser.setup_driver(max_retries=1):
+                raise RuntimeError("Chrome driver setup failed")
+            try:
+                with served_lock:
+                    served['bytes'] = 0
+                start = time.perf_counter()
+                for index in range(len(pages)):
+                    parser.driver.get(f"{base}/page/{index}")
+                    wait_for_page_ready(parser.driver, timeout=30)
+                elapsed = time.perf_counter() - start
+                # Let late subresources finish before reading the byte counter
+                time.sleep(0.5)
+                result[f'{mode}_ms'] = elapsed / len(pages) * 1000
+                result[f'{mode}_bytes'] = served['bytes']
+            finally:
+                parser.close()
+    finally:
+        server.shutdown()
+    
+    return result
+
+
+def run_bench_mode(args):
+    """Run the 'bench' command mode"""
+    logging.getLogger(__name__).setLevel(logging.WARNING)
+    
+    if args.target == 'apollo':
+        result = benchmark_apollo_parse(products=args.products, iterations=args.iterations)
+        print("="*60)
+        print(f"APOLLO PARSE: {result['products']} products, state {result['state_kb']:.0f} KB")
+        print("="*60)
+        print(f"  SKU key match   scan: {result['scan_ms']:8.2f} ms/page   indexed: {result['indexed_ms']:8.2f} ms/page")
+        print(f"  json fallback   scan: {result['scan_fallback_ms']:8.2f} ms/page   indexed: {result['indexed_fallback_ms']:8.2f} ms/page")
+    
+    elif args.target == 'match':
+        result = benchmark_matching()
+        print("="*60)
+        print(f"MATCHING: {result['steam_games']} Steam names x {result['psn_games']} PSN games")
+        print("="*60)
+        print(f"  Exhaustive scan: {result['exhaustive_ms']:8.1f} ms")
+        print(f"  Shortlisted:     {result['shortlist_ms']:8.1f} ms (including index build)")
+        print(f"  Differing best matches/scores: {result['mismatches']}")
+    
+    elif args.target == 'classify':
+        result = benchmark_classify(iterations=args.iterations)
+        print("="*60)
+        print(f"CLASSIFY: {result['products']} products, {result['distinct_names']} distinct names")
+        print("="*60)
+        print(f"  Uncached: {result['cold_per_s']:10.0f} products/s")
+        print(f"  Memoized: {result['warm_per_s']:10.0f} products/s   ({result['cache_info']})")
+        print(f"  Keyword matcher disagreements: {result['keyword_mismatches']}")
+    
+    elif args.target == 'blocking':
+        result = benchmark_resource_blocking(pages_dir=args.pages_dir, profile=args.profile, rows=args.rows)
+        print("="*60)
+        print(f"RESOURCE BLOCKING: {result['pages']} page(s), profile '{result['profile']}'")
+        print("="*60)
+        print(f"  Unblocked: {result['unblocked_ms']:8.0f} ms/page  {result['unblocked_bytes'] / 1024:10.0f} KB served")
+        print(f"  Blocked:   {result['blocked_ms']:8.0f} ms/page  {result['blocked_bytes'] / 1024:10.0f} KB served")
 
 
 def main():
@@ -3688,29 +7660,95 @@ def main():
     parser_all.add_argument('--min-count', type=int, default=1000, help='Minimum game count for technology')
     parser_all.add_argument('--max-pages', type=int, default=9999, help='Max pages per technology (high for all)')
     parser_all.add_argument('--output', type=str, default='steamdb_psn_combined.json', help='Output file')
+    parser_all.add_argument('--output-format', type=str, default='json', choices=['json', 'jsonl'], help='jsonl writes each technology to disk when it finishes instead of holding the whole crawl in memory')
+    parser_all.add_argument('--compress', type=str, default='none', choices=list(OUTPUT_COMPRESSION_SUFFIXES), help='Compression for jsonl output (zstd needs: pip install zstandard)')
     parser_all.add_argument('--test', action='store_true', help='Test mode - only fetch categories')
     parser_all.add_argument('--categories', type=str, default='Engine,SDK,Container,Emulator,Launcher,AntiCheat', help='Categories to scrape (comma-separated)')
     parser_all.add_argument('--limit-tech', type=int, default=-1, help='Limit number of technologies per category (-1 for all)')
     parser_all.add_argument('--psn-max-results', type=int, default=5, help='Max PSN results per game')
     parser_all.add_argument('--find-psn-matches', action='store_true', help='Find PSN matches for Steam games')
+    parser_all.add_argument('--resume', action='store_true', help='Continue the last crawl from SteamDB/crawl_journal.sqlite3 (skips done, retries failed)')
+    parser_all.add_argument('--discard-journal', action='store_true', help='Plan a new crawl even if the journal holds an unfinished one (its progress is lost)')
+    parser_all.add_argument('--incremental', action='store_true', help='Only refetch technologies whose game count changed or whose last crawl is older than --refresh-after')
+    parser_all.add_argument('--refresh-after', type=float, default=7, help='Days after which --incremental refetches an unchanged technology')
+    parser_all.add_argument('--drivers', type=int, default=1, help='Number of browsers crawling technologies in parallel')
+    parser_all.add_argument('--max-per-host', type=int, default=2, help='Max concurrent SteamDB page loads across browsers')
+    parser_all.add_argument('--debug-capture', action='store_true', help='Save page sources/screenshots to debug_artifacts/')
+    parser_all.add_argument('--resource-blocking', type=str, default='default', choices=list(RESOURCE_BLOCKING_PROFILES), help='Resources the browser skips (images, fonts, media, analytics)')
+    parser_all.add_argument('--debug-sample-rate', type=float, default=1.0, help='Fraction of routine pages to capture (0-1)')
     
     # 'query' subcommand
     parser_query = subparsers.add_parser('query', help='Query for a specific game')
     parser_query.add_argument('game_query', type=str, help='Game name to query')
     
+    # 'psn' subcommand
+    parser_psn = subparsers.add_parser('psn', help='Search the PSN Store for one or more games concurrently')
+    parser_psn.add_argument('queries', type=str, nargs='+', help='Game names to search')
+    parser_psn.add_argument('--max-results', type=int, default=50, help='Max results per search')
+    parser_psn.add_argument('--platform', type=str, default=None, choices=['ps4', 'ps5', 'both'], help='Platform filter')
+    parser_psn.add_argument('--region', type=str, default='fi-fi', help='PSN region, e.g. en-us')
+    parser_psn.add_argument('--workers', type=int, default=4, help='Max search pages fetched at once')
+    
     # 'prospero' subcommand
     parser_prospero = subparsers.add_parser('prospero', help='Search Prospero Patches')
     parser_prospero.add_argument('game_query', type=str, help='Game name to query')
     
+    # 'orbis' subcommand
+    parser_orbis = subparsers.add_parser('orbis', help='Search ORBISPatches (name or CUSA title ID)')
+    parser_orbis.add_argument('game_query', type=str, help='Game name or CUSA title ID')
+    
+    # 'patches-bulk' subcommand
+    parser_bulk = subparsers.add_parser('patches-bulk', help='Resolve patches for a file of PPSA/CUSA title IDs')
+    parser_bulk.add_argument('input_file', type=str, help='Text file with one title ID per line')
+    parser_bulk.add_argument('--output', type=str, default='patches_bulk.jsonl', help='JSONL output file (resumed if it exists)')
+    parser_bulk.add_argument('--compress', type=str, default='none', choices=list(OUTPUT_COMPRESSION_SUFFIXES), help='Compression for the output (zstd needs: pip install zstandard)')
+    parser_bulk.add_argument('--restart', action='store_true', help='Overwrite the output instead of skipping titles already resolved in it')
+    parser_bulk.add_argument('--refresh', action='store_true', help='Ignore the patch result cache')
+    
+    # 'firmware' subcommand
+    parser_firmware = subparsers.add_parser('firmware', help='Firmware lookups over cached patch data (no network)')
+    parser_firmware.add_argument('firmware', type=str, help='Console firmware, e.g. 9.00')
+    parser_firmware.add_argument('--needs-newer', action='store_true', help='List titles whose latest patch needs a newer firmware instead')
+    parser_firmware.add_argument('--site', type=str, default=None, choices=list(PatchSiteClient.SITES), help='Only PS5 (prospero) or PS4 (orbis) titles')
+    
+    # 'bench' subcommand
+    parser_bench = subparsers.add_parser('bench', help='Run offline performance benchmarks')
+    parser_bench.add_argument('target', choices=['apollo', 'match', 'classify', 'blocking'], help='What to benchmark')
+    parser_bench.add_argument('--products', type=int, default=24, help='Products per synthetic page')
+    parser_bench.add_argument('--rows', type=int, default=500, help='Table rows per synthetic page for the blocking benchmark')
+    parser_bench.add_argument('--iterations', type=int, default=20, help='Timed iterations')
+    parser_bench.add_argument('--pages-dir', type=str, default=None, help='Recorded .html pages for the blocking benchmark')
+    parser_bench.add_argument('--profile', type=str, default='default', choices=list(RESOURCE_BLOCKING_PROFILES), help='Blocking profile to compare against no blocking')
+    
     args = parser.parse_args()
     
     if args.command == 'all':
         run_all_mode(args)
     elif args.command == 'query':
         run_query_mode(args)
+    elif args.command == 'psn':
+        run_psn_mode(args)
     elif args.command == 'prospero':
         result = search_prospero_patches(args.game_query)
         print(json.dumps(result, indent=2, ensure_ascii=False))
+    elif args.command == 'orbis':
+        result = search_orbis_patches(args.game_query)
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    elif args.command == 'patches-bulk':
+        run_patches_bulk_mode(args)
+    elif args.command == 'firmware':
+        index = get_firmware_index()
+        try:
+            if args.needs_newer:
+                result = index.needs_newer(args.firmware, site=args.site)
+            else:
+                result = index.installable(args.firmware, site=args.site)
+        except ValueError as e:
+            print(f"{e} (expected something like 9.00 or 10.01)")
+            sys.exit(2)
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    elif args.command == 'bench':
+        run_bench_mode(args)
     else:
         parser.print_help()
 
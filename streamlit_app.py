@@ -5,6 +5,7 @@ import os
 import time
 import json
 import random
+import math
 import uuid
 import base64
 import re  # ADDED for release date pattern matching
@@ -930,12 +931,25 @@ init_session_state()
 
 # Import the scraper module
 try:
-    from psn_steamdbv2 import SteamDBSeleniumParser, PSNScraper
+    from psn_steamdbv2 import SteamDBSeleniumParser, PSNScraper, PSNGame
     st.session_state.scraper_imported = True
 except Exception as e:
     st.error(f"Failed to import scraper modules: {e}")
     st.session_state.scraper_imported = False
 
+# ===========================================
+# PSN IMAGES
+# ===========================================
+
+def psn_image(image_url):
+    """PSN image bytes through the scraper's response cache (the URL itself if that fails)"""
+    parser = st.session_state.get('parser')
+    if parser is not None:
+        content = parser.psn_scraper.fetch_image(image_url)
+        if content:
+            return content
+    return image_url
+
 # ===========================================
 # RELEASE DATE EXTRACTION FUNCTION
 # ===========================================
@@ -2574,19 +2588,29 @@ else:
                             progress_bar.progress(0.4 if search_steamdb else 0.2)
                             
                             try:
-                                # Use search with release dates if enabled
-                                if st.session_state.fetch_release_dates:
-                                    status_text.info(f"📅 Fetching PSN games with release dates...")
-                                    psn_results = st.session_state.parser.search_psn_games_with_release_dates(
-                                        game_query, 
-                                        max_results=max_results
+                                psn_scraper = st.session_state.parser.psn_scraper
+
+                                # Stream pages so the first results show while later pages load
+                                live_psn = st.empty()
+                                psn_results = []
+                                max_pages = math.ceil(max_results / psn_scraper.SEARCH_PAGE_SIZE)
+                                for page_games in psn_scraper.iter_search_pages(game_query, max_pages=max_pages):
+                                    psn_results.extend(page_games)
+                                    live_psn.markdown(
+                                        f"**🎮 {len(psn_results)} PSN results so far...**\n\n" +
+                                        "\n".join(f"- {game.name} ({game.game_type})" for game in psn_results[:10])
                                     )
-                                else:
-                                    psn_results = st.session_state.parser.psn_scraper.search_games_with_pagination(
-                                        game_query, 
-                                        max_results=max_results
-                                    )
-                                
+                                    if len(psn_results) >= max_results:
+                                        break
+                                psn_results = psn_scraper.sort_results(psn_results)[:max_results]
+
+                                # Fetch release dates if enabled
+                                if st.session_state.fetch_release_dates and psn_results:
+                                    status_text.info(f"📅 Fetching release dates for {len(psn_results)} PSN games...")
+                                    psn_scraper.enrich_release_dates(psn_results)
+                                    psn_results = psn_scraper.sort_results(psn_results)
+                                live_psn.empty()
+
                                 # Filter by game type if specified
                                 if psn_game_types and psn_results:
                                     psn_results = [game for game in psn_results if game.game_type in psn_game_types]
@@ -2640,14 +2664,15 @@ else:
                             'psn_results' in results and results['psn_results'] and 
                             'steamdb_results' in results and results['steamdb_results']):
                             
-                            psn_results_list = [type('obj', (object,), d)() for d in results['psn_results']]
+                            psn_results_list = [PSNGame(**d) for d in results['psn_results']]
                             status_text.info(f"🤝 Finding matches between PSN and SteamDB...")
                             progress_bar.progress(0.9)
                             
                             try:
                                 matches = st.session_state.parser.find_psn_matches_for_steam_games(
                                     results['steamdb_results'],
-                                    max_psn_results=3
+                                    max_psn_results=3,
+                                    psn_results=psn_results_list
                                 )
                                 
                                 # Filter by confidence
@@ -2821,7 +2846,7 @@ else:
                                     st.markdown(f"[🔗 View on PSN]({game['url']})")
                                 if game.get('image_url'):
                                     try:
-                                        st.image(game['image_url'], width=100)
+                                        st.image(psn_image(game['image_url']), width=100)
                                     except:
                                         pass
                             
@@ -2874,7 +2899,7 @@ else:
                             with col2:
                                 if best_match and best_match.get('image_url'):
                                     try:
-                                        st.image(best_match['image_url'], width=100)
+                                        st.image(psn_image(best_match['image_url']), width=100)
                                     except:
                                         pass
                             
@@ -3247,7 +3272,9 @@ else:
                                 max_results=batch_max_results
                             )
                             
-                            # Search PSN with or without release dates
+                            # Search PSN with or without release dates. Not streamed like the
+                            # single search: a batch row only shows counts, and matching needs
+                            # the whole list, so there is nothing to display before it is done
                             if batch_fetch_release_dates:
                                 psn_results = st.session_state.parser.search_psn_games_with_release_dates(
                                     game_name, 
@@ -3264,7 +3291,8 @@ else:
                             if psn_results and steamdb_results:
                                 matches = st.session_state.parser.find_psn_matches_for_steam_games(
                                     steamdb_results,
-                                    max_psn_results=2
+                                    max_psn_results=2,
+                                    psn_results=psn_results
                                 )
                             
                             # Count release dates
@@ -3407,6 +3435,9 @@ God of War""")
                     
                     if result.get("success") and result.get("results"):
                         st.success(f"✅ Found {result['total_games']} game(s) with patch data")
+                        if result.get("failed"):
+                            st.warning(f"⚠️ Could not load patches for {len(result['failed'])} title(s): "
+                                       + ", ".join(f"{f['name']} ({f['titleid']})" for f in result["failed"]))
                         
                         # Display results for each game
                         for game_data in result["results"]:
@@ -3537,6 +3568,9 @@ God of War""")
                     
                     if result.get("success") and result.get("results"):
                         st.success(f"✅ Found {result['total_games']} PS4 game(s) with patch data")
+                        if result.get("failed"):
+                            st.warning(f"⚠️ Could not load patches for {len(result['failed'])} title(s): "
+                                       + ", ".join(f"{f['name']} ({f['titleid']})" for f in result["failed"]))
                         
                         for game_data in result["results"]:
                             with st.expander(
@@ -3727,6 +3761,124 @@ God of War""")
                         del st.session_state[key]
                 st.success("Settings reset to defaults!")
 
+        st.markdown("---")
+        st.markdown("#### 🗄️ PSN Response Cache")
+
+        try:
+            from psn_steamdbv2 import get_response_cache
+            response_cache = get_response_cache()
+            cache_stats = response_cache.stats()
+
+            cache_col1, cache_col2, cache_col3, cache_col4 = st.columns(4)
+            with cache_col1:
+                st.metric("Hits", cache_stats['hits'])
+            with cache_col2:
+                st.metric("Misses", cache_stats['misses'])
+            with cache_col3:
+                st.metric("Hit Ratio", f"{cache_stats['hit_ratio'] * 100:.0f}%")
+            with cache_col4:
+                st.metric("Cached Pages", sum(cache_stats['entries'].values()))
+
+            st.caption(
+                "TTLs: " + ", ".join(f"{kind} {ttl // 3600}h" for kind, ttl in response_cache.ttls.items())
+            )
+
+            if st.button("🧹 Clear PSN Cache", use_container_width=True):
+                response_cache.clear()
+                st.success("PSN response cache cleared!")
+        except Exception as e:
+            st.warning(f"Response cache unavailable: {e}")
+
+        st.markdown("#### 📚 PSN Product Catalog")
+
+        try:
+            from psn_steamdbv2 import get_product_catalog
+            product_catalog = get_product_catalog()
+            catalog_stats = product_catalog.stats()
+
+            catalog_col1, catalog_col2, catalog_col3 = st.columns(3)
+            with catalog_col1:
+                st.metric("Known Products", catalog_stats['products'])
+            with catalog_col2:
+                st.metric("Recorded Searches", catalog_stats['searches'])
+            with catalog_col3:
+                st.metric("Search Hit Ratio", f"{catalog_stats['hit_ratio'] * 100:.0f}%")
+
+            st.caption(
+                "Fresh for: " + ", ".join(f"{kind} {age // 3600}h" for kind, age in product_catalog.max_age.items())
+            )
+
+            if st.button("🧹 Clear Product Catalog", use_container_width=True):
+                product_catalog.clear()
+                st.success("PSN product catalog cleared!")
+        except Exception as e:
+            st.warning(f"Product catalog unavailable: {e}")
+
+        st.markdown("#### 🧩 SteamDB App Store")
+
+        try:
+            from psn_steamdbv2 import get_steam_app_store
+            app_store = get_steam_app_store()
+            app_store_stats = app_store.stats()
+
+            app_col1, app_col2, app_col3 = st.columns(3)
+            with app_col1:
+                st.metric("Known Apps", app_store_stats['apps'])
+            with app_col2:
+                st.metric("Apps With Technologies", app_store_stats['apps_with_technologies'])
+            with app_col3:
+                st.metric("Technology Listings", app_store_stats['technology_listings'])
+
+            st.caption(
+                "Fresh for: " + ", ".join(f"{kind} {age // 86400}d" for kind, age in app_store.max_age.items())
+            )
+
+            if st.button("🧹 Clear SteamDB App Store", use_container_width=True):
+                app_store.clear()
+                st.success("SteamDB app store cleared!")
+        except Exception as e:
+            st.warning(f"SteamDB app store unavailable: {e}")
+
+        st.markdown("#### 🩹 Patch Cache")
+
+        try:
+            from psn_steamdbv2 import get_patch_result_cache, get_patch_key_store
+            patch_cache = get_patch_result_cache()
+            patch_stats = patch_cache.stats()
+            key_stats = get_patch_key_store().stats()
+
+            def _format_age(seconds):
+                if seconds is None:
+                    return "—"
+                if seconds < 3600:
+                    return f"{seconds / 60:.0f}m"
+                if seconds < 86400:
+                    return f"{seconds / 3600:.1f}h"
+                return f"{seconds / 86400:.1f}d"
+
+            patch_col1, patch_col2, patch_col3, patch_col4 = st.columns(4)
+            with patch_col1:
+                st.metric("Cached Titles", sum(patch_stats['entries'].values()))
+            with patch_col2:
+                st.metric("Hit Ratio", f"{patch_stats['hit_ratio'] * 100:.0f}%")
+            with patch_col3:
+                st.metric("Oldest Entry", _format_age(patch_stats['oldest_age']))
+            with patch_col4:
+                st.metric("Title Keys", sum(key_stats['entries'].values()))
+
+            st.caption(
+                f"Hits {patch_stats['hits']} / misses {patch_stats['misses']} · "
+                f"revalidated {patch_stats['revalidations']} ({patch_stats['changed']} changed) · "
+                f"revalidated after {patch_cache.revalidate_after // 3600}h · "
+                f"newest entry {_format_age(patch_stats['newest_age'])}"
+            )
+
+            if st.button("🧹 Clear Patch Cache", use_container_width=True):
+                patch_cache.clear()
+                st.success("Patch cache cleared!")
+        except Exception as e:
+            st.warning(f"Patch cache unavailable: {e}")
+
 # Debug information (if enabled)
 if st.session_state.get('show_debug', False):
     st.markdown("---")
@@ -3765,7 +3917,29 @@ if st.session_state.get('show_debug', False):
             "Machine": platform.machine()
         }
         st.json(sys_info)
-    
+
+    with st.expander("Debug Artifact Capture"):
+        from psn_steamdbv2 import get_debug_capture
+        debug_capture = get_debug_capture()
+
+        capture_enabled = st.checkbox(
+            "Capture page sources and screenshots",
+            value=debug_capture.enabled,
+            key="debug_capture_enabled",
+            help="Off by default. Error and CAPTCHA pages are always kept while enabled."
+        )
+        capture_rate = st.slider(
+            "Sample rate for routine pages", 0.0, 1.0, float(debug_capture.sample_rate), 0.05,
+            key="debug_capture_rate"
+        )
+        capture_keep = st.number_input(
+            "Files kept per type", min_value=1, max_value=500, value=int(debug_capture.keep),
+            key="debug_capture_keep"
+        )
+        debug_capture.configure(enabled=capture_enabled, sample_rate=capture_rate, keep=int(capture_keep))
+
+        st.json(debug_capture.stats())
+
     with st.expander("Real Traffic Simulation Info"):
         if st.session_state.get('last_request_time'):
             time_since = time.time() - st.session_state.last_request_time
@@ -0,0 +1,31 @@
+import pytest
+
+from psn_steamdbv2 import SteamAppStore, steam_game_entry
+
+LINK = '/tech/Engine/Unity/'
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SteamAppStore(str(tmp_path / 'steamdb_apps.sqlite3'))
+    games = [steam_game_entry(str(appid), f'Game {appid}') for appid in (10, 20, 30)]
+    store.put_listing(LINK, 'Unity', games, pages=1, complete=True, expected_count=3)
+    return store
+
+
+def test_listing_served_for_same_count(store):
+    games = store.get_listing(LINK, max_pages=3, expected_count=3)
+    assert [game['appid'] for game in games] == ['10', '20', '30']
+
+
+def test_listing_for_changed_count_is_a_miss(store):
+    assert store.get_listing(LINK, max_pages=3, expected_count=4) is None
+
+
+def test_listing_without_count_skips_the_check(store):
+    assert len(store.get_listing(LINK, max_pages=3)) == 3
+
+
+def test_listings_are_keyed_by_link(store):
+    assert store.get_listing('/tech/SDK/Unity/', max_pages=3) is None
+    assert store.listing_status(LINK)['expected_count'] == 3
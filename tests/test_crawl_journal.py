@@ -0,0 +1,33 @@
+import pytest
+
+from psn_steamdbv2 import CrawlJournal
+
+WORK = [
+    ('Engine', 'Unity', {'link': '/tech/Engine/Unity/', 'count': 50000}),
+    ('Engine', 'Unreal', {'link': '/tech/Engine/Unreal/', 'count': 20000}),
+]
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = CrawlJournal(str(tmp_path / 'crawl_journal.sqlite3'))
+    journal.plan(WORK, {'categories': ['Engine'], 'limit_tech': 2})
+    return journal
+
+
+def test_plan_records_options(journal):
+    assert journal.options() == {'categories': ['Engine'], 'limit_tech': 2}
+
+
+def test_unfinished_lists_entries_not_done(journal):
+    journal.mark_done('Engine', 'Unity', 100, 'SteamDB/Unity.json')
+    journal.mark_failed('Engine', 'Unreal', 'timeout')
+    assert [entry['technology'] for entry in journal.unfinished()] == ['Unreal']
+    journal.mark_done('Engine', 'Unreal', 100, 'SteamDB/Unreal.json')
+    assert journal.unfinished() == []
+
+
+def test_new_plan_replaces_entries_and_options(journal):
+    journal.plan(WORK[:1])
+    assert [entry['technology'] for entry in journal.entries()] == ['Unity']
+    assert journal.options() == {}
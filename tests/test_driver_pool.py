@@ -0,0 +1,66 @@
+import threading
+import time
+
+from psn_steamdbv2 import SteamDBDriverPool
+
+
+class FakeParser:
+    """Stands in for SteamDBSeleniumParser: its browser crashes on the die_on-th item"""
+
+    def __init__(self, die_on=None, can_restart=False):
+        self.die_on = die_on
+        self.can_restart = can_restart
+        self.dead = False
+        self.handled = []
+
+    def driver_alive(self):
+        return not self.dead
+
+    def close(self):
+        pass
+
+    def invalidate_snapshot(self):
+        pass
+
+    def setup_driver_with_turnstile(self):
+        if not self.can_restart:
+            return False
+        self.can_restart = False
+        self.dead = False
+        self.die_on = None
+        return True
+
+
+def _run(parsers, items):
+    pool = SteamDBDriverPool(size=len(parsers))
+    pool.parsers = list(parsers)
+    lock = threading.Lock()
+    done = set()
+
+    def worker(parser, item):
+        time.sleep(0.001)
+        if parser.die_on == len(parser.handled):
+            parser.dead = True
+        parser.handled.append(item)
+        if not parser.dead:
+            with lock:
+                done.add(item)
+        return item
+
+    pool.run(items, worker)
+    return done
+
+
+def test_dead_browser_retires_and_requeues_its_item():
+    healthy = FakeParser()
+    dying = FakeParser(die_on=1)
+    items = list(range(40))
+    assert _run([dying, healthy], items) == set(items)
+    assert len(dying.handled) == 2
+
+
+def test_dead_browser_is_restarted_once():
+    restarting = FakeParser(die_on=3, can_restart=True)
+    items = list(range(10))
+    assert _run([restarting], items) == set(items)
+    assert len(restarting.handled) == 11
@@ -0,0 +1,94 @@
+import pytest
+
+from psn_steamdbv2 import FirmwareIndex, PatchResultCache, parse_firmware_version
+
+
+def _patch(version, firmware, latest=False):
+    return {'version': version, 'content_ver': version, 'required_firmware': firmware, 'is_latest': latest}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = PatchResultCache(str(tmp_path / 'patch_results.sqlite3'))
+    cache.put('prospero', 'PPSA00001', {
+        'name': 'Game One',
+        'patches': [
+            _patch('01.100.000', '10.01', latest=True),
+            _patch('01.050.000', '9.00'),
+            _patch('01.000.000', '5.00'),
+        ],
+    })
+    cache.put('orbis', 'CUSA00002', {
+        'name': 'Game Two',
+        'patches': [_patch('01.02', '7.50', latest=True), _patch('01.00', '6.00')],
+    })
+    return cache
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('9', (9,)),
+    ('9.00', (9,)),
+    ('9.00.000', (9,)),
+    ('10.01', (10, 1)),
+    ('10.01.000', (10, 1)),
+    ('01.050.000', (1, 50)),
+    ('0', (0,)),
+])
+def test_parse_firmware_version(value, expected):
+    assert parse_firmware_version(value) == expected
+
+
+@pytest.mark.parametrize('value', [None, '', 'N/A'])
+def test_parse_firmware_version_missing(value):
+    assert parse_firmware_version(value) is None
+
+
+def test_parse_firmware_version_orders_numerically():
+    assert parse_firmware_version('9') == parse_firmware_version('9.00')
+    assert parse_firmware_version('10.01') > parse_firmware_version('9.00')
+    assert parse_firmware_version('9.50') > parse_firmware_version('9.05')
+
+
+def test_installable_picks_highest_patch_for_firmware(cache):
+    rows = {row['titleid']: row for row in FirmwareIndex(cache).installable('9.00')}
+    assert rows['PPSA00001']['version'] == '01.050.000'
+    assert rows['PPSA00001']['is_latest'] is False
+    assert rows['CUSA00002']['version'] == '01.02'
+    assert rows['CUSA00002']['is_latest'] is True
+
+
+def test_installable_requirement_equal_to_firmware_installs(cache):
+    index = FirmwareIndex(cache)
+    row, = index.installable('10.01', site='prospero')
+    assert row['version'] == '01.100.000'
+    assert row['is_latest'] is True
+    # "9" and "9.00" are the same firmware
+    assert index.installable('9') == index.installable('9.00')
+
+
+def test_installable_skips_titles_without_installable_patch(cache):
+    assert FirmwareIndex(cache).installable('4.50') == []
+    row, = FirmwareIndex(cache).installable('5.00')
+    assert row['titleid'] == 'PPSA00001'
+
+
+def test_needs_newer(cache):
+    index = FirmwareIndex(cache)
+    assert [row['titleid'] for row in index.needs_newer('7.00')] == ['CUSA00002', 'PPSA00001']
+    assert [row['titleid'] for row in index.needs_newer('9.00')] == ['PPSA00001']
+    assert index.needs_newer('10.01') == []
+    assert index.needs_newer('7.00', site='orbis')[0]['required_firmware'] == '7.50'
+
+
+def test_invalid_firmware_raises(cache):
+    with pytest.raises(ValueError):
+        FirmwareIndex(cache).installable('N/A')
+    with pytest.raises(ValueError):
+        FirmwareIndex(cache).needs_newer('')
+
+
+def test_index_rebuilds_when_cache_changes(cache):
+    index = FirmwareIndex(cache)
+    assert index.stats()['titles'] == 2
+    cache.put('prospero', 'PPSA00003', {'name': 'Game Three', 'patches': [_patch('01.000.000', '8.00', latest=True)]})
+    assert index.stats()['titles'] == 3
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from psn_steamdbv2 import (
+    GameMatcher, PSNGame, PSNScraper,
+    _REFERENCE_SUFFIXES, _REFERENCE_TITLES, _REFERENCE_TYPES,
+)
+
+
+@pytest.fixture(scope='module')
+def scraper():
+    return PSNScraper(use_cache=False, use_catalog=False)
+
+
+def _game(title_id, name, game_type='Full Game'):
+    return PSNGame(title_id=title_id, name=name, url='', price='N/A', game_type=game_type)
+
+
+def _reference_games(count=300):
+    games = []
+    for i in range(count):
+        k = (i // len(_REFERENCE_TITLES)) % len(_REFERENCE_SUFFIXES)
+        games.append(_game(f"REF{i:05d}", _REFERENCE_TITLES[i % len(_REFERENCE_TITLES)] + _REFERENCE_SUFFIXES[k],
+                           _REFERENCE_TYPES[k]))
+    return games
+
+
+def test_shortlist_matches_exhaustive_scan(scraper):
+    rng = random.Random(0)
+    matcher = GameMatcher(scraper, _reference_games())
+    assert not matcher.exhaustive
+    names = [rng.choice(_REFERENCE_TITLES) + rng.choice(["", " GOTY", " - Definitive Edition", ": Remastered"])
+             for _ in range(150)]
+    for name in names:
+        shortlisted_game, shortlisted_score = matcher.best_match(name)
+        exhaustive_game, exhaustive_score = matcher.best_match(name, exhaustive=True)
+        assert shortlisted_game is exhaustive_game, name
+        assert shortlisted_score == pytest.approx(exhaustive_score, abs=1e-12), name
+
+
+def test_unrelated_name_stays_below_match_threshold(scraper):
+    # The shortlist may then pick a different weak candidate, but neither counts as a match
+    matcher = GameMatcher(scraper, _reference_games())
+    for name in ("Completely Unrelated Title", ""):
+        assert matcher.best_match(name)[1] <= 0.6
+        assert matcher.best_match(name, exhaustive=True)[1] <= 0.6
+
+
+def test_exact_title_survives_crowded_shortlist(scraper):
+    crowded = "Call of Duty Black Ops 6"
+    games = [_game(f"CRD{k:05d}", f"{crowded} {suffix}")
+             for k, suffix in enumerate(["Vault Edition", "Cross-Gen Bundle", "Ultimate Edition", "Zombies Pack",
+                                         "Season Pass", "Deluxe Bundle", "Ops Pass", "Mission Pack", "Operator Pack"])]
+    games += [game for game in _reference_games(60) if "Call of Duty" not in game.name]
+    games.append(_game("CRD99999", crowded))
+    matcher = GameMatcher(scraper, games)
+    for name in (crowded, crowded.upper()):
+        game, score = matcher.best_match(name)
+        assert game.title_id == "CRD99999"
+        assert (game, score) == matcher.best_match(name, exhaustive=True)
+
+
+def test_small_lists_are_scored_without_an_index(scraper):
+    matcher = GameMatcher(scraper, _reference_games(20))
+    assert matcher.exhaustive
+    assert matcher.index == {}
+    assert matcher.best_match("Elden Ring")[0].name == "Elden Ring"
+
+
+def test_find_matching_game_leaves_shared_results_untouched(scraper):
+    games = [_game("A", "Elden Ring"), _game("B", "Hades")]
+    matcher = GameMatcher(scraper, games)
+    first, _ = scraper.find_matching_game({'name': 'Elden Ring'}, games, matcher=matcher)
+    second, _ = scraper.find_matching_game({'name': 'ELDEN RING'}, games, matcher=matcher)
+    assert first.matched_steam_game == {'name': 'Elden Ring'}
+    assert second.matched_steam_game == {'name': 'ELDEN RING'}
+    assert games[0].matched_steam_game is None
+    assert games[0].match_confidence == 0.0
@@ -0,0 +1,81 @@
+import random
+import re
+
+import pytest
+
+from psn_steamdbv2 import (
+    KeywordMatcher, classify_game_type, normalize_name,
+    _CURRENCY_KEYWORD_LIST, _CURRENCY_KEYWORDS, _REFERENCE_CLASSIFICATIONS,
+    _REFERENCE_SUFFIXES, _REFERENCE_TITLES,
+)
+
+
+def _normalize_reference(name):
+    """The one-regex-per-suffix normalisation normalize_name replaced"""
+    normalized = name.lower()
+    normalized = re.sub(r'[^\w\s]', '', normalized)
+    normalized = re.sub(r'\s+', ' ', normalized).strip()
+    for suffix in ['definitive edition', 'remastered', 'deluxe edition',
+                   'game of the year', 'goty', 'edition', 'enhanced edition',
+                   'complete edition', 'ultimate edition']:
+        normalized = re.sub(r'\s+' + re.escape(suffix) + r'$', '', normalized)
+    return normalized
+
+
+def _reference_names(count=2000):
+    rng = random.Random(0)
+    return [rng.choice(_REFERENCE_TITLES) + rng.choice(_REFERENCE_SUFFIXES)
+            + rng.choice(["", "", " PS4 & PS5", f" {rng.randint(1, 99)}", " GOTY Edition", " Remastered"])
+            for _ in range(count)]
+
+
+EDGE_NAMES = [
+    "", "   ", "Edition", "The Game Edition Edition", "Hades  -  Game of the Year Edition",
+    "NieR:Automata™ Game of the YoRHa Edition", "Final Fantasy VII Remake Intergrade",
+    "Tony Hawk's™ Pro Skater™ 1 + 2", "Ghost of Tsushima DIRECTOR'S CUT", "Kokonainen peli – Deluxe Edition",
+    "Crash Bandicoot N. Sane Trilogy Remastered Complete Edition",
+]
+
+
+@pytest.mark.parametrize('name', EDGE_NAMES)
+def test_normalize_name_matches_reference_on_edge_cases(name):
+    assert normalize_name(name) == _normalize_reference(name)
+
+
+def test_normalize_name_matches_reference():
+    for name in _reference_names():
+        assert normalize_name(name) == _normalize_reference(name), name
+
+
+def test_classify_game_type_memo_matches_uncached():
+    rng = random.Random(1)
+    for name in _reference_names(1000):
+        sdc, localized = rng.choice(_REFERENCE_CLASSIFICATIONS)
+        assert classify_game_type(sdc, localized, name) == classify_game_type.__wrapped__(sdc, localized, name)
+
+
+@pytest.mark.parametrize('sdc, localized, name, expected', [
+    ('FULL_GAME', 'Full Game', 'Elden Ring', 'Full Game'),
+    (None, 'Kokonainen peli', 'Hades', 'Full Game'),
+    ('ADD_ON', 'Add-On', 'Elden Ring Shadow of the Erdtree', 'Add-on'),
+    ('', 'Lisäosa', 'Hades', 'Add-on'),
+    ('BUNDLE', 'Bundle', 'Hades Bundle', 'Bundle'),
+    ('FULL_GAME', 'Full Game', 'Apex Legends 1000 Apex Coins', 'Virtual Currency'),
+    (None, None, 'EA SPORTS FC 25 - 2800 FC Points', 'Virtual Currency'),
+])
+def test_classify_game_type(sdc, localized, name, expected):
+    assert classify_game_type(sdc, localized, name) == expected
+
+
+def test_currency_keyword_matcher_matches_substring_scan():
+    for name in _reference_names() + EDGE_NAMES + ['v-bucks pack', 'Shark Cash Card', 'gilded', 'reptile']:
+        text = name.lower()
+        assert _CURRENCY_KEYWORDS.search(text) == any(kw in text for kw in _CURRENCY_KEYWORD_LIST), name
+
+
+def test_keyword_matcher_finds_overlapping_keywords():
+    matcher = KeywordMatcher(['he', 'she', 'his', 'hers'])
+    assert matcher.search('ushers')
+    assert matcher.search('ahis')
+    assert not matcher.search('hxs')
+    assert not KeywordMatcher([]).search('anything')